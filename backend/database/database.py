@@ -50,10 +50,14 @@ def _set_sqlite_pragmas(dbapi_connection, connection_record):
     finally:
         cursor.close()
 
-def init_db():
+def init_db(progress=None) -> dict:
+    """Apply pending migrations (after an online backup) and create missing tables.
+
+    progress(status, remaining, total) is forwarded to the backup, if one is taken.
+    """
     try:
         # Run migrations using the engine
-        migration_result = run_migrations(engine, DATABASE_PATH, dry_run=False)
+        migration_result = run_migrations(engine, DATABASE_PATH, dry_run=False, progress=progress)
         if migration_result.get("applied"):
             logger.info(
                 "Applied schema migrations: %s",
@@ -75,6 +79,7 @@ def init_db():
     Base.metadata.create_all(bind=engine)
     
     # Per-connection PRAGMAs are set via the engine connect hook above.
+    return migration_result
 
 def get_db():
     db = SessionLocal()
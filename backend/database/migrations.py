@@ -1,5 +1,5 @@
 import os
-import shutil
+import sqlite3
 from datetime import datetime, timezone
 
 from sqlalchemy import text
@@ -8,9 +8,33 @@ MIGRATIONS = [
     "0001_jobs_title_column",
     "0002_songs_album_id",
     "0003_restore_song_columns",
+    "0004_jobs_priority_column",
 ]
 
 
+# Online backups copy this many pages per step and pause between steps, so the
+# app's own connections keep reading and writing while a large vault is copied.
+BACKUP_PAGES_PER_STEP = int(os.getenv("LYRICVAULT_BACKUP_PAGES_PER_STEP", "1024"))
+BACKUP_STEP_SLEEP_SECONDS = 0.005
+
+
+def backup_database(database_path: str, backup_path: str, *, progress=None) -> None:
+    """
+    Copy a live SQLite database with the online backup API. Unlike a file copy this
+    includes pages still in the WAL and never observes a half-written transaction.
+    progress(status, remaining, total) is called after each step.
+    """
+    source = sqlite3.connect(database_path)
+    try:
+        target = sqlite3.connect(backup_path)
+        try:
+            source.backup(target, pages=BACKUP_PAGES_PER_STEP, progress=progress, sleep=BACKUP_STEP_SLEEP_SECONDS)
+        finally:
+            target.close()
+    finally:
+        source.close()
+
+
 def _utc_now_suffix() -> str:
     return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 
@@ -87,6 +111,17 @@ def _migration_0003_restore_song_columns(conn) -> bool:
     return changed
 
 
+def _migration_0004_jobs_priority_column(conn) -> bool:
+    inspector = conn.execute(text("PRAGMA table_info(jobs);")).fetchall()
+    if not inspector:
+        return False
+    columns = [col[1] for col in inspector]
+    if "priority" not in columns:
+        conn.execute(text("ALTER TABLE jobs ADD COLUMN priority INTEGER DEFAULT 0;"))
+        return True
+    return False
+
+
 def _apply_migration(conn, version: str) -> bool:
     if version == "0001_jobs_title_column":
         changed = _migration_0001_jobs_title_column(conn)
@@ -109,10 +144,17 @@ def _apply_migration(conn, version: str) -> bool:
             {"version": version, "applied_at": datetime.now(timezone.utc)},
         )
         return changed
+    if version == "0004_jobs_priority_column":
+        changed = _migration_0004_jobs_priority_column(conn)
+        conn.execute(
+            text("INSERT INTO schema_migrations(version, applied_at) VALUES (:version, :applied_at)"),
+            {"version": version, "applied_at": datetime.now(timezone.utc)},
+        )
+        return changed
     raise ValueError(f"Unknown migration version: {version}")
 
 
-def run_migrations(engine, database_path: str, *, dry_run: bool = False) -> dict:
+def run_migrations(engine, database_path: str, *, dry_run: bool = False, progress=None) -> dict:
     with engine.connect() as conn:
         _ensure_migration_table(conn)
         already_applied = _applied_versions(conn)
@@ -127,7 +169,7 @@ def run_migrations(engine, database_path: str, *, dry_run: bool = False) -> dict
     backup_path = None
     if os.path.isfile(database_path):
         backup_path = f"{database_path}.bak.{_utc_now_suffix()}"
-        shutil.copy2(database_path, backup_path)
+        backup_database(database_path, backup_path, progress=progress)
 
     applied: list[str] = []
     with engine.begin() as conn:
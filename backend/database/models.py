@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Boolean, UniqueConstraint
 from sqlalchemy.orm import relationship, DeclarativeBase
 from datetime import datetime, timezone
 
@@ -53,6 +53,7 @@ class Job(Base):
     id = Column(Integer, primary_key=True, index=True)
     type = Column(String, index=True) # ingest_audio | generate_lyrics | maintenance_update_ytdlp
     status = Column(String, default="pending", index=True) # pending | processing | retrying | completed | failed
+    priority = Column(Integer, default=0, index=True) # Higher runs first; background prefetch uses negative values
     title = Column(String, nullable=True) # For UI visibility
     idempotency_key = Column(String, unique=True, index=True) # e.g. URL or Path hash
     
@@ -72,3 +73,21 @@ class Job(Base):
     completed_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+
+class LyricLookup(Base):
+    """Cached provider result for a normalized (artist, title) pair."""
+    __tablename__ = "lyric_lookups"
+    __table_args__ = (UniqueConstraint("artist_key", "title_key", "provider", name="uq_lyric_lookup"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    artist_key = Column(String, nullable=False)
+    title_key = Column(String, nullable=False)
+    provider = Column(String, nullable=False) # syncedlyrics | gemini_research:<model> | gemini_transcription:<model>:<file>
+
+    lyrics = Column(Text, nullable=True) # Raw provider output; NULL for negative results
+    is_synced = Column(Boolean, default=False)
+    failure_reason = Column(String, nullable=True)
+
+    expires_at = Column(DateTime, nullable=True) # NULL = never (positive results)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
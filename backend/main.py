@@ -4,6 +4,7 @@ import sys
 import json
 import time
 import hashlib
+import threading
 from datetime import datetime, timezone
 from contextlib import asynccontextmanager
 from logging.handlers import RotatingFileHandler
@@ -37,34 +38,48 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-from fastapi import FastAPI, Depends, HTTPException, Request
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.encoders import jsonable_encoder
 from fastapi.concurrency import run_in_threadpool
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.responses import StreamingResponse
-from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
+from starlette.requests import HTTPConnection
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 import asyncio
 
 import uvicorn
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from database.database import init_db, get_db
+from database.database import SessionLocal, init_db, get_db
 from database import models
-from services.ingestor import ingestor
-from services.lyricist import lyricist
-from services.gemini_service import gemini_service
+from services.gemini_scheduler import gemini_scheduler
 from services.ytdlp_manager import ytdlp_manager
 from services import settings_service
-from services.worker import worker
-from utils.lrc_validator import validate_lrc
+from services.prefetcher import prefetcher, PREFETCH_JOB_PRIORITY
+from utils.lazy_import import LazyObject
+from utils.readiness import readiness
+from utils.lrc_validator import song_timeline, validate_lrc
 from utils.rate_limiter import TokenBucket
 from utils import event_bus
+from utils.audio_stream import AudioStreamResponse, record_access, resolve_stream_path
+from utils.circuit_breaker import breaker_snapshot
+
+# These modules import google.genai, yt_dlp, bs4 and syncedlyrics and build their
+# singletons at import time. Loading them lazily lets the server answer "/" (the
+# Electron health check) first; lifespan warms them up on a background thread.
+ingestor = LazyObject("services.ingestor", "ingestor")
+lyricist = LazyObject("services.lyricist", "lyricist")
+gemini_service = LazyObject("services.gemini_service", "gemini_service")
+worker = LazyObject("services.worker", "worker")
+LAZY_SERVICES = (gemini_service, lyricist, ingestor, worker)
+LAZY_IMPORTS = os.getenv("LYRICVAULT_LAZY_IMPORTS", "1") == "1"
 
 REQUIRE_AUTH = (os.getenv("LYRICVAULT_REQUIRE_AUTH", "0") == "1") or (not IS_DEV and not IS_TESTING)
 API_TOKEN = (os.getenv("LYRICVAULT_API_TOKEN") or "").strip()
@@ -78,17 +93,76 @@ def _safe_detail(public_message: str, exc: Exception) -> str:
         return f"{public_message}: {exc}"
     return public_message
 
+def _init_database() -> bool:
+    readiness.begin("database")
+    try:
+        def _backup_progress(_status, remaining, total):
+            readiness.update("database", backup_pages_remaining=remaining, backup_pages_total=total)
+
+        result = init_db(progress=_backup_progress)
+    except Exception as e:
+        logger.error(f"Database initialization failed: {e}", exc_info=True)
+        readiness.fail("database", e)
+        return False
+    readiness.done("database", migrations_applied=result.get("applied", []))
+    return True
+
+
+def _warm_up_services(shutdown: threading.Event) -> None:
+    """Import the lazily loaded services, then start the job worker."""
+    readiness.begin("services")
+    for service in LAZY_SERVICES:
+        if shutdown.is_set():
+            return
+        try:
+            service.resolve()
+        except Exception as e:
+            logger.error(f"Failed to load {service!r}: {e}", exc_info=True)
+            readiness.fail("services", e)
+            return
+    readiness.done("services")
+    if not shutdown.is_set():
+        readiness.begin("worker")
+        worker.start()
+        readiness.done("worker")
+
+
+def _startup(shutdown: threading.Event) -> None:
+    if _init_database():
+        _warm_up_services(shutdown)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    init_db()
-    # Pytest uses TestClient(app) which triggers lifespan; don't start background threads in tests.
-    if not IS_TESTING:
-        worker.start()
+    shutdown = threading.Event()
+    startup = None
+    readiness.reset()
+    if IS_TESTING:
+        # Pytest uses TestClient(app) which triggers lifespan; don't start background threads in tests.
+        if not _init_database():
+            raise RuntimeError("Database initialization failed")
+        readiness.skip("services")
+        readiness.skip("worker")
+        readiness.skip("maintenance")
+    elif LAZY_IMPORTS:
+        # Listen right away; migrations (with their online backup), service imports and
+        # the worker follow on a background thread. /health/ready reports progress.
+        readiness.deferred = True
+        startup = threading.Thread(target=_startup, args=(shutdown,), daemon=True, name="Startup")
+        startup.start()
+    else:
+        if not _init_database():
+            raise RuntimeError("Database initialization failed")
+        _warm_up_services(shutdown)
     try:
         yield
     finally:
         if not IS_TESTING:
-            worker.stop()
+            shutdown.set()
+            if startup is not None:
+                startup.join()
+            if worker.loaded:
+                worker.stop()
 
 def resolve_app_version() -> str:
     raw = os.getenv("LYRICVAULT_APP_VERSION") or os.getenv("LYRICVAULT_VERSION")
@@ -121,9 +195,7 @@ app = FastAPI(
 )
 DEFAULT_BACKEND_PORT = 8000
 
-# Mount downloads directory
 os.makedirs(DOWNLOADS_DIR, exist_ok=True)
-app.mount("/stream", StaticFiles(directory=DOWNLOADS_DIR), name="stream")
 
 # CORS Setup
 allowed_origins = [
@@ -153,6 +225,13 @@ if not IS_DEV:
         allowed_hosts.append("testserver")
     app.add_middleware(TrustedHostMiddleware, allowed_hosts=allowed_hosts)
 
+def _database_blocked_detail() -> Optional[str]:
+    """503 detail while a deferred startup has not migrated the database yet, else None."""
+    if not readiness.database_blocked():
+        return None
+    return "Database unavailable" if readiness.status("database") == "failed" else "Starting up"
+
+
 @app.middleware("http")
 async def auth_and_security_headers(request: Request, call_next):
     # Basic request size guard against memory/CPU DoS.
@@ -203,19 +282,83 @@ async def auth_and_security_headers(request: Request, call_next):
             if not _rate_limiter.allow(bucket_key, capacity=capacity, refill_per_sec=refill, cost=1.0):
                 return JSONResponse(status_code=429, content={"detail": "Rate limit exceeded"})
 
+    # Until a deferred startup has migrated the database, only the liveness and
+    # readiness checks are served.
+    blocked = _database_blocked_detail()
+    if blocked and request.url.path != "/" and not request.url.path.startswith("/health/"):
+        return JSONResponse(
+            status_code=503,
+            content={"detail": blocked},
+            headers={"Retry-After": "1"},
+        )
+
     response = await call_next(request)
     response.headers["X-Content-Type-Options"] = "nosniff"
     response.headers["X-Frame-Options"] = "DENY"
     return response
 
 
+@app.api_route("/stream/{path:path}", methods=["GET", "HEAD"], name="stream")
+async def stream_audio(path: str):
+    """Serve cached audio with Range/206 support, strong ETags and last-access tracking."""
+    file_path = resolve_stream_path(DOWNLOADS_DIR, path)
+    if not file_path:
+        raise HTTPException(status_code=404, detail="Not Found")
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
+        raise HTTPException(status_code=404, detail="Not Found")
+    await run_in_threadpool(record_access, file_path)
+    return AudioStreamResponse(file_path, stat_result)
+
+
+def _csv_param(value: Optional[str], name: str, cast=str) -> Optional[frozenset]:
+    if value is None or not value.strip():
+        return None
+    try:
+        return frozenset(cast(part.strip()) for part in value.split(",") if part.strip())
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name}: expected a comma-separated list")
+
+
+def _event_filter(
+    topics: Optional[str],
+    job_id: Optional[str],
+    song_id: Optional[str],
+    types: Optional[str],
+) -> Optional[event_bus.EventFilter]:
+    event_filter = event_bus.EventFilter(
+        topics=_csv_param(topics, "topics"),
+        job_ids=_csv_param(job_id, "job_id", int),
+        song_ids=_csv_param(song_id, "song_id", int),
+        job_types=_csv_param(types, "types"),
+    )
+    return None if event_filter == event_bus.EventFilter() else event_filter
+
+
 @app.get("/events")
-async def events(request: Request):
+async def events(
+    request: Request,
+    topics: Optional[str] = None,
+    job_id: Optional[str] = None,
+    song_id: Optional[str] = None,
+    types: Optional[str] = None,
+):
     """
     Server-Sent Events stream.
+
+    Every event carries an `id:`; a reconnecting client that sends Last-Event-ID gets
+    the events it missed replayed, or a `resync` event when they are no longer buffered.
+    Optional comma-separated filters (topics=job,song&job_id=&song_id=&types=generate_lyrics)
+    are applied server-side, so unrelated events are never queued for this client.
     """
+    event_filter = _event_filter(topics, job_id, song_id, types)
+    try:
+        last_event_id = int(request.headers.get("last-event-id", ""))
+    except ValueError:
+        last_event_id = None
     try:
-        sub = event_bus.subscribe(max_queue=200)
+        sub = event_bus.subscribe(max_queue=200, last_event_id=last_event_id, event_filter=event_filter)
     except Exception:
         return JSONResponse(status_code=503, content={"detail": "Too many SSE subscribers"})
 
@@ -223,12 +366,23 @@ async def events(request: Request):
         # Suggest quick reconnects on transient failures.
         yield "retry: 3000\n\n"
         try:
+            if not sub.replay_complete:
+                resync = json.dumps({"event": "resync", "data": {"reason": "events_expired"}, "ts": time.time()})
+                yield f"id: {sub.resync_id}\ndata: {resync}\n\n"
+            if sub.backlog:
+                event_id, data = event_bus.frame(sub.backlog)
+                sub.backlog = []
+                yield f"id: {event_id}\ndata: {data}\n\n"
             while True:
                 if await request.is_disconnected():
                     break
+                if sub.overflowed and sub.queue.empty():
+                    # Fell behind: end the stream so the client resumes from its last id.
+                    break
                 try:
-                    payload = await asyncio.wait_for(sub.queue.get(), timeout=15.0)
-                    yield f"data: {payload}\n\n"
+                    # One frame per published batch: a single event object or an array of them.
+                    event_id, data = await asyncio.wait_for(sub.queue.get(), timeout=15.0)
+                    yield f"id: {event_id}\ndata: {data}\n\n"
                 except asyncio.TimeoutError:
                     # Keepalive comment to prevent idle proxy buffering.
                     yield ": keepalive\n\n"
@@ -281,12 +435,18 @@ class ModelRequest(BaseModel):
 class ResearchRequest(BaseModel):
     model_id: str = Field(default="gemini-2.0-flash", max_length=128)
     mode: str = Field(default="auto", max_length=32)
+    refresh: bool = True # Manual research asks again; pass false to accept a cached result
 
 
 class LyricsModeRequest(BaseModel):
     strict_lrc: bool
 
 
+class NowPlayingRequest(BaseModel):
+    song_id: int
+    queue: list[int] = Field(default_factory=list, max_length=200)
+
+
 
 def _duration_seconds(value) -> int | None:
     """Normalize duration values to integer seconds for API responses."""
@@ -353,8 +513,13 @@ def _active_lyrics_song_ids(db: Session) -> set[int]:
     return ids
 
 
+def _has_synced_lyrics(song: models.Song) -> bool:
+    # Parsed once per song and lyric version; see utils.lrc_validator.song_timeline.
+    return bool(song.lyrics_synced and song.lyrics and song_timeline(song.id, song.lyrics).is_valid())
+
+
 def _lyrics_status(song: models.Song, processing_song_ids: set[int], strict_lrc: bool) -> str:
-    if song.lyrics_synced and song.lyrics and validate_lrc(song.lyrics):
+    if _has_synced_lyrics(song):
         return "ready"
     if song.id in processing_song_ids:
         return "processing"
@@ -404,11 +569,38 @@ def _audio_status(song: models.Song, active_ingest_urls: set[str]) -> str:
     return "expired"
 
 
-def _stream_url(request: Request, filename: str | None) -> str:
+def _stream_url(request: HTTPConnection, filename: str | None) -> str:
     if not filename:
         return ""
-    url = str(request.url_for("stream", path=filename))
-    return url
+    url = request.url_for("stream", path=filename)
+    if url.scheme in ("ws", "wss"):
+        # Built from a WebSocket connection; audio is still served over HTTP.
+        url = url.replace(scheme="https" if url.scheme == "wss" else "http")
+    return str(url)
+
+
+def _library_entry(
+    request: HTTPConnection,
+    song: models.Song,
+    processing_song_ids: set[int],
+    active_ingest_urls: set[str],
+    strict_lrc: bool,
+) -> dict:
+    status = _audio_status(song, active_ingest_urls)
+    filename = os.path.basename(song.file_path) if status == "cached" and song.file_path else ""
+    return {
+        "id": song.id,
+        "title": song.title,
+        "artist": song.artist.name if song.artist else "Unknown",
+        "status": status,
+        "lyrics_status": _lyrics_status(song, processing_song_ids, strict_lrc),
+        "lyrics_synced": _has_synced_lyrics(song),
+        "stream_url": _stream_url(request, filename),
+        "source_url": song.source_url,
+        "cover_url": song.cover_url,
+        "duration": _duration_seconds(song.duration),
+        "lyrics_source": song.lyrics_source
+    }
 
 
 def _enqueue_ingest_job(
@@ -418,6 +610,7 @@ def _enqueue_ingest_job(
     title: str,
     song_id: int | None = None,
     allow_requeue: bool = False,
+    priority: int = 0,
 ) -> models.Job:
     normalized = normalize_url(url)
     url_hash = hashlib.md5(normalized.encode()).hexdigest()
@@ -430,6 +623,11 @@ def _enqueue_ingest_job(
 
     if existing_job:
         if existing_job.status in ("pending", "processing"):
+            # A user asking for a song that is only being prefetched should jump the queue.
+            if existing_job.status == "pending" and (existing_job.priority or 0) < priority:
+                existing_job.priority = priority
+                db.commit()
+                db.refresh(existing_job)
             return existing_job
         if not allow_requeue:
             return existing_job
@@ -438,6 +636,7 @@ def _enqueue_ingest_job(
         existing_job.type = "ingest_audio"
         existing_job.title = title
         existing_job.status = "pending"
+        existing_job.priority = priority
         existing_job.payload = json.dumps(payload)
         existing_job.result_json = None
         existing_job.progress = 0
@@ -456,6 +655,7 @@ def _enqueue_ingest_job(
         type="ingest_audio",
         title=title,
         status="pending",
+        priority=priority,
         idempotency_key=idempotency_key,
         payload=json.dumps(payload)
     )
@@ -494,6 +694,34 @@ async def ingest_song(request: IngestRequest, db: Session = Depends(get_db)):
         logger.error(f"Ingest failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=_safe_detail("Ingest failed", e))
 
+@app.post("/playback/now-playing")
+def report_now_playing(request: NowPlayingRequest, db: Session = Depends(get_db)):
+    """Record a play and prefetch expired songs that are likely to play next."""
+    if not db.get(models.Song, request.song_id):
+        raise HTTPException(status_code=404, detail="Song not found")
+
+    prefetcher.record_play(request.song_id)
+    prefetched: list[dict] = []
+    for song in prefetcher.plan(db, request.song_id, request.queue):
+        try:
+            job = _enqueue_ingest_job(
+                db,
+                url=song.source_url,
+                title=f"Prefetching: {song.title}",
+                song_id=song.id,
+                allow_requeue=True,
+                priority=PREFETCH_JOB_PRIORITY,
+            )
+        except Exception as e:
+            logger.warning("Prefetch enqueue failed for song %s: %s", song.id, e)
+            continue
+        if job.status not in ("pending", "processing", "retrying"):
+            # Nothing was queued (e.g. an existing job that wasn't requeued); allow a retry.
+            continue
+        prefetcher.record_attempt(song.id)
+        prefetched.append({"song_id": song.id, "job_id": job.id})
+    return {"status": "ok", "prefetching": prefetched}
+
 @app.get("/search")
 def search_music(q: str, platform: str = "youtube", social_sources: str | None = None):
     try:
@@ -527,46 +755,40 @@ async def research_lyrics_manual(song_id: int, request: ResearchRequest, db: Ses
                 "message": "Audio file not found for transcription.",
                 "failure_reason": "source_unavailable",
             }
-        lyrics = await run_in_threadpool(
+        lyrics, failure_reason = await run_in_threadpool(
             lyricist._try_gemini_transcription,
             song.file_path,
             song.title,
             artist_name,
             model_id=request.model_id,
+            refresh=request.refresh,
         )
-        if not lyrics:
-            failure_reason = lyricist._last_gemini_transcription_reason
     elif request.mode == "research":
-        lyrics = await run_in_threadpool(
-            lyricist._try_gemini_research,
+        lyrics, failure_reason = await lyricist._try_gemini_research_async(
             song.title,
             artist_name,
             model_id=request.model_id,
+            refresh=request.refresh,
         )
-        if not lyrics:
-            failure_reason = lyricist._last_gemini_research_reason
     else:
-        lyrics = await run_in_threadpool(
-            lyricist._try_gemini_research,
+        lyrics, failure_reason = await lyricist._try_gemini_research_async(
             song.title,
             artist_name,
             model_id=request.model_id,
+            refresh=request.refresh,
         )
-        if not lyrics:
-            failure_reason = lyricist._last_gemini_research_reason
         if not lyrics and song.file_path and os.path.exists(song.file_path):
-            lyrics = await run_in_threadpool(
+            lyrics, failure_reason = await run_in_threadpool(
                 lyricist._try_gemini_transcription,
                 song.file_path,
                 song.title,
                 artist_name,
                 model_id=request.model_id,
+                refresh=request.refresh,
             )
-            if not lyrics:
-                failure_reason = lyricist._last_gemini_transcription_reason
 
     strict_lrc = settings_service.get_strict_lrc_mode()
-    existing_synced = bool(song.lyrics_synced and song.lyrics and validate_lrc(song.lyrics))
+    existing_synced = _has_synced_lyrics(song)
     is_synced = bool(lyrics and validate_lrc(lyrics))
 
     if lyrics and is_synced:
@@ -640,7 +862,9 @@ async def retry_lyrics(song_id: int, db: Session = Depends(get_db)):
             "song_id": song.id,
             "title": song.title,
             "artist": song.artist.name if song.artist else "Unknown",
-            "file_path": song.file_path
+            "file_path": song.file_path,
+            # Forced retry: don't serve the result that prompted it from the lyric cache.
+            "refresh": True,
         })
     )
     db.add(job)
@@ -662,26 +886,10 @@ def get_library(request: Request, db: Session = Depends(get_db)):
     if changed:
         db.commit()
 
-    response = []
-    for song in songs:
-        status = _audio_status(song, active_ingest_urls)
-        filename = os.path.basename(song.file_path) if status == "cached" and song.file_path else ""
-        stream_url = _stream_url(request, filename)
-        
-        response.append({
-            "id": song.id,
-            "title": song.title,
-            "artist": song.artist.name if song.artist else "Unknown",
-            "status": status,
-            "lyrics_status": _lyrics_status(song, processing_song_ids, strict_lrc),
-            "lyrics_synced": bool(song.lyrics_synced and song.lyrics and validate_lrc(song.lyrics)),
-            "stream_url": stream_url,
-            "source_url": song.source_url,
-            "cover_url": song.cover_url,
-            "duration": _duration_seconds(song.duration),
-            "lyrics_source": song.lyrics_source
-        })
-    return response
+    return [
+        _library_entry(request, song, processing_song_ids, active_ingest_urls, strict_lrc)
+        for song in songs
+    ]
 
 @app.get("/song/{song_id}")
 def get_song(song_id: int, request: Request, db: Session = Depends(get_db)):
@@ -708,7 +916,7 @@ def get_song(song_id: int, request: Request, db: Session = Depends(get_db)):
         "status": status,
         "lyrics_status": _lyrics_status(song, processing_song_ids, strict_lrc),
         "lyrics": song.lyrics,
-        "lyrics_synced": bool(song.lyrics_synced and song.lyrics and validate_lrc(song.lyrics)),
+        "lyrics_synced": _has_synced_lyrics(song),
         "file_path": song.file_path,
         "stream_url": stream_url,
         "source_url": song.source_url,
@@ -717,6 +925,265 @@ def get_song(song_id: int, request: Request, db: Session = Depends(get_db)):
         "lyrics_source": song.lyrics_source
     }
 
+LYRICS_WINDOW_MAX = 50
+
+
+def _synced_timeline(db: Session, song_id: int):
+    song = db.get(models.Song, song_id)
+    if not song:
+        raise HTTPException(status_code=404, detail="Song not found")
+    if not _has_synced_lyrics(song):
+        raise HTTPException(status_code=404, detail="Synced lyrics not available")
+    return song_timeline(song.id, song.lyrics)
+
+
+@app.get("/song/{song_id}/lyrics/at")
+def get_lyrics_at(
+    song_id: int,
+    t: int = Query(..., ge=0, description="Playback position in milliseconds"),
+    window: int = Query(2, ge=0, le=LYRICS_WINDOW_MAX),
+    db: Session = Depends(get_db),
+):
+    """
+    Active line at t plus window lines either side. Clients can wait until
+    next_t before asking again instead of polling on every tick.
+    """
+    timeline = _synced_timeline(db, song_id)
+    index = timeline.index_at(t)
+    start = max(0, index - window)
+    end = min(len(timeline), index + window + 1)
+    return {
+        "song_id": song_id,
+        "t": t,
+        "index": index,
+        "next_t": timeline.times_ms[index + 1] if index + 1 < len(timeline) else None,
+        "lines": [
+            {"index": i, "t": timeline.times_ms[i], "text": timeline.lyric(i)}
+            for i in range(start, end)
+        ],
+    }
+
+
+@app.get("/song/{song_id}/lyrics/timeline")
+def get_lyrics_timeline(
+    song_id: int,
+    format: str = Query("json", pattern="^(json|binary)$"),
+    db: Session = Depends(get_db),
+):
+    """Whole timeline in columnar JSON, or packed binary (utils.lrc_validator.TIMELINE_MAGIC)."""
+    timeline = _synced_timeline(db, song_id)
+    if format == "binary":
+        return Response(content=timeline.pack(), media_type="application/octet-stream")
+    return {
+        "song_id": song_id,
+        "times": timeline.times_ms.tolist(),
+        "lines": [timeline.lyric(i) for i in range(len(timeline))],
+    }
+
+
+def _library_delta(conn: HTTPConnection, db: Session, song_ids: list[int], after_id: int | None) -> dict:
+    """Current library entries for songs named in events plus any added after after_id."""
+    wanted = set(song_ids)
+    songs = db.query(models.Song).filter(models.Song.id.in_(wanted)).all() if wanted else []
+    if after_id is not None:
+        known = {song.id for song in songs}
+        songs += [
+            song for song in db.query(models.Song).filter(models.Song.id > after_id).all()
+            if song.id not in known
+        ]
+    changed = False
+    for song in songs:
+        if _invalidate_missing_file_path(song):
+            changed = True
+    if changed:
+        db.commit()
+
+    processing_song_ids = _active_lyrics_song_ids(db)
+    active_ingest_urls = _active_ingest_urls(db)
+    strict_lrc = settings_service.get_strict_lrc_mode()
+    max_id = db.query(func.max(models.Song.id)).scalar()
+    return {
+        "songs": [
+            _library_entry(conn, song, processing_song_ids, active_ingest_urls, strict_lrc)
+            for song in sorted(songs, key=lambda song: song.id, reverse=True)
+        ],
+        "removed": sorted(wanted - {song.id for song in songs}),
+        "max_id": max_id or 0,
+    }
+
+
+class LibraryDeltaRequest(BaseModel):
+    song_ids: list[int] = Field(default_factory=list, max_length=1000)
+    after_id: int | None = None
+
+
+async def _ws_ingest(conn: WebSocket, db: Session, args: dict):
+    job = await ingest_song(IngestRequest(**args), db)
+    return JobResponse.model_validate(job, from_attributes=True).model_dump()
+
+
+async def _ws_retry_lyrics(conn: WebSocket, db: Session, args: dict):
+    return jsonable_encoder(await retry_lyrics(int(args["song_id"]), db))
+
+
+async def _ws_job(conn: WebSocket, db: Session, args: dict):
+    return jsonable_encoder(await run_in_threadpool(get_job, int(args["job_id"]), db))
+
+
+async def _ws_library_delta(conn: WebSocket, db: Session, args: dict):
+    request = LibraryDeltaRequest(**args)
+    return await run_in_threadpool(_library_delta, conn, db, request.song_ids, request.after_id)
+
+
+WS_COMMANDS = {
+    "ingest": _ws_ingest,
+    "retry_lyrics": _ws_retry_lyrics,
+    "job": _ws_job,
+    "library_delta": _ws_library_delta,
+}
+# Same budgets as the HTTP routes these commands replace.
+WS_COMMAND_RATE_LIMITS = {"ingest": (15, 15 / 60.0)}
+WS_DEFAULT_RATE_LIMIT = (120, 120 / 60.0)
+
+
+def _ws_result(request_id, *, data=None, status: int | None = None, detail: str | None = None) -> dict:
+    if status is None:
+        return {"type": "result", "id": request_id, "ok": True, "data": data}
+    return {"type": "result", "id": request_id, "ok": False, "status": status, "detail": detail}
+
+
+async def _run_ws_command(conn: WebSocket, token: str | None, message) -> dict:
+    if not isinstance(message, dict):
+        return _ws_result(None, status=400, detail="Expected a JSON object")
+    request_id = message.get("id")
+    command = message.get("cmd")
+    handler = WS_COMMANDS.get(command)
+    if handler is None:
+        return _ws_result(request_id, status=400, detail=f"Unknown command: {command}")
+    if REQUIRE_AUTH:
+        capacity, refill = WS_COMMAND_RATE_LIMITS.get(command, WS_DEFAULT_RATE_LIMIT)
+        if not _rate_limiter.allow(f"{token}:WS:{command}", capacity=capacity, refill_per_sec=refill, cost=1.0):
+            return _ws_result(request_id, status=429, detail="Rate limit exceeded")
+    # Same gate as the HTTP middleware: every command touches the database.
+    blocked = _database_blocked_detail()
+    if blocked:
+        return _ws_result(request_id, status=503, detail=blocked)
+
+    args = message.get("args") or {}
+    db = SessionLocal()
+    try:
+        return _ws_result(request_id, data=await handler(conn, db, args))
+    except HTTPException as e:
+        return _ws_result(request_id, status=e.status_code, detail=e.detail)
+    except (ValidationError, KeyError, TypeError, ValueError):
+        return _ws_result(request_id, status=422, detail="Invalid arguments")
+    except Exception as e:
+        logger.error(f"WebSocket command {command} failed: {e}", exc_info=True)
+        return _ws_result(request_id, status=500, detail=_safe_detail("Command failed", e))
+    finally:
+        db.close()
+
+
+WS_SUBPROTOCOL = "lyricvault"
+WS_TOKEN_PROTOCOL_PREFIX = "lyricvault.token."
+
+
+def _ws_token(websocket: WebSocket) -> Optional[str]:
+    """
+    The API token from the X-LyricVault-Token header or, for browsers (which can't set
+    headers on a WebSocket), an offered "lyricvault.token.<token>" subprotocol. Never
+    read from the query string, which ends up in access logs.
+    """
+    token = websocket.headers.get("x-lyricvault-token")
+    if token:
+        return token
+    for protocol in websocket.scope.get("subprotocols") or ():
+        if protocol.startswith(WS_TOKEN_PROTOCOL_PREFIX):
+            return protocol[len(WS_TOKEN_PROTOCOL_PREFIX):]
+    return None
+
+
+@app.websocket("/ws")
+async def websocket_endpoint(
+    websocket: WebSocket,
+    topics: Optional[str] = None,
+    job_id: Optional[str] = None,
+    song_id: Optional[str] = None,
+    types: Optional[str] = None,
+    last_event_id: Optional[int] = None,
+):
+    """
+    Bidirectional alternative to /events. Pushes the same event_bus events as
+    {"type": "events", "id", "data"} frames (same filters and resume semantics, with
+    last_event_id as a query parameter) and answers {"id", "cmd", "args"} commands
+    (ingest, retry_lyrics, job, library_delta) with {"type": "result", "id", "ok", ...}.
+    Authenticate with the X-LyricVault-Token header, or offer the subprotocols
+    ["lyricvault", "lyricvault.token.<token>"]; the server answers with "lyricvault".
+    """
+    # The HTTP middleware does not see WebSocket handshakes; authenticate here.
+    origin = websocket.headers.get("origin")
+    if origin and origin not in allowed_origins:
+        await websocket.close(code=1008)
+        return
+    presented = _ws_token(websocket)
+    if REQUIRE_AUTH and (not API_TOKEN or presented != API_TOKEN):
+        await websocket.close(code=1008)
+        return
+    try:
+        event_filter = _event_filter(topics, job_id, song_id, types)
+        sub = event_bus.subscribe(max_queue=200, last_event_id=last_event_id, event_filter=event_filter)
+    except HTTPException:
+        await websocket.close(code=1008)
+        return
+    except RuntimeError:
+        # Too many subscribers; ask the client to try again later.
+        await websocket.close(code=1013)
+        return
+
+    send_lock = asyncio.Lock()
+
+    async def _send(text: str) -> None:
+        async with send_lock:
+            await websocket.send_text(text)
+
+    async def _pump():
+        try:
+            if not sub.replay_complete:
+                await _send(json.dumps({"type": "resync", "id": sub.resync_id, "reason": "events_expired"}))
+            if sub.backlog:
+                event_id, data = event_bus.frame(sub.backlog)
+                sub.backlog = []
+                await _send(f'{{"type":"events","id":{event_id},"data":{data}}}')
+            while True:
+                if sub.overflowed and sub.queue.empty():
+                    # Fell behind: close so the client resumes from its last id.
+                    await websocket.close(code=1013)
+                    return
+                event_id, data = await sub.queue.get()
+                await _send(f'{{"type":"events","id":{event_id},"data":{data}}}')
+        except Exception:
+            # Connection already gone; the receive loop cleans up.
+            return
+
+    offered = websocket.scope.get("subprotocols") or ()
+    await websocket.accept(subprotocol=WS_SUBPROTOCOL if WS_SUBPROTOCOL in offered else None)
+    pump_task = asyncio.create_task(_pump())
+    try:
+        while True:
+            text = await websocket.receive_text()
+            try:
+                message = json.loads(text)
+            except ValueError:
+                await _send(json.dumps(_ws_result(None, status=400, detail="Invalid JSON")))
+                continue
+            result = await _run_ws_command(websocket, presented, message)
+            await _send(json.dumps(result))
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        pump_task.cancel()
+        event_bus.unsubscribe(sub)
+
 # Settings Endpoints
 @app.get("/settings/gemini-key")
 def get_gemini_key_status():
@@ -827,7 +1294,10 @@ def set_lyrics_mode(request: LyricsModeRequest):
 
 @app.get("/settings/models")
 def get_models():
-    models_list = settings_service.get_available_models()
+    models_list = [
+        {**model, "quota": gemini_scheduler.status(model["id"])}
+        for model in settings_service.get_available_models()
+    ]
     current = settings_service.get_gemini_model()
     return {"models": models_list, "selected": current}
 
@@ -848,6 +1318,12 @@ def get_ytdlp_system_status():
     return status
 
 
+@app.get("/system/lyric-sources")
+def get_lyric_source_health():
+    """Circuit breaker state and latency percentiles per lyric source."""
+    return breaker_snapshot()
+
+
 @app.post("/system/ytdlp/update", status_code=501)
 def trigger_ytdlp_update():
     raise HTTPException(
@@ -859,6 +1335,12 @@ def trigger_ytdlp_update():
 def read_root():
     return {"message": f"LyricVault Backend v{APP_VERSION} is running", "version": APP_VERSION}
 
+@app.get("/health/ready")
+def health_ready():
+    """Startup phases (database, services, worker, maintenance); 503 until the app is ready."""
+    snapshot = readiness.snapshot()
+    return JSONResponse(status_code=200 if snapshot["ready"] else 503, content=snapshot)
+
 def resolve_backend_port() -> int:
     raw = os.getenv("LYRICVAULT_BACKEND_PORT")
     if not raw:
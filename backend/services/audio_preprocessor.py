@@ -0,0 +1,268 @@
+"""
+AudioPreprocessor - Shrinks audio before it is sent for transcription.
+
+Ingest produces 192 kbps stereo MP3, but lyric transcription only needs a
+mono 16 kHz signal. ffmpeg downmixes, resamples and re-encodes to a small
+MP3 (typically 5-10x smaller), which is cached in its own directory
+(APPDATA/LyricVault/transcribe_cache, outside the downloads dir so it never
+counts against the prefetch budget or shows up under /stream) as
+"<name>-<hash>.transcribe.mp3" and reused until the source changes.
+
+Optional silence trimming drops leading/trailing silence. The amount cut
+from the start is recorded in a sidecar ("<derived>.json") so transcribed
+timestamps can be shifted back onto the original audio's timeline.
+
+Long tracks can also be cut into overlapping windows (split_windows) so
+they can be transcribed in parallel and stitched back together.
+
+Any failure (no ffmpeg, unreadable input) falls back to the original file.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+DERIVED_SUFFIX = ".transcribe.mp3"
+_SILENCE_START = re.compile(r"silence_start:\s*(-?[\d.]+)")
+_SILENCE_END = re.compile(r"silence_end:\s*(-?[\d.]+)")
+_DURATION = re.compile(r"Duration:\s*(\d+):(\d{2}):(\d{2}(?:\.\d+)?)")
+
+
+@dataclass(frozen=True)
+class PreparedAudio:
+    path: str
+    # Milliseconds cut from the start; add back to transcribed timestamps.
+    offset_ms: int = 0
+
+
+@dataclass(frozen=True)
+class AudioWindow:
+    path: str
+    start_ms: int
+
+
+def _ffmpeg_executable() -> str | None:
+    # Same discovery as ingest (bundled, dev, WinGet, PATH); imported lazily
+    # because the ingestor pulls in yt-dlp.
+    from .ingestor import FFMPEG_DIR
+    if FFMPEG_DIR:
+        for name in ("ffmpeg.exe", "ffmpeg"):
+            candidate = os.path.join(FFMPEG_DIR, name)
+            if os.path.isfile(candidate):
+                return candidate
+    return shutil.which("ffmpeg")
+
+
+class AudioPreprocessor:
+    def __init__(self, cache_dir: str | None = None):
+        if cache_dir is None:
+            app_data = os.environ.get("APPDATA", os.path.expanduser("~"))
+            cache_dir = os.path.join(app_data, "LyricVault", "transcribe_cache")
+        self.cache_dir = cache_dir
+        self.enabled = os.getenv("LYRICVAULT_TRANSCRIBE_PREPROCESS", "1") == "1"
+        self.trim_silence = os.getenv("LYRICVAULT_TRANSCRIBE_TRIM_SILENCE", "0") == "1"
+        self.sample_rate = 16000
+        self.bitrate = "32k"
+        self.silence_threshold_db = -50
+        self.min_silence_seconds = 0.5
+        self.timeout_seconds = 300
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def derived_path(self, source_path: str) -> str:
+        # The hash keeps same-named sources from different folders apart.
+        absolute = os.path.abspath(source_path)
+        digest = hashlib.sha1(absolute.encode("utf-8")).hexdigest()[:12]
+        stem = os.path.splitext(os.path.basename(absolute))[0]
+        return os.path.join(self.cache_dir, f"{stem}-{digest}{DERIVED_SUFFIX}")
+
+    def _lock_for(self, path: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(os.path.abspath(path), threading.Lock())
+
+    @staticmethod
+    def _source_signature(source_path: str) -> list:
+        st = os.stat(source_path)
+        return [st.st_size, st.st_mtime_ns]
+
+    def _read_cached(self, source_path: str, derived: str) -> PreparedAudio | None:
+        try:
+            with open(derived + ".json", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not os.path.isfile(derived):
+            return None
+        if meta.get("source") != self._source_signature(source_path) or meta.get("trim") != self.trim_silence:
+            return None
+        return PreparedAudio(path=derived, offset_ms=int(meta.get("offset_ms") or 0))
+
+    def _run(self, args: list[str]) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            args,
+            capture_output=True,
+            text=True,
+            errors="replace",
+            timeout=self.timeout_seconds,
+        )
+
+    @staticmethod
+    def _parse_duration(output: str) -> float | None:
+        match = _DURATION.search(output or "")
+        if not match:
+            return None
+        h, m, s = match.groups()
+        return int(h) * 3600 + int(m) * 60 + float(s)
+
+    def probe_duration(self, path: str) -> float | None:
+        """Duration in seconds from ffmpeg's input banner, or None."""
+        ffmpeg = _ffmpeg_executable()
+        if not ffmpeg:
+            return None
+        try:
+            # No output file: ffmpeg prints the input info and exits non-zero.
+            return self._parse_duration(self._run([ffmpeg, "-hide_banner", "-i", path]).stderr)
+        except Exception as e:
+            logger.warning("[Preprocess] Could not probe %s: %s", path, e)
+            return None
+
+    @contextmanager
+    def split_windows(self, path: str, duration: float, window_seconds: float, overlap_seconds: float):
+        """
+        Yield AudioWindows of window_seconds, each starting overlap_seconds
+        before the previous one ends. Files live in a temp dir removed on exit.
+        """
+        ffmpeg = _ffmpeg_executable()
+        if not ffmpeg:
+            raise RuntimeError("ffmpeg not found")
+        step = max(1.0, window_seconds - overlap_seconds)
+        starts = []
+        start = 0.0
+        while True:
+            starts.append(start)
+            if start + window_seconds >= duration:
+                break
+            start += step
+
+        with tempfile.TemporaryDirectory(prefix="lyricvault-windows-") as tmp_dir:
+            windows = []
+            for index, start in enumerate(starts):
+                out_path = os.path.join(tmp_dir, f"window-{index:03d}.mp3")
+                result = self._run([
+                    ffmpeg, "-hide_banner", "-loglevel", "error", "-y",
+                    "-ss", f"{start:.3f}", "-i", path, "-t", f"{window_seconds:.3f}",
+                    "-vn", "-ac", "1", "-ar", str(self.sample_rate),
+                    "-c:a", "libmp3lame", "-b:a", self.bitrate,
+                    out_path,
+                ])
+                if result.returncode != 0 or not os.path.isfile(out_path):
+                    raise RuntimeError((result.stderr or "").strip()[-300:] or f"ffmpeg exited {result.returncode}")
+                windows.append(AudioWindow(path=out_path, start_ms=int(round(start * 1000))))
+            yield windows
+
+    def _detect_trim(self, ffmpeg: str, source_path: str) -> tuple[float, float | None]:
+        """(seconds of leading silence, trailing-silence start or None)."""
+        result = self._run([
+            ffmpeg, "-hide_banner", "-nostats", "-i", source_path,
+            "-af", f"silencedetect=noise={self.silence_threshold_db}dB:d={self.min_silence_seconds}",
+            "-f", "null", "-",
+        ])
+        output = result.stderr or ""
+        starts = [float(v) for v in _SILENCE_START.findall(output)]
+        ends = [float(v) for v in _SILENCE_END.findall(output)]
+        duration = self._parse_duration(output)
+
+        lead = ends[0] if starts and starts[0] <= 0.05 and ends else 0.0
+        tail = None
+        if starts and starts[-1] > lead:
+            # A silence that never ends (or ends at EOF) is trailing silence.
+            if len(ends) < len(starts) or (duration is not None and ends[-1] >= duration - 0.05):
+                tail = starts[-1]
+        return max(0.0, lead), tail
+
+    def prepare(self, source_path: str, status_callback=None) -> PreparedAudio:
+        """Return the compact derivative of source_path (building it if needed), or the source itself."""
+        if not self.enabled or source_path.endswith(DERIVED_SUFFIX):
+            return PreparedAudio(path=source_path)
+
+        derived = self.derived_path(source_path)
+        with self._lock_for(derived):
+            cached = self._read_cached(source_path, derived)
+            if cached:
+                return cached
+
+            ffmpeg = _ffmpeg_executable()
+            if not ffmpeg:
+                logger.info("[Preprocess] ffmpeg not found; sending original audio.")
+                return PreparedAudio(path=source_path)
+
+            if status_callback:
+                status_callback("Optimizing audio for transcription...")
+            tmp_path = derived + ".tmp.mp3"
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                lead, tail = (0.0, None)
+                if self.trim_silence:
+                    lead, tail = self._detect_trim(ffmpeg, source_path)
+
+                args = [ffmpeg, "-hide_banner", "-loglevel", "error", "-y"]
+                if lead > 0:
+                    args += ["-ss", f"{lead:.3f}"]
+                args += ["-i", source_path]
+                if tail is not None:
+                    args += ["-t", f"{max(0.0, tail - lead):.3f}"]
+                args += [
+                    "-vn", "-ac", "1", "-ar", str(self.sample_rate),
+                    "-c:a", "libmp3lame", "-b:a", self.bitrate,
+                    tmp_path,
+                ]
+                result = self._run(args)
+                if result.returncode != 0 or not os.path.isfile(tmp_path):
+                    raise RuntimeError((result.stderr or "").strip()[-300:] or f"ffmpeg exited {result.returncode}")
+                os.replace(tmp_path, derived)
+
+                offset_ms = int(round(lead * 1000))
+                with open(derived + ".json", "w", encoding="utf-8") as f:
+                    json.dump({
+                        "source": self._source_signature(source_path),
+                        "trim": self.trim_silence,
+                        "offset_ms": offset_ms,
+                    }, f)
+            except Exception as e:
+                logger.warning("[Preprocess] Failed for %s: %s; sending original audio.", source_path, e)
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                return PreparedAudio(path=source_path)
+
+            before = os.path.getsize(source_path)
+            after = os.path.getsize(derived)
+            logger.info(
+                "[Preprocess] %s: %.1fMB -> %.1fMB",
+                os.path.basename(source_path),
+                before / (1024 * 1024),
+                after / (1024 * 1024),
+            )
+            return PreparedAudio(path=derived, offset_ms=offset_ms)
+
+    def discard(self, path: str):
+        """Remove cached derivatives for a source (or a derivative's sidecar)."""
+        derived = path if path.endswith(DERIVED_SUFFIX) else self.derived_path(path)
+        for candidate in (derived, derived + ".json"):
+            if candidate != path and os.path.exists(candidate):
+                try:
+                    os.remove(candidate)
+                except OSError as e:
+                    logger.warning("[Preprocess] Failed to remove %s: %s", candidate, e)
+
+
+audio_preprocessor = AudioPreprocessor()
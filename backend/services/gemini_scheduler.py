@@ -0,0 +1,132 @@
+"""
+GeminiScheduler - Paces Gemini requests to each model's published quota.
+
+Limits come from settings_service.AVAILABLE_MODELS ("15 RPM / 1,500 RPD").
+Every request reserves a slot in a shared per-model TokenBucket before it is
+sent, so concurrent jobs queue behind each other instead of racing into 429s:
+- RPM is enforced as a steady one-request-every-60/RPM-seconds pace
+  (burst configurable), which keeps any rolling minute under the limit.
+- RPD is a per-UTC-day counter persisted across restarts.
+
+Callers wait for their slot (reporting the expected wait through the status
+callback) unless the wait exceeds max_wait_seconds, in which case the request
+fails fast as rate-limited without touching the API.
+"""
+
+import asyncio
+import logging
+import os
+import re
+import time
+
+from utils.rate_limiter import TokenBucket
+from .settings_service import get_model_metadata
+
+logger = logging.getLogger(__name__)
+
+# Used for models without metadata (e.g. ids typed into bridge CLI payloads).
+DEFAULT_RPM = 15
+DEFAULT_RPD = 1500
+
+_RATE_LIMIT_PATTERN = re.compile(r"([\d,]+)\s*RPM\s*/\s*([\d,]+)\s*RPD", re.IGNORECASE)
+
+
+class GeminiQuotaExceeded(Exception):
+    """Raised instead of calling the API when the quota wait is too long."""
+
+    def __init__(self, model_id: str, wait_seconds: float):
+        self.model_id = model_id
+        self.wait_seconds = wait_seconds
+        super().__init__(f"Gemini rate limit: {model_id} quota exhausted; next slot in {wait_seconds:.0f}s")
+
+
+def parse_rate_limit(text: str | None) -> tuple[int, int] | None:
+    """'15 RPM / 1,500 RPD' -> (15, 1500)."""
+    match = _RATE_LIMIT_PATTERN.search(text or "")
+    if not match:
+        return None
+    return int(match.group(1).replace(",", "")), int(match.group(2).replace(",", ""))
+
+
+class GeminiScheduler:
+    def __init__(self, state_path: str | None = None):
+        if state_path is None:
+            app_data = os.environ.get("APPDATA", os.path.expanduser("~"))
+            state_dir = os.path.join(app_data, "LyricVault")
+            os.makedirs(state_dir, exist_ok=True)
+            state_path = os.path.join(state_dir, "gemini_quota.json")
+        self.enabled = os.getenv("LYRICVAULT_GEMINI_SCHEDULER_ENABLED", "1") == "1"
+        self.burst = max(1, int(os.getenv("LYRICVAULT_GEMINI_BURST", "1")))
+        self.max_wait_seconds = float(os.getenv("LYRICVAULT_GEMINI_MAX_QUEUE_WAIT_SECONDS", "300"))
+        self._bucket = TokenBucket(state_path=state_path)
+
+    def limits_for(self, model_id: str) -> tuple[int, int]:
+        """(requests per minute, requests per day) for a model."""
+        parsed = parse_rate_limit((get_model_metadata(model_id) or {}).get("rate_limit"))
+        return parsed or (DEFAULT_RPM, DEFAULT_RPD)
+
+    def _bucket_args(self, model_id: str) -> dict:
+        rpm, rpd = self.limits_for(model_id)
+        return {
+            "capacity": min(self.burst, rpm),
+            "refill_per_sec": rpm / 60.0,
+            "daily_limit": rpd,
+        }
+
+    def expected_wait(self, model_id: str) -> float:
+        """Seconds a request for this model issued now would be queued."""
+        if not self.enabled:
+            return 0.0
+        return self._bucket.estimate_wait(model_id, **self._bucket_args(model_id))
+
+    def _reserve(self, model_id: str, status_callback=None) -> float:
+        reserved, wait = self._bucket.reserve(
+            model_id,
+            max_wait=self.max_wait_seconds,
+            **self._bucket_args(model_id),
+        )
+        if not reserved:
+            raise GeminiQuotaExceeded(model_id, wait)
+        if wait > 0:
+            logger.info("[Gemini] Queued %.1fs for %s quota", wait, model_id)
+            if status_callback:
+                status_callback(f"Waiting {wait:.0f}s for Gemini quota...")
+        return wait
+
+    def acquire(self, model_id: str, status_callback=None) -> float:
+        """
+        Block until this request's slot comes up; returns the seconds waited.
+        Raises GeminiQuotaExceeded if the slot is more than max_wait_seconds away.
+        """
+        if not self.enabled:
+            return 0.0
+        wait = self._reserve(model_id, status_callback)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, model_id: str, status_callback=None) -> float:
+        """acquire() for coroutines: waits on the event loop instead of blocking a thread."""
+        if not self.enabled:
+            return 0.0
+        wait = self._reserve(model_id, status_callback)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def note_rate_limited(self, model_id: str):
+        """The API returned 429 despite pacing (shared key?): make the next request wait a full interval."""
+        if self.enabled:
+            self._bucket.drain(model_id)
+
+    def status(self, model_id: str) -> dict:
+        rpm, rpd = self.limits_for(model_id)
+        return {
+            "rpm": rpm,
+            "rpd": rpd,
+            "used_today": int(self._bucket.daily_count(model_id)),
+            "expected_wait_seconds": round(self.expected_wait(model_id), 1),
+        }
+
+
+gemini_scheduler = GeminiScheduler()
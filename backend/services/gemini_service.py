@@ -6,17 +6,41 @@ Uses Google's Gemini API for:
 
 The API key is resolved via the settings service:
   User-configured key (settings.json) → GEMINI_API_KEY env var → disabled
+One client (and connection pool) is kept for the active key and rebuilt only
+when the key changes; validate_key() results are cached per key hash.
 
 Rate limit handling:
   Automatic retry with exponential backoff on 429/ResourceExhausted
-  and transient server errors (500/503).
+  and transient server errors (500/503). When the caller passes its
+  provider circuit breaker, the backoff ladder is abandoned as soon as the
+  breaker opens and each request's timeout follows the breaker's observed
+  latency instead of the SDK default.
+
+  Every request first reserves a slot with gemini_scheduler, which paces
+  calls to the model's RPM/RPD quota, so rate-limit retries no longer
+  sleep blindly: the next attempt simply waits for its scheduled slot.
+
+Async research:
+  research_lyrics_async() uses client.aio so interactive lookups don't hold
+  a worker thread, and hedges slow requests with a duplicate on the stable
+  model once the first has run past the breaker's p95 latency.
 """
 
+import asyncio
+import hashlib
 import os
+import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from google import genai
 from google.genai import types
+from utils.circuit_breaker import OPEN, CircuitBreaker
+from .gemini_scheduler import GeminiQuotaExceeded, gemini_scheduler
+from .gemini_uploads import gemini_uploads
+from .audio_preprocessor import audio_preprocessor
+from utils.lrc_stitch import stitch_chunks
+from utils.lrc_validator import shift_lrc
 from .settings_service import (
     get_gemini_api_key,
     get_gemini_model,
@@ -31,6 +55,25 @@ logger = logging.getLogger(__name__)
 MAX_RETRIES = 3
 BASE_DELAY = 2  # seconds
 
+# Inline requests are capped at 20 MB *after* base64 (+33%), so larger audio
+# goes through the Files API instead.
+INLINE_AUDIO_MAX_BYTES = 14 * 1024 * 1024
+
+# Long tracks are transcribed as overlapping windows in parallel
+# (LYRICVAULT_TRANSCRIBE_CHUNKING=auto|always|off).
+CHUNK_MIN_DURATION_SECONDS = 360
+CHUNK_WINDOW_SECONDS = 120
+CHUNK_OVERLAP_SECONDS = 10
+CHUNK_MAX_WORKERS = 4
+
+# Async research sends a duplicate request to the stable model when the first
+# one outlives the breaker's p95 latency (LYRICVAULT_GEMINI_HEDGE=1|0).
+HEDGE_DEFAULT_AFTER_SECONDS = 15.0
+HEDGE_MIN_SAMPLES = 5
+
+# How often is_available() re-reads settings while no key is configured.
+KEY_RECHECK_SECONDS = 5.0
+
 
 # ── Shared safety settings ────────────────────────────────────────────
 # Song lyrics routinely contain profanity, violence, substance references,
@@ -89,6 +132,27 @@ AUDIO_TRANSCRIPTION_CONFIG = types.GenerateContentConfig(
     safety_settings=_PERMISSIVE_SAFETY,
 )
 
+# Windows are stitched by timestamp, so each one must come back as LRC
+# relative to the start of the clip.
+WINDOW_TRANSCRIPTION_CONFIG = types.GenerateContentConfig(
+    system_instruction=(
+        "You are a professional audio transcription engine. "
+        "Transcribe the sung lyrics in this audio clip verbatim as LRC: "
+        "one lyric line per output line, each starting with a [mm:ss.xx] "
+        "timestamp measured from the start of this clip. "
+        "Do not add section headers or commentary. "
+        "If the clip contains no vocals, respond only with: NO_VOCALS"
+    ),
+    temperature=0.1,
+    top_p=0.9,
+    safety_settings=_PERMISSIVE_SAFETY,
+)
+
+def research_prompt(track_name: str, artist_name: str) -> str:
+    # User query only — system role is in LYRICS_RESEARCH_CONFIG
+    return f'Find the complete published lyrics for "{track_name}" by "{artist_name}".'
+
+
 # Ignore ambient proxy env vars (HTTP_PROXY/HTTPS_PROXY/ALL_PROXY) by default.
 # This keeps Gemini connectivity stable when the shell injects a dead proxy.
 GENAI_HTTP_OPTIONS = types.HttpOptions(
@@ -102,7 +166,13 @@ class GeminiService:
         self.client = None
         self._current_key = None
         self._last_validation_error = None
-        self._last_failure_reason = None
+        self._lock = threading.Lock()
+        # Client built while validating a not-yet-saved key; adopted if that key is saved.
+        self._candidate: tuple[str, genai.Client] | None = None
+        # sha256(key) -> (is_valid, validation_error, expires_at_monotonic)
+        self._validation_cache: dict[str, tuple[bool, str | None, float]] = {}
+        self.validation_ttl_seconds = float(os.getenv("LYRICVAULT_GEMINI_KEY_VALIDATION_TTL_SECONDS", "3600"))
+        self._next_key_check = 0.0
         self._initialize()
 
     @property
@@ -110,59 +180,94 @@ class GeminiService:
         """Get the currently selected model from settings."""
         return get_gemini_model()
 
+    @staticmethod
+    def _build_client(api_key: str) -> genai.Client:
+        return genai.Client(
+            api_key=api_key,
+            http_options=GENAI_HTTP_OPTIONS,
+        )
+
     def _initialize(self):
-        """Initialize or reinitialize the Gemini client with the current key."""
+        """
+        Point the client at the current key. The client (and its connection
+        pool) is only rebuilt when the key actually changes.
+        """
         api_key = get_gemini_api_key()
-        if api_key and api_key != self._current_key:
-            try:
-                self.client = genai.Client(
-                    api_key=api_key,
-                    http_options=GENAI_HTTP_OPTIONS,
-                )
-                self._current_key = api_key
-                logger.info("GeminiService initialized successfully")
-            except Exception as e:
-                logger.error("GeminiService init error: %s", e, exc_info=True)
+        with self._lock:
+            self._next_key_check = time.monotonic() + KEY_RECHECK_SECONDS
+            if api_key and api_key != self._current_key:
+                try:
+                    candidate = self._candidate
+                    if candidate and candidate[0] == api_key:
+                        self.client = candidate[1]
+                    else:
+                        self.client = self._build_client(api_key)
+                    self._current_key = api_key
+                    logger.info("GeminiService initialized successfully")
+                except Exception as e:
+                    logger.error("GeminiService init error: %s", e, exc_info=True)
+                    self.client = None
+                    self._current_key = None
+                self._candidate = None
+            elif not api_key:
+                if self._current_key is not None or self.client is not None:
+                    logger.warning("No Gemini API key configured. Gemini features disabled.")
                 self.client = None
                 self._current_key = None
-        elif not api_key:
-            self.client = None
-            self._current_key = None
-            logger.warning("No Gemini API key configured. Gemini features disabled.")
 
     def reload(self):
-        """Reload the client with the latest API key from settings."""
-        self._current_key = None  # Force re-init
+        """Pick up a saved/removed API key; a no-op if the key is unchanged."""
         self._initialize()
 
     def is_available(self) -> bool:
         """Check if Gemini service is configured and available."""
-        if not self.client:
+        if not self.client and time.monotonic() >= self._next_key_check:
             self._initialize()
         return self.client is not None
 
-    def get_last_failure_reason(self) -> str | None:
-        return self._last_failure_reason
+    @staticmethod
+    def _key_hash(api_key: str) -> str:
+        return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+    def _client_for_key(self, api_key: str) -> genai.Client:
+        with self._lock:
+            if api_key == self._current_key and self.client is not None:
+                return self.client
+            candidate = self._candidate
+            if candidate and candidate[0] == api_key:
+                return candidate[1]
+            client = self._build_client(api_key)
+            self._candidate = (api_key, client)
+            return client
 
     def validate_key(self, api_key: str) -> bool:
         """
         Validate the API key by attempting to generate a small response.
         This confirms the key actually has permission to generate content.
+
+        Definitive answers (works / rejected) are cached per key hash for
+        validation_ttl_seconds, so reopening settings doesn't spend quota.
+        Rate limits and connection errors are never cached.
         """
+        key_hash = self._key_hash(api_key)
+        cached = self._validation_cache.get(key_hash)
+        if cached and cached[2] > time.monotonic():
+            self._last_validation_error = cached[1]
+            return cached[0]
+
         try:
-            test_client = genai.Client(
-                api_key=api_key,
-                http_options=GENAI_HTTP_OPTIONS,
-            )
-            test_client.models.generate_content(
+            self._client_for_key(api_key).models.generate_content(
                 model="gemini-2.0-flash",
                 contents="test"
             )
+            self._last_validation_error = None
+            self._validation_cache[key_hash] = (True, None, time.monotonic() + self.validation_ttl_seconds)
             return True
         except Exception as e:
             error_msg = str(e)
             logger.warning("Gemini key validation failed: %s", error_msg)
-            
+            definitive = True
+
             # Extract clean error message for ClientErrors
             if "401" in error_msg or "API key not valid" in error_msg:
                 self._last_validation_error = "Authentication failed. Please check your API key."
@@ -172,49 +277,108 @@ class GeminiService:
                  self._last_validation_error = "Permission denied. API key may be restricted."
             elif "429" in error_msg or "Resource has been exhausted" in error_msg:
                  self._last_validation_error = "Quota exceeded. Check your billing or wait a moment."
+                 definitive = False
             else:
                 self._last_validation_error = f"Connection failed. ({error_msg[:50]}...)"
-            
+                definitive = False
+
+            if definitive:
+                self._validation_cache[key_hash] = (False, self._last_validation_error, time.monotonic() + self.validation_ttl_seconds)
             return False
 
-    def _call_with_retry(self, call_fn):
+    @staticmethod
+    def _with_timeout(config: types.GenerateContentConfig, breaker: CircuitBreaker | None) -> types.GenerateContentConfig:
+        """Per-request timeout sized from the provider's observed latency."""
+        if breaker is None:
+            return config
+        timeout_ms = int(breaker.timeout() * 1000)
+        return config.model_copy(update={"http_options": types.HttpOptions(timeout=timeout_ms)})
+
+    def _paced_call(self, call_builder, model_name: str, status_callback=None):
+        """Wait for this model's next quota slot, then issue the request."""
+        gemini_scheduler.acquire(model_name, status_callback)
+        try:
+            return call_builder(model_name)
+        except Exception as e:
+            if self._classify_failure_reason(str(e)) == "rate_limited":
+                gemini_scheduler.note_rate_limited(model_name)
+            raise
+
+    async def _paced_call_async(self, call_builder, model_name: str, status_callback=None):
+        """_paced_call for builders that return awaitables (client.aio)."""
+        await gemini_scheduler.acquire_async(model_name, status_callback)
+        try:
+            return await call_builder(model_name)
+        except Exception as e:
+            if self._classify_failure_reason(str(e)) == "rate_limited":
+                gemini_scheduler.note_rate_limited(model_name)
+            raise
+
+    def _retry_delay(self, error: Exception, attempt: int, breaker: CircuitBreaker | None, paced: bool) -> float | None:
+        """Seconds to wait before retrying a failed call, or None to give up."""
+        error_str = str(error).lower()
+        is_rate_limit = (
+            "429" in error_str
+            or "resource exhausted" in error_str
+            or "rate limit" in error_str
+            or "quota" in error_str
+        )
+        is_server_error = (
+            "500" in error_str
+            or "503" in error_str
+            or "internal" in error_str
+            or "unavailable" in error_str
+        )
+        if breaker is not None and breaker.state == OPEN:
+            # Other jobs already tripped the breaker; don't sit out the ladder.
+            logger.warning("[Gemini] %s circuit open; not retrying.", breaker.name)
+            return None
+        if not (is_rate_limit or is_server_error) or attempt >= MAX_RETRIES:
+            return None
+        delay = 0 if (paced and is_rate_limit) else BASE_DELAY * (2 ** attempt)
+        logger.warning(
+            "[Gemini] %s (attempt %s/%s). Retrying in %ss...",
+            "Rate limited" if is_rate_limit else "Server error",
+            attempt + 1,
+            MAX_RETRIES + 1,
+            delay,
+        )
+        return delay
+
+    def _call_with_retry(self, call_fn, breaker: CircuitBreaker | None = None, paced: bool = False):
         """
         Execute a Gemini API call with automatic retry on rate limit
         and transient server errors.  Exponential backoff: 2s, 4s, 8s.
+        Paced calls skip the backoff for rate limits (the scheduler already
+        delays the next attempt). Gives up early if the provider's circuit
+        breaker has opened.
         """
-        last_error = None
         for attempt in range(MAX_RETRIES + 1):
             try:
                 return call_fn()
+            except GeminiQuotaExceeded:
+                # Queue is too long; retrying would only wait again.
+                raise
             except Exception as e:
-                error_str = str(e).lower()
-                is_rate_limit = (
-                    "429" in error_str
-                    or "resource exhausted" in error_str
-                    or "rate limit" in error_str
-                    or "quota" in error_str
-                )
-                is_server_error = (
-                    "500" in error_str
-                    or "503" in error_str
-                    or "internal" in error_str
-                    or "unavailable" in error_str
-                )
-                is_retryable = is_rate_limit or is_server_error
-                last_error = e
-                if is_retryable and attempt < MAX_RETRIES:
-                    delay = BASE_DELAY * (2 ** attempt)
-                    reason = "Rate limited" if is_rate_limit else "Server error"
-                    logger.warning(
-                        "[Gemini] %s (attempt %s/%s). Retrying in %ss...",
-                        reason,
-                        attempt + 1,
-                        MAX_RETRIES + 1,
-                        delay,
-                    )
+                delay = self._retry_delay(e, attempt, breaker, paced)
+                if delay is None:
+                    raise
+                if delay:
                     time.sleep(delay)
-                else:
-                    raise last_error
+
+    async def _call_with_retry_async(self, call_fn, breaker: CircuitBreaker | None = None, paced: bool = False):
+        """_call_with_retry for coroutine functions; backs off without blocking the event loop."""
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                return await call_fn()
+            except GeminiQuotaExceeded:
+                raise
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, breaker, paced)
+                if delay is None:
+                    raise
+                if delay:
+                    await asyncio.sleep(delay)
 
     @staticmethod
     def _classify_failure_reason(error_text: str) -> str:
@@ -243,10 +407,28 @@ class GeminiService:
             )
         )
 
-    def _call_with_model_fallback(self, call_builder, selected_model: str, status_callback=None):
+    @staticmethod
+    def _adopt_fallback_model(failed_model: str, fallback_model: str, status_callback=None):
+        logger.warning(
+            "[Gemini] Model '%s' unavailable. Falling back to '%s'.",
+            failed_model,
+            fallback_model,
+        )
+        if status_callback:
+            status_callback(f"Model unavailable. Retrying with {fallback_model}...")
+        try:
+            set_gemini_model(fallback_model)
+        except Exception as persist_error:
+            logger.warning("[Gemini] Failed to persist fallback model: %s", persist_error)
+
+    def _call_with_model_fallback(self, call_builder, selected_model: str, status_callback=None, breaker: CircuitBreaker | None = None):
         model_in_use = selected_model
         try:
-            response = self._call_with_retry(lambda: call_builder(model_in_use))
+            response = self._call_with_retry(
+                lambda: self._paced_call(call_builder, model_in_use, status_callback),
+                breaker=breaker,
+                paced=True,
+            )
             return response, model_in_use
         except Exception as e:
             error_text = str(e)
@@ -257,33 +439,55 @@ class GeminiService:
             if model_in_use == fallback_model:
                 raise
 
-            logger.warning(
-                "[Gemini] Model '%s' unavailable. Falling back to '%s'.",
-                model_in_use,
-                fallback_model,
+            self._adopt_fallback_model(model_in_use, fallback_model, status_callback)
+            response = self._call_with_retry(
+                lambda: self._paced_call(call_builder, fallback_model, status_callback),
+                breaker=breaker,
+                paced=True,
             )
-            if status_callback:
-                status_callback(f"Model unavailable. Retrying with {fallback_model}...")
-            try:
-                set_gemini_model(fallback_model)
-            except Exception as persist_error:
-                logger.warning("[Gemini] Failed to persist fallback model: %s", persist_error)
-
-            response = self._call_with_retry(lambda: call_builder(fallback_model))
             return response, fallback_model
 
-    def research_lyrics(self, track_name: str, artist_name: str, status_callback=None, model_id: str | None = None) -> str | None:
+    @staticmethod
+    def parse_research_response(response, track_name: str) -> tuple[str | None, str | None]:
+        """(lyrics, None) from a research response, or (None, failure_reason)."""
+        # Check finish_reason before inspecting text
+        if response.candidates and response.candidates[0].finish_reason != "STOP":
+            reason = response.candidates[0].finish_reason if response.candidates else "UNKNOWN"
+            logger.warning(
+                "[Gemini] Request filtered/refused (finish_reason=%s) for %s",
+                reason,
+                track_name,
+            )
+            return None, "not_found"
+
+        result = response.text.strip()
+
+        # Only check refusal phrases on SHORT responses (real lyrics are >100 chars)
+        if len(result) < 100:
+            refusal_phrases = [
+                "lyrics_not_found",
+                "i don't have",
+                "i cannot",
+                "cannot provide",
+            ]
+            if any(phrase in result.lower() for phrase in refusal_phrases):
+                logger.info("Gemini research: Lyrics not found for %s", track_name)
+                return None, "not_found"
+
+        logger.info("Gemini research: Found lyrics for %s", track_name)
+        return result, None
+
+    def research_lyrics(self, track_name: str, artist_name: str, status_callback=None, model_id: str | None = None, breaker: CircuitBreaker | None = None) -> tuple[str | None, str | None]:
         """
         Use Gemini to research and find published lyrics for a song.
         This is a fallback when syncedlyrics database search fails.
+        Returns (lyrics, None) or (None, failure_reason).
         """
         if not self.is_available():
             if status_callback: status_callback("Gemini API key missing")
-            self._last_failure_reason = "source_unavailable"
-            return None
+            return None, "source_unavailable"
 
-        # User query only — system role is in LYRICS_RESEARCH_CONFIG
-        prompt = f'Find the complete published lyrics for "{track_name}" by "{artist_name}".'
+        prompt = research_prompt(track_name, artist_name)
         selected_model = model_id or self.model
 
         try:
@@ -292,69 +496,195 @@ class GeminiService:
                 return self.client.models.generate_content(
                     model=model_name,
                     contents=prompt,
-                    config=LYRICS_RESEARCH_CONFIG,
+                    config=self._with_timeout(LYRICS_RESEARCH_CONFIG, breaker),
                 )
 
-            response, _ = self._call_with_model_fallback(_call, selected_model, status_callback=status_callback)
+            response, _ = self._call_with_model_fallback(_call, selected_model, status_callback=status_callback, breaker=breaker)
+            return self.parse_research_response(response, track_name)
+        except Exception as e:
+            logger.error("Gemini research error: %s", e, exc_info=True)
+            return None, self._classify_failure_reason(str(e))
 
-            # Check finish_reason before inspecting text
-            if response.candidates and response.candidates[0].finish_reason != "STOP":
-                reason = response.candidates[0].finish_reason if response.candidates else "UNKNOWN"
-                logger.warning(
-                    "[Gemini] Request filtered/refused (finish_reason=%s) for %s",
-                    reason,
-                    track_name,
-                )
-                self._last_failure_reason = "not_found"
-                return None
-
-            result = response.text.strip()
-
-            # Only check refusal phrases on SHORT responses (real lyrics are >100 chars)
-            if len(result) < 100:
-                refusal_phrases = [
-                    "lyrics_not_found",
-                    "i don't have",
-                    "i cannot",
-                    "cannot provide",
-                ]
-                if any(phrase in result.lower() for phrase in refusal_phrases):
-                    logger.info("Gemini research: Lyrics not found for %s", track_name)
-                    self._last_failure_reason = "not_found"
-                    return None
-
-            logger.info("Gemini research: Found lyrics for %s", track_name)
-            self._last_failure_reason = None
-            return result
+    @staticmethod
+    def _hedge_after(breaker: CircuitBreaker | None) -> float | None:
+        """Seconds to wait on the first request before hedging, or None to never hedge."""
+        if os.getenv("LYRICVAULT_GEMINI_HEDGE", "1") != "1":
+            return None
+        if breaker is None or breaker.sample_count < HEDGE_MIN_SAMPLES:
+            return HEDGE_DEFAULT_AFTER_SECONDS
+        return breaker.latency_percentile(95)
+
+    async def _hedged_call(self, attempt, selected_model: str, hedge_after: float | None, status_callback=None):
+        """
+        Run attempt(selected_model); if it is still pending after hedge_after
+        seconds, race a duplicate attempt on the stable model and return the
+        first success as (response, model). The loser is cancelled.
+
+        Also covers model fallback: if the selected model is unavailable the
+        stable model is tried (and persisted) as in _call_with_model_fallback.
+        """
+        fallback_model = get_stable_gemini_model()
+        tasks = {asyncio.ensure_future(attempt(selected_model)): selected_model}
+        can_add = fallback_model != selected_model
+        last_error = None
+        try:
+            while tasks:
+                timeout = hedge_after if can_add else None
+                done, _ = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    can_add = False
+                    # A hedge that would queue for quota can't beat the request already in flight.
+                    if gemini_scheduler.expected_wait(fallback_model) > 0:
+                        continue
+                    logger.info(
+                        "[Gemini] %s slower than %.1fs; hedging with %s",
+                        selected_model,
+                        hedge_after,
+                        fallback_model,
+                    )
+                    tasks[asyncio.ensure_future(attempt(fallback_model))] = fallback_model
+                    continue
+                for task in done:
+                    model_name = tasks.pop(task)
+                    try:
+                        return task.result(), model_name
+                    except Exception as e:
+                        last_error = e
+                        if can_add and self._is_model_unavailable_error(str(e)):
+                            can_add = False
+                            self._adopt_fallback_model(model_name, fallback_model, status_callback)
+                            tasks[asyncio.ensure_future(attempt(fallback_model))] = fallback_model
+            raise last_error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def research_lyrics_async(self, track_name: str, artist_name: str, status_callback=None, model_id: str | None = None, breaker: CircuitBreaker | None = None) -> tuple[str | None, str | None]:
+        """
+        research_lyrics() on the SDK's async client, hedged against slow
+        responses (see _hedged_call). Runs on the caller's event loop.
+        """
+        if not self.is_available():
+            if status_callback: status_callback("Gemini API key missing")
+            return None, "source_unavailable"
 
+        prompt = research_prompt(track_name, artist_name)
+        selected_model = model_id or self.model
+        client = self.client
+
+        async def _call(model_name: str):
+            if status_callback: status_callback(f"Researching: {track_name}...")
+            return await client.aio.models.generate_content(
+                model=model_name,
+                contents=prompt,
+                config=self._with_timeout(LYRICS_RESEARCH_CONFIG, breaker),
+            )
+
+        async def _attempt(model_name: str):
+            return await self._call_with_retry_async(
+                lambda: self._paced_call_async(_call, model_name, status_callback),
+                breaker=breaker,
+                paced=True,
+            )
+
+        try:
+            response, _ = await self._hedged_call(
+                _attempt,
+                selected_model,
+                self._hedge_after(breaker),
+                status_callback=status_callback,
+            )
+            return self.parse_research_response(response, track_name)
         except Exception as e:
             logger.error("Gemini research error: %s", e, exc_info=True)
-            self._last_failure_reason = self._classify_failure_reason(str(e))
+            return None, self._classify_failure_reason(str(e))
+
+    @staticmethod
+    def _use_files_api(file_size: int) -> bool:
+        """Upload via the Files API unless the file is small enough to inline."""
+        mode = os.getenv("LYRICVAULT_GEMINI_UPLOAD_MODE", "auto").strip().lower()
+        if mode == "upload":
+            return True
+        if mode == "inline":
+            return False
+        return file_size > INLINE_AUDIO_MAX_BYTES
+
+    @staticmethod
+    def _chunking_duration(audio_file_path: str) -> float | None:
+        """Track duration if it should be transcribed in windows, else None."""
+        mode = os.getenv("LYRICVAULT_TRANSCRIBE_CHUNKING", "auto").strip().lower()
+        if mode == "off":
             return None
+        duration = audio_preprocessor.probe_duration(audio_file_path)
+        if not duration or duration <= CHUNK_WINDOW_SECONDS:
+            return None
+        if mode != "always" and duration < CHUNK_MIN_DURATION_SECONDS:
+            return None
+        return duration
 
-    def transcribe_audio(self, audio_file_path: str, track_name: str = None, artist_name: str = None, status_callback=None, model_id: str | None = None) -> str | None:
+    def _transcribe_window(self, window, prompt: str, selected_model: str, breaker: CircuitBreaker | None) -> str:
+        with open(window.path, "rb") as f:
+            audio_part = types.Part.from_bytes(data=f.read(), mime_type="audio/mpeg")
+
+        def _call(model_name: str):
+            return self.client.models.generate_content(
+                model=model_name,
+                contents=[prompt, audio_part],
+                config=self._with_timeout(WINDOW_TRANSCRIPTION_CONFIG, breaker),
+            )
+
+        response, _ = self._call_with_model_fallback(_call, selected_model, breaker=breaker)
+        if response.candidates and response.candidates[0].finish_reason != "STOP":
+            return ""
+        text = (response.text or "").strip()
+        return "" if "NO_VOCALS" in text else text
+
+    def _transcribe_windowed(self, audio_file_path: str, duration: float, prompt: str, selected_model: str, status_callback=None, breaker: CircuitBreaker | None = None) -> str:
+        """
+        Transcribe overlapping windows concurrently and stitch them into one
+        LRC. Requests still go through the quota scheduler, so concurrency
+        never exceeds the model's rate limit. Raises if any window fails.
+        """
+        with audio_preprocessor.split_windows(
+            audio_file_path, duration, CHUNK_WINDOW_SECONDS, CHUNK_OVERLAP_SECONDS
+        ) as windows:
+            if status_callback:
+                status_callback(f"Transcribing {len(windows)} segments in parallel...")
+            with ThreadPoolExecutor(
+                max_workers=min(CHUNK_MAX_WORKERS, len(windows)),
+                thread_name_prefix="gemini-window",
+            ) as executor:
+                texts = list(executor.map(
+                    lambda window: self._transcribe_window(window, prompt, selected_model, breaker),
+                    windows,
+                ))
+            chunks = [(window.start_ms, text) for window, text in zip(windows, texts)]
+        return stitch_chunks(chunks, CHUNK_OVERLAP_SECONDS * 1000)
+
+    def cleanup_expired_uploads(self) -> int:
+        """Forget (and best-effort delete) Files API uploads past their expiry."""
+        return gemini_uploads.cleanup_expired(self.client)
+
+    def transcribe_audio(self, audio_file_path: str, track_name: str = None, artist_name: str = None, status_callback=None, model_id: str | None = None, breaker: CircuitBreaker | None = None) -> tuple[str | None, str | None]:
         """
         Use Gemini's multimodal capabilities to transcribe lyrics from audio.
+        Returns (lyrics, None) or (None, failure_reason).
         """
         if not self.is_available():
             if status_callback: status_callback("Gemini API key missing")
-            self._last_failure_reason = "source_unavailable"
-            return None
+            return None, "source_unavailable"
 
         if not os.path.exists(audio_file_path):
             logger.warning("Audio file not found for transcription: %s", audio_file_path)
-            return None
+            return None, "not_found"
 
         try:
-            with open(audio_file_path, "rb") as f:
-                audio_bytes = f.read()
-
-            file_size_mb = len(audio_bytes) / (1024 * 1024)
-            if file_size_mb > 20:
-                logger.warning("Audio file too large for inline processing: %.1fMB", file_size_mb)
-                if status_callback: status_callback(f"Error: Audio too large ({file_size_mb:.1f}MB)")
-                self._last_failure_reason = "source_unavailable"
-                return None
+            # Mono 16 kHz derivative (cached); falls back to the original file.
+            prepared = audio_preprocessor.prepare(audio_file_path, status_callback)
+            source_path = audio_file_path
+            audio_file_path = prepared.path
+            file_size = os.path.getsize(audio_file_path)
+            file_size_mb = file_size / (1024 * 1024)
 
             ext = os.path.splitext(audio_file_path)[1].lower()
             mime_types = {
@@ -374,50 +704,69 @@ class GeminiService:
                 context_parts.append(f"by {artist_name}")
             prompt = f'Transcribe: {" ".join(context_parts)}' if context_parts else "Transcribe the lyrics from this audio."
 
-            audio_part = types.Part.from_bytes(
-                data=audio_bytes,
-                mime_type=mime_type
-            )
-
             selected_model = model_id or self.model
-
-            def _call(model_name: str):
-                if status_callback: status_callback(f"Uploading audio ({file_size_mb:.1f}MB) & Analyzing...")
-                return self.client.models.generate_content(
-                    model=model_name,
-                    contents=[prompt, audio_part],
-                    config=AUDIO_TRANSCRIPTION_CONFIG,
+            duration = self._chunking_duration(audio_file_path)
+            if duration:
+                logger.info("[Gemini] Transcribing %.0fs track in windows: %s", duration, source_path)
+                result = self._transcribe_windowed(
+                    audio_file_path,
+                    duration,
+                    prompt,
+                    selected_model,
+                    status_callback=status_callback,
+                    breaker=breaker,
                 )
+                if not result:
+                    logger.info("Gemini transcription: No lyrics in any window of %s", track_name or source_path)
+                    return None, "not_found"
+            else:
+                if self._use_files_api(file_size):
+                    # Streamed from disk by the SDK; memory stays flat regardless of size.
+                    uploaded = gemini_uploads.get_or_upload(self.client, audio_file_path, mime_type, status_callback)
+                    audio_part = types.Part.from_uri(file_uri=uploaded.uri, mime_type=uploaded.mime_type or mime_type)
+                elif file_size_mb > 20:
+                    logger.warning("Audio file too large for inline processing: %.1fMB", file_size_mb)
+                    if status_callback: status_callback(f"Error: Audio too large ({file_size_mb:.1f}MB)")
+                    return None, "source_unavailable"
+                else:
+                    with open(audio_file_path, "rb") as f:
+                        audio_part = types.Part.from_bytes(data=f.read(), mime_type=mime_type)
+
+                def _call(model_name: str):
+                    if status_callback: status_callback(f"Analyzing audio ({file_size_mb:.1f}MB)...")
+                    return self.client.models.generate_content(
+                        model=model_name,
+                        contents=[prompt, audio_part],
+                        config=self._with_timeout(AUDIO_TRANSCRIPTION_CONFIG, breaker),
+                    )
 
-            response, _ = self._call_with_model_fallback(_call, selected_model, status_callback=status_callback)
+                response, _ = self._call_with_model_fallback(_call, selected_model, status_callback=status_callback, breaker=breaker)
 
-            # Check finish_reason before inspecting text
-            if response.candidates and response.candidates[0].finish_reason != "STOP":
-                reason = response.candidates[0].finish_reason if response.candidates else "UNKNOWN"
-                logger.warning(
-                    "[Gemini] Transcription filtered (finish_reason=%s) for %s",
-                    reason,
-                    track_name or audio_file_path,
-                )
-                self._last_failure_reason = "not_found"
-                return None
+                # Check finish_reason before inspecting text
+                if response.candidates and response.candidates[0].finish_reason != "STOP":
+                    reason = response.candidates[0].finish_reason if response.candidates else "UNKNOWN"
+                    logger.warning(
+                        "[Gemini] Transcription filtered (finish_reason=%s) for %s",
+                        reason,
+                        track_name or source_path,
+                    )
+                    return None, "not_found"
 
-            result = response.text.strip()
+                result = response.text.strip()
 
-            if "TRANSCRIPTION_FAILED" in result:
-                logger.info("Gemini transcription: Could not transcribe %s", track_name or audio_file_path)
-                self._last_failure_reason = "not_found"
-                return None
+                if "TRANSCRIPTION_FAILED" in result:
+                    logger.info("Gemini transcription: Could not transcribe %s", track_name or source_path)
+                    return None, "not_found"
 
-            logger.info("Gemini transcription: Successfully transcribed %s", track_name or audio_file_path)
-            self._last_failure_reason = None
-            return result
+            # Timestamps are relative to the trimmed audio; map back to the original.
+            result = shift_lrc(result, prepared.offset_ms)
+            logger.info("Gemini transcription: Successfully transcribed %s", track_name or source_path)
+            return result, None
 
         except Exception as e:
             logger.error("Gemini transcription error: %s", e, exc_info=True)
             if status_callback: status_callback(f"Error: {str(e)[:50]}...")
-            self._last_failure_reason = self._classify_failure_reason(str(e))
-            return None
+            return None, self._classify_failure_reason(str(e))
 
 
 # Singleton instance
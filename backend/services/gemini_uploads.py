@@ -0,0 +1,177 @@
+"""
+GeminiUploads - Reusable Gemini Files API uploads for audio transcription.
+
+Large audio is streamed from disk to the Files API instead of being inlined
+in the request. Uploads are recorded by the file's SHA-256 so retries and
+re-transcriptions of the same audio reuse the existing upload until it
+expires (the Files API keeps uploads for 48 hours).
+
+The registry lives in AppData/LyricVault/gemini_uploads.json; expired
+entries are pruned (and deleted remotely, best effort) by cleanup_expired().
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from google.genai import types
+
+logger = logging.getLogger(__name__)
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+# Don't hand out uploads that could expire mid-request.
+_EXPIRY_MARGIN = timedelta(minutes=30)
+_DEFAULT_LIFETIME = timedelta(hours=48)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _state_name(file: types.File) -> str:
+    state = getattr(file, "state", None)
+    return str(getattr(state, "name", state) or "")
+
+
+class GeminiUploadCache:
+    def __init__(self, registry_path: str | None = None):
+        if registry_path is None:
+            app_data = os.environ.get("APPDATA", os.path.expanduser("~"))
+            registry_dir = os.path.join(app_data, "LyricVault")
+            os.makedirs(registry_dir, exist_ok=True)
+            registry_path = os.path.join(registry_dir, "gemini_uploads.json")
+        self.registry_path = registry_path
+        self.processing_timeout_seconds = 120.0
+        self.poll_interval_seconds = 1.0
+        self._lock = threading.Lock()
+        # (path, size, mtime_ns) -> sha256, so re-transcriptions don't re-hash.
+        self._hashes: dict[tuple, str] = {}
+
+    def file_sha256(self, path: str) -> str:
+        st = os.stat(path)
+        signature = (os.path.abspath(path), st.st_size, st.st_mtime_ns)
+        cached = self._hashes.get(signature)
+        if cached:
+            return cached
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+                digest.update(chunk)
+        sha = digest.hexdigest()
+        self._hashes[signature] = sha
+        return sha
+
+    def _read_registry(self) -> dict:
+        try:
+            with open(self.registry_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning("Ignoring unreadable Gemini upload registry: %s", e)
+            return {}
+
+    def _write_registry(self, registry: dict):
+        directory = os.path.dirname(self.registry_path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".uploads-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(registry, f, indent=2)
+            os.replace(tmp_path, self.registry_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @staticmethod
+    def _is_live(entry: dict, now: datetime) -> bool:
+        try:
+            expires = datetime.fromisoformat(entry["expiration_time"])
+        except (KeyError, TypeError, ValueError):
+            return False
+        return expires - _EXPIRY_MARGIN > now
+
+    def _wait_until_active(self, client, file: types.File) -> types.File:
+        deadline = time.monotonic() + self.processing_timeout_seconds
+        while _state_name(file) == "PROCESSING":
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Gemini file {file.name} still processing after {self.processing_timeout_seconds:.0f}s")
+            time.sleep(self.poll_interval_seconds)
+            file = client.files.get(name=file.name)
+        if _state_name(file) == "FAILED":
+            raise RuntimeError(f"Gemini file processing failed for {file.name}")
+        return file
+
+    def get_or_upload(self, client, path: str, mime_type: str, status_callback=None) -> types.File:
+        """
+        Return an ACTIVE Files API handle for this audio, uploading it
+        (streamed from disk by the SDK) only if no live upload exists.
+        """
+        sha = self.file_sha256(path)
+        now = _utcnow()
+        with self._lock:
+            entry = self._read_registry().get(sha)
+
+        if entry and self._is_live(entry, now):
+            try:
+                file = client.files.get(name=entry["name"])
+                if _state_name(file) != "FAILED":
+                    logger.info("[Gemini] Reusing upload %s for %s", entry["name"], path)
+                    return self._wait_until_active(client, file)
+            except Exception as e:
+                # Deleted remotely, or the API key changed since it was uploaded.
+                logger.info("[Gemini] Cached upload %s unusable (%s); re-uploading.", entry.get("name"), e)
+
+        size_mb = os.path.getsize(path) / (1024 * 1024)
+        if status_callback:
+            status_callback(f"Uploading audio ({size_mb:.1f}MB)...")
+        file = client.files.upload(
+            file=path,
+            config=types.UploadFileConfig(mime_type=mime_type, display_name=f"lyricvault-{sha[:16]}"),
+        )
+        file = self._wait_until_active(client, file)
+
+        expires = file.expiration_time or (_utcnow() + _DEFAULT_LIFETIME)
+        if expires.tzinfo is None:
+            expires = expires.replace(tzinfo=timezone.utc)
+        with self._lock:
+            registry = self._read_registry()
+            registry[sha] = {
+                "name": file.name,
+                "uri": file.uri,
+                "mime_type": file.mime_type or mime_type,
+                "expiration_time": expires.isoformat(),
+            }
+            self._write_registry(registry)
+        logger.info("[Gemini] Uploaded %s as %s", path, file.name)
+        return file
+
+    def cleanup_expired(self, client=None) -> int:
+        """Drop registry entries that are (nearly) expired; returns how many."""
+        now = _utcnow()
+        with self._lock:
+            registry = self._read_registry()
+            expired = {sha: entry for sha, entry in registry.items() if not self._is_live(entry, now)}
+            if not expired:
+                return 0
+            for sha in expired:
+                registry.pop(sha, None)
+            self._write_registry(registry)
+
+        if client is not None:
+            for entry in expired.values():
+                try:
+                    client.files.delete(name=entry["name"])
+                except Exception:
+                    # Usually already gone server-side; nothing else to do.
+                    pass
+        logger.info("[Gemini] Pruned %s expired upload(s)", len(expired))
+        return len(expired)
+
+
+gemini_uploads = GeminiUploadCache()
@@ -0,0 +1,250 @@
+"""
+LyricBatch - Gemini Batch Mode research for the legacy lyric migration.
+
+The strict-LRC startup migration used to queue a bounded number of
+generate_lyrics jobs per launch, each making its own interactive research
+call. Instead, legacy songs without a cached research result are packed into
+one Gemini batch job, which runs against the (separate, cheaper) batch quota.
+
+The worker polls submitted batches from its cleanup loop. When one finishes:
+- every result is stored in lyric_cache as "gemini_research" for the
+  batch's model in a single transaction, so the generate_lyrics jobs queued later for those songs skip
+  the research call entirely;
+- results that are already valid LRC are written to songs directly, in
+  chunked bulk transactions;
+- songs whose batch request failed are recorded as "gemini_batch" failures
+  (kept for the cache's negative TTL), so they get a regular job that
+  researches live instead of being batched again.
+
+Submitted batches are recorded in AppData/LyricVault/gemini_batches.json so
+polling resumes after a restart.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+
+from google.genai import types
+
+from database import models
+from database.database import SessionLocal
+from utils.lrc_validator import validate_lrc
+from .gemini_service import LYRICS_RESEARCH_CONFIG, GeminiService, research_prompt
+from .lyric_cache import lyric_cache
+from .lyricist import lyricist
+
+logger = logging.getLogger(__name__)
+
+PROVIDER = "gemini_research"
+BATCH_FAILURE_PROVIDER = "gemini_batch"
+
+_SUCCEEDED_STATES = {"JOB_STATE_SUCCEEDED", "JOB_STATE_PARTIALLY_SUCCEEDED"}
+_FAILED_STATES = {"JOB_STATE_FAILED", "JOB_STATE_CANCELLED", "JOB_STATE_EXPIRED"}
+
+
+def _state_name(job: types.BatchJob) -> str:
+    state = getattr(job, "state", None)
+    return str(getattr(state, "name", state) or "")
+
+
+class LyricBatchMigrator:
+    def __init__(self, registry_path: str | None = None, session_factory=SessionLocal, cache=lyric_cache):
+        if registry_path is None:
+            app_data = os.environ.get("APPDATA", os.path.expanduser("~"))
+            registry_dir = os.path.join(app_data, "LyricVault")
+            os.makedirs(registry_dir, exist_ok=True)
+            registry_path = os.path.join(registry_dir, "gemini_batches.json")
+        self.registry_path = registry_path
+        self.enabled = os.getenv("LYRICVAULT_LYRIC_BATCH_ENABLED", "1") == "1"
+        self.max_songs = int(os.getenv("LYRICVAULT_LYRIC_BATCH_MAX_SONGS", "500"))
+        self.write_chunk_size = 200
+        self._session_factory = session_factory
+        self._cache = cache
+        self._lock = threading.Lock()
+
+    def _read_registry(self) -> dict:
+        try:
+            with open(self.registry_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning("Ignoring unreadable Gemini batch registry: %s", e)
+            return {}
+
+    def _write_registry(self, registry: dict):
+        directory = os.path.dirname(self.registry_path) or "."
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".batches-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(registry, f, indent=2)
+            os.replace(tmp_path, self.registry_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def in_flight_song_ids(self) -> set[int]:
+        with self._lock:
+            registry = self._read_registry()
+        return {song["song_id"] for entry in registry.values() for song in entry.get("songs", [])}
+
+    def unresearched_song_ids(self, songs: list[dict]) -> set[int]:
+        """
+        Ids of songs ([{song_id, title, artist}]) that have neither a live
+        cached research result nor a recent batch failure. Checked with one
+        cache query per chunk rather than one per song.
+        """
+        research = lyricist.cache_provider(PROVIDER)
+        keys = {song["song_id"]: lyricist.cache_key(song["title"], song["artist"]) for song in songs}
+        cached = self._cache.get_many([
+            (*key, provider) for key in keys.values() for provider in (research, BATCH_FAILURE_PROVIDER)
+        ])
+        return {
+            song_id for song_id, key in keys.items()
+            if (*key, research) not in cached and (*key, BATCH_FAILURE_PROVIDER) not in cached
+        }
+
+    def submit(self, client, model: str, songs: list[dict]) -> str | None:
+        """
+        Submit one batch researching songs ([{song_id, title, artist}]).
+        Returns the batch job name, or None if nothing was submitted.
+        """
+        songs = songs[: self.max_songs]
+        if not songs:
+            return None
+        requests = [
+            types.InlinedRequest(
+                contents=research_prompt(song["title"], song["artist"]),
+                config=LYRICS_RESEARCH_CONFIG,
+                metadata={"song_id": str(song["song_id"])},
+            )
+            for song in songs
+        ]
+        try:
+            job = client.batches.create(
+                model=model,
+                src=requests,
+                config=types.CreateBatchJobConfig(display_name=f"lyricvault-migration-{len(songs)}"),
+            )
+        except Exception as e:
+            logger.warning("[LyricBatch] Batch submission failed: %s", e)
+            return None
+
+        with self._lock:
+            registry = self._read_registry()
+            registry[job.name] = {
+                "model": model,
+                "submitted_at": datetime.now(timezone.utc).isoformat(),
+                "songs": songs,
+            }
+            self._write_registry(registry)
+        logger.info("[LyricBatch] Submitted %s with %s song(s)", job.name, len(songs))
+        return job.name
+
+    def poll(self, client) -> tuple[int, list[int]]:
+        """
+        Check every recorded batch once and apply finished ones.
+        Returns (batches applied, ids of songs that received synced lyrics).
+        Failed or expired batches are dropped without counting as applied.
+        """
+        with self._lock:
+            registry = self._read_registry()
+
+        finished: list[str] = []
+        applied = 0
+        updated: list[int] = []
+        for name, entry in registry.items():
+            try:
+                job = client.batches.get(name=name)
+            except Exception as e:
+                logger.warning("[LyricBatch] Could not poll %s: %s", name, e)
+                continue
+            state = _state_name(job)
+            if state in _SUCCEEDED_STATES:
+                responses = (job.dest.inlined_responses if job.dest else None) or []
+                updated.extend(self._apply(entry.get("songs", []), responses, entry.get("model")))
+                finished.append(name)
+                applied += 1
+            elif state in _FAILED_STATES:
+                logger.warning("[LyricBatch] %s ended in %s; its songs will be resubmitted", name, state)
+                finished.append(name)
+
+        if finished:
+            with self._lock:
+                registry = self._read_registry()
+                for name in finished:
+                    registry.pop(name, None)
+                self._write_registry(registry)
+        return applied, updated
+
+    def _apply(self, songs: list[dict], responses: list[types.InlinedResponse], model: str | None = None) -> list[int]:
+        by_id = {song["song_id"]: song for song in songs}
+        cache_provider = lyricist.cache_provider(PROVIDER, model)
+        cache_entries = []
+        synced: dict[int, str] = {}
+        for index, item in enumerate(responses):
+            song_id = (item.metadata or {}).get("song_id")
+            song = by_id.get(int(song_id)) if song_id else (songs[index] if index < len(songs) else None)
+            if song is None:
+                continue
+            artist_key, title_key = lyricist.cache_key(song["title"], song["artist"])
+            if item.error is not None or item.response is None:
+                # Not a research answer: the song's job researches live instead
+                # of the song being batched again.
+                cache_entries.append({
+                    "artist_key": artist_key,
+                    "title_key": title_key,
+                    "provider": BATCH_FAILURE_PROVIDER,
+                    "lyrics": None,
+                    "failure_reason": "batch_failed",
+                })
+                continue
+            lyrics, reason = GeminiService.parse_research_response(item.response, song["title"])
+            is_synced = bool(lyrics and validate_lrc(lyrics))
+            cache_entries.append({
+                "artist_key": artist_key,
+                "title_key": title_key,
+                "provider": cache_provider,
+                "lyrics": lyrics,
+                "is_synced": is_synced,
+                "failure_reason": reason,
+            })
+            if is_synced:
+                synced[song["song_id"]] = lyrics
+
+        self._cache.put_many(cache_entries)
+        return self._write_synced(synced)
+
+    def _write_synced(self, synced: dict[int, str]) -> list[int]:
+        updated: list[int] = []
+        song_ids = sorted(synced)
+        db = self._session_factory()
+        try:
+            for start in range(0, len(song_ids), self.write_chunk_size):
+                chunk = song_ids[start:start + self.write_chunk_size]
+                songs = db.query(models.Song).filter(
+                    models.Song.id.in_(chunk),
+                    # Don't clobber lyrics synced some other way while the batch ran.
+                    models.Song.lyrics_synced == False,  # noqa: E712 - SQLAlchemy comparison
+                ).all()
+                for song in songs:
+                    song.lyrics = synced[song.id]
+                    song.lyrics_synced = True
+                    song.lyrics_source = PROVIDER
+                    updated.append(song.id)
+                db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error("[LyricBatch] Failed to write batch lyrics: %s", e, exc_info=True)
+        finally:
+            db.close()
+        if updated:
+            logger.info("[LyricBatch] Applied synced lyrics to %s song(s)", len(updated))
+        return updated
+
+
+lyric_batch = LyricBatchMigrator()
@@ -0,0 +1,217 @@
+"""
+LyricCache - Persistent cache of lyric provider results.
+
+Entries are keyed by normalized (artist, title, provider), so the worker,
+manual research, retries and the bridge CLI all share one set of results:
+- Found lyrics (synced or not) are kept until explicitly refreshed.
+- "not_found" is remembered for a while so repeat lookups skip the providers.
+- Transient failures (rate limits, outages) expire quickly.
+
+Gemini results are stored per model ("gemini_research:<model>"), and
+transcriptions also per audio file signature; see
+LyricistService.cache_provider().
+
+Callers pass refresh=True for forced retries; the fresh result overwrites
+whatever was cached.
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import tuple_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from database import models
+from database.database import SessionLocal, engine
+
+logger = logging.getLogger(__name__)
+
+_TRANSIENT_REASONS = {"rate_limited", "source_unavailable"}
+# Keys per get_many() query (3 bound parameters each, well under SQLite's limit).
+_GET_MANY_CHUNK = 200
+
+
+@dataclass(frozen=True)
+class CachedLookup:
+    lyrics: str | None
+    is_synced: bool
+    failure_reason: str | None
+
+
+def _utcnow() -> datetime:
+    # Stored naive-UTC to match how SQLite round-trips the other DateTime columns.
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class LyricCache:
+    def __init__(self, session_factory=SessionLocal, bind=engine):
+        self.enabled = os.getenv("LYRICVAULT_LYRIC_CACHE_ENABLED", "1") == "1"
+        self.negative_ttl_seconds = float(os.getenv("LYRICVAULT_LYRIC_CACHE_NEGATIVE_TTL_SECONDS", str(6 * 3600)))
+        self.transient_ttl_seconds = float(os.getenv("LYRICVAULT_LYRIC_CACHE_TRANSIENT_TTL_SECONDS", "300"))
+        self._session_factory = session_factory
+        self._bind = bind
+        self._table_ready = False
+        self._lock = threading.Lock()
+
+    def _ensure_table(self):
+        # The bridge CLI never runs init_db(), so create the table on first use.
+        if self._table_ready:
+            return
+        with self._lock:
+            if not self._table_ready:
+                models.LyricLookup.__table__.create(bind=self._bind, checkfirst=True)
+                self._table_ready = True
+
+    def _ttl_for(self, lyrics: str | None, failure_reason: str | None) -> float | None:
+        if lyrics:
+            return None
+        if (failure_reason or "not_found") in _TRANSIENT_REASONS:
+            return self.transient_ttl_seconds
+        return self.negative_ttl_seconds
+
+    def get(self, artist_key: str, title_key: str, provider: str) -> CachedLookup | None:
+        """Return the live cached result, or None on a miss / expired entry."""
+        if not self.enabled:
+            return None
+        try:
+            self._ensure_table()
+            db = self._session_factory()
+            try:
+                row = db.query(models.LyricLookup).filter(
+                    models.LyricLookup.artist_key == artist_key,
+                    models.LyricLookup.title_key == title_key,
+                    models.LyricLookup.provider == provider,
+                ).first()
+                if not row:
+                    return None
+                if row.expires_at is not None and row.expires_at <= _utcnow():
+                    return None
+                return CachedLookup(
+                    lyrics=row.lyrics,
+                    is_synced=bool(row.is_synced),
+                    failure_reason=row.failure_reason,
+                )
+            finally:
+                db.close()
+        except Exception as e:
+            logger.warning("[LyricCache] Read failed: %s", e)
+            return None
+
+    def get_many(self, keys: list[tuple[str, str, str]]) -> dict[tuple[str, str, str], CachedLookup]:
+        """
+        Live cached results for many (artist_key, title_key, provider) keys,
+        one query per chunk of keys. Misses and expired entries are omitted.
+        """
+        if not self.enabled or not keys:
+            return {}
+        found: dict[tuple[str, str, str], CachedLookup] = {}
+        unique = list(dict.fromkeys(keys))
+        try:
+            self._ensure_table()
+            db = self._session_factory()
+            try:
+                now = _utcnow()
+                for start in range(0, len(unique), _GET_MANY_CHUNK):
+                    chunk = unique[start:start + _GET_MANY_CHUNK]
+                    rows = db.query(models.LyricLookup).filter(
+                        tuple_(
+                            models.LyricLookup.artist_key,
+                            models.LyricLookup.title_key,
+                            models.LyricLookup.provider,
+                        ).in_(chunk)
+                    ).all()
+                    for row in rows:
+                        if row.expires_at is not None and row.expires_at <= now:
+                            continue
+                        found[(row.artist_key, row.title_key, row.provider)] = CachedLookup(
+                            lyrics=row.lyrics,
+                            is_synced=bool(row.is_synced),
+                            failure_reason=row.failure_reason,
+                        )
+            finally:
+                db.close()
+        except Exception as e:
+            logger.warning("[LyricCache] Read failed: %s", e)
+            return {}
+        return found
+
+    def _row(self, artist_key: str, title_key: str, provider: str, lyrics: str | None, is_synced: bool, failure_reason: str | None, now: datetime) -> dict | None:
+        ttl = self._ttl_for(lyrics, failure_reason)
+        if ttl is not None and ttl <= 0:
+            return None
+        return {
+            "artist_key": artist_key,
+            "title_key": title_key,
+            "provider": provider,
+            "lyrics": lyrics or None,
+            "is_synced": bool(lyrics and is_synced),
+            "failure_reason": None if lyrics else (failure_reason or "not_found"),
+            "expires_at": None if ttl is None else now + timedelta(seconds=ttl),
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    def _upsert(self, rows: list[dict]):
+        if not rows:
+            return
+        stmt = sqlite_insert(models.LyricLookup)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["artist_key", "title_key", "provider"],
+            set_={key: stmt.excluded[key] for key in ("lyrics", "is_synced", "failure_reason", "expires_at", "updated_at")},
+        )
+        try:
+            self._ensure_table()
+            db = self._session_factory()
+            try:
+                db.execute(stmt, rows)
+                db.commit()
+            finally:
+                db.close()
+        except Exception as e:
+            logger.warning("[LyricCache] Write failed: %s", e)
+
+    def put(
+        self,
+        artist_key: str,
+        title_key: str,
+        provider: str,
+        lyrics: str | None,
+        *,
+        is_synced: bool = False,
+        failure_reason: str | None = None,
+    ):
+        if not self.enabled:
+            return
+        row = self._row(artist_key, title_key, provider, lyrics, is_synced, failure_reason, _utcnow())
+        if row:
+            self._upsert([row])
+
+    def put_many(self, entries: list[dict]):
+        """
+        Store many results in one transaction. Each entry has the put()
+        arguments as keys: artist_key, title_key, provider, lyrics and
+        optionally is_synced / failure_reason.
+        """
+        if not self.enabled:
+            return
+        now = _utcnow()
+        rows = []
+        for entry in entries:
+            row = self._row(
+                entry["artist_key"],
+                entry["title_key"],
+                entry["provider"],
+                entry.get("lyrics"),
+                entry.get("is_synced", False),
+                entry.get("failure_reason"),
+                now,
+            )
+            if row:
+                rows.append(row)
+        self._upsert(rows)
+
+
+lyric_cache = LyricCache()
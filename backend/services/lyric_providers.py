@@ -0,0 +1,127 @@
+"""
+Lyric provider adapter around syncedlyrics.
+
+syncedlyrics.search() builds its provider chain internally and can only be
+configured through process-wide state. This module rebuilds the same chain
+with explicit per-call configuration (the Genius access token), so lookups
+never mutate os.environ and are safe to run from many worker threads at once.
+"""
+
+import logging
+
+from syncedlyrics.providers import Genius, Lrclib, Megalobiz, Musixmatch, NetEase
+from syncedlyrics.utils import Lyrics, TargetType, generate_bs4_soup
+
+logger = logging.getLogger(__name__)
+
+# Same order as syncedlyrics.search().
+PROVIDER_NAMES = ["Musixmatch", "Lrclib", "NetEase", "Megalobiz", "Genius"]
+
+
+class GeniusProvider(Genius):
+    """
+    Genius provider that authenticates against the official API when a token
+    is supplied, and falls back to the public search endpoint otherwise.
+    """
+
+    API_SEARCH_ENDPOINT = "https://api.genius.com/search"
+
+    def __init__(self, access_token: str | None = None):
+        super().__init__()
+        self.access_token = access_token
+
+    def _scrape_lyrics(self, url: str) -> Lyrics | None:
+        soup = generate_bs4_soup(self.session, url)
+        els = soup.find_all("div", attrs={"data-lyrics-container": True})
+        if not els:
+            return None
+        lrc_str = ""
+        for el in els:
+            lrc_str += el.get_text(separator="\n", strip=True).replace("\n[", "\n\n[")
+        lrc = Lyrics()
+        lrc.unsynced = lrc_str
+        return lrc
+
+    def get_lrc(self, search_term: str) -> Lyrics | None:
+        if not self.access_token:
+            return super().get_lrc(search_term)
+
+        # Token goes on this request only; the session is per-provider-instance.
+        r = self.session.get(
+            self.API_SEARCH_ENDPOINT,
+            params={"q": search_term},
+            headers={"Authorization": f"Bearer {self.access_token}"},
+        )
+        if not r.ok:
+            logger.warning("[Genius] API search failed (%s); using public search.", r.status_code)
+            return super().get_lrc(search_term)
+        hits = (r.json().get("response") or {}).get("hits") or []
+        for hit in hits:
+            if hit.get("type") == "song" and (hit.get("result") or {}).get("url"):
+                return self._scrape_lyrics(hit["result"]["url"])
+        return None
+
+
+def _bound_requests(provider, timeout: float) -> None:
+    """Cap every HTTP request the provider makes at `timeout` seconds (connect and read)."""
+    request = provider.session.request
+
+    def bounded(method, url, **kwargs):
+        kwargs.setdefault("timeout", (min(2.0, timeout), timeout))
+        return request(method, url, **kwargs)
+
+    provider.session.request = bounded
+
+
+def build_providers(genius_token: str | None = None, providers: list[str] | None = None, timeout: float | None = None) -> list:
+    """
+    Fresh provider instances (no shared sessions) for one lookup.
+    With a timeout, each provider's HTTP requests give up after that many seconds.
+    """
+    factories = {
+        "musixmatch": Musixmatch,
+        "lrclib": Lrclib,
+        "netease": NetEase,
+        "megalobiz": Megalobiz,
+        "genius": lambda: GeniusProvider(access_token=genius_token),
+    }
+    names = providers or PROVIDER_NAMES
+    selected = []
+    for name in names:
+        factory = factories.get(name.lower())
+        if factory is None:
+            raise ValueError(f"Unknown lyric provider: {name}")
+        provider = factory()
+        if timeout is not None:
+            _bound_requests(provider, timeout)
+        selected.append(provider)
+    return selected
+
+
+def search(
+    search_term: str,
+    *,
+    genius_token: str | None = None,
+    providers: list[str] | None = None,
+    timeout: float | None = None,
+) -> str | None:
+    """
+    Drop-in replacement for syncedlyrics.search(term, providers=...) that
+    takes the Genius token explicitly. Prefers synced lyrics; returns plain
+    text if that is all any provider has. `timeout` bounds each provider's
+    HTTP requests so an abandoned search cannot hold its thread for long.
+    """
+    target_type = TargetType.PREFER_SYNCED
+    lrc = Lyrics()
+    for provider in build_providers(genius_token, providers, timeout):
+        try:
+            lrc.update(provider.get_lrc(search_term))
+        except Exception as e:
+            logger.warning("[syncedlyrics] %s failed for '%s': %s", provider, search_term, e)
+            continue
+        if lrc.is_preferred(target_type):
+            logger.info("[syncedlyrics] Lyrics found for '%s' on %s", search_term, provider)
+            break
+    if not lrc.is_acceptable(target_type):
+        return None
+    return lrc.to_str(target_type)
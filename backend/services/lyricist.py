@@ -7,21 +7,40 @@ Lyric fetching chain:
 3. Gemini AI audio transcription (analyze actual audio file)
 """
 
-import syncedlyrics
+import asyncio
 import re
 import os
+import time
 import logging
-from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from . import lyric_providers
 from .gemini_service import gemini_service
+from .lyric_cache import lyric_cache
+from utils.circuit_breaker import get_breaker
 from utils.lrc_validator import validate_lrc
 
 logger = logging.getLogger(__name__)
 
+# Timeout bounds (seconds) per lyric source; the breaker picks a value inside
+# them from observed p95 latency once it has enough samples.
+BREAKER_TIMEOUTS = {
+    "syncedlyrics": {"min_timeout": 5.0, "max_timeout": 60.0},
+    "gemini_research": {"default_timeout": 60.0, "min_timeout": 10.0, "max_timeout": 120.0},
+    "gemini_transcription": {"default_timeout": 180.0, "min_timeout": 30.0, "max_timeout": 600.0},
+}
+
+
 class LyricistService:
     def __init__(self):
-        self._last_syncedlyrics_reason = "not_found"
-        self._last_gemini_research_reason = "not_found"
-        self._last_gemini_transcription_reason = "not_found"
+        # Race each syncedlyrics provider separately instead of its sequential chain.
+        self.race_syncedlyrics_providers = os.getenv("LYRICVAULT_SYNCEDLYRICS_RACE_PROVIDERS", "0") == "1"
+        self.syncedlyrics_timeout_seconds = float(os.getenv("LYRICVAULT_SYNCEDLYRICS_TIMEOUT_SECONDS", "30"))
+        # Shared by every race so searches that lose (or time out) can't pile up threads.
+        self._syncedlyrics_executor = ThreadPoolExecutor(
+            max_workers=max(1, int(os.getenv("LYRICVAULT_SYNCEDLYRICS_WORKERS", "8"))),
+            thread_name_prefix="syncedlyrics",
+        )
 
     @staticmethod
     def _classify_source_error(error_text: str) -> str:
@@ -43,7 +62,132 @@ class LyricistService:
         text = re.sub(r"\(\s*\)", "", text)
         return text.strip()
 
-    def transcribe(self, track_name: str, artist_name: str, file_path: str = None, status_callback=None) -> dict | None:
+    def cache_key(self, track_name: str, artist_name: str) -> tuple[str, str]:
+        """Normalized (artist, title) under which provider results are cached."""
+        def normalize(value: str | None) -> str:
+            return " ".join(self.clean_text(value or "").casefold().split())
+        return normalize(artist_name), normalize(track_name)
+
+    def cache_provider(self, provider: str, model_id: str | None = None, file_path: str | None = None) -> str:
+        """
+        lyric_cache provider key for a lookup. Gemini results are scoped to the
+        model that produced them, and transcriptions to the audio file's
+        (size, mtime), so a different model or a replaced file is a cache miss.
+        """
+        if provider == "syncedlyrics":
+            return provider
+        key = f"{provider}:{model_id or gemini_service.model}"
+        if file_path:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                return key
+            key += f":{st.st_size}-{st.st_mtime_ns}"
+        return key
+
+    def _breaker(self, provider: str):
+        kwargs = dict(BREAKER_TIMEOUTS.get(provider, {}))
+        if provider == "syncedlyrics":
+            kwargs["default_timeout"] = self.syncedlyrics_timeout_seconds
+        return get_breaker(provider, **kwargs)
+
+    def _cache_hit(self, provider: str, artist_key: str, title_key: str):
+        cached = lyric_cache.get(artist_key, title_key, provider)
+        if cached is not None:
+            logger.info("[LyricCache] Hit for %s: %s - %s", provider, artist_key, title_key)
+        return cached
+
+    @staticmethod
+    def _cached_result(cached) -> tuple[str | None, str | None]:
+        if cached.lyrics:
+            return cached.lyrics, None
+        return None, cached.failure_reason or "not_found"
+
+    def _circuit_open(self, provider: str) -> str | None:
+        """The breaker's last failure reason while it is open, else None."""
+        breaker = self._breaker(provider)
+        if breaker.allow():
+            return None
+        logger.info(
+            "[%s] Circuit open after repeated failures; skipping (next probe in %.0fs)",
+            provider,
+            breaker.retry_after(),
+        )
+        return breaker.last_failure_reason or "source_unavailable"
+
+    def _record_outcome(self, provider: str, lyrics: str | None, reason: str | None, latency: float):
+        # "not_found" is a healthy answer; only outages and rate limits count against the source.
+        if lyrics or reason not in ("rate_limited", "source_unavailable"):
+            self._breaker(provider).record_success(latency)
+        else:
+            self._breaker(provider).record_failure(reason, latency)
+
+    def _store(self, provider: str, artist_key: str, title_key: str, lyrics: str | None, reason: str | None):
+        lyric_cache.put(
+            artist_key,
+            title_key,
+            provider,
+            lyrics,
+            is_synced=bool(lyrics and validate_lrc(lyrics)),
+            failure_reason=None if lyrics else reason,
+        )
+
+    def _cached_lookup(self, provider: str, track_name: str, artist_name: str, refresh: bool, fetch, cache_provider: str | None = None) -> tuple[str | None, str | None]:
+        """
+        Serve a provider result from lyric_cache, or run fetch() and store it.
+        fetch() and this method return (lyrics, None) or (None, failure_reason).
+        cache_provider overrides the cache key's provider (see cache_provider()).
+
+        Live fetches go through the provider's circuit breaker: while it is
+        open the provider is skipped instantly with its last failure reason.
+        """
+        artist_key, title_key = self.cache_key(track_name, artist_name)
+        cache_provider = cache_provider or provider
+        if not refresh:
+            cached = self._cache_hit(cache_provider, artist_key, title_key)
+            if cached is not None:
+                return self._cached_result(cached)
+
+        open_reason = self._circuit_open(provider)
+        if open_reason:
+            return None, open_reason
+
+        started = time.monotonic()
+        try:
+            lyrics, reason = fetch()
+        except Exception as e:
+            self._breaker(provider).record_failure(self._classify_source_error(str(e)), time.monotonic() - started)
+            raise
+        reason = None if lyrics else reason or "not_found"
+        self._record_outcome(provider, lyrics, reason, time.monotonic() - started)
+        self._store(cache_provider, artist_key, title_key, lyrics, reason)
+        return lyrics, reason
+
+    async def _cached_lookup_async(self, provider: str, track_name: str, artist_name: str, refresh: bool, fetch, cache_provider: str | None = None) -> tuple[str | None, str | None]:
+        """_cached_lookup for a coroutine fetch(); cache I/O runs in worker threads."""
+        artist_key, title_key = self.cache_key(track_name, artist_name)
+        cache_provider = cache_provider or provider
+        if not refresh:
+            cached = await asyncio.to_thread(self._cache_hit, cache_provider, artist_key, title_key)
+            if cached is not None:
+                return self._cached_result(cached)
+
+        open_reason = self._circuit_open(provider)
+        if open_reason:
+            return None, open_reason
+
+        started = time.monotonic()
+        try:
+            lyrics, reason = await fetch()
+        except Exception as e:
+            self._breaker(provider).record_failure(self._classify_source_error(str(e)), time.monotonic() - started)
+            raise
+        reason = None if lyrics else reason or "not_found"
+        self._record_outcome(provider, lyrics, reason, time.monotonic() - started)
+        await asyncio.to_thread(self._store, cache_provider, artist_key, title_key, lyrics, reason)
+        return lyrics, reason
+
+    def transcribe(self, track_name: str, artist_name: str, file_path: str = None, status_callback=None, refresh: bool = False) -> dict | None:
         """
         Fetch lyrics using a multi-source approach:
         1. Try syncedlyrics databases first (Musixmatch, Netease, etc.)
@@ -54,6 +198,7 @@ class LyricistService:
             track_name: Title of the song
             artist_name: Artist name
             file_path: Path to audio file (for transcription fallback)
+            refresh: Skip cached provider results (forced retries)
         
         Returns:
             dict with:
@@ -67,7 +212,13 @@ class LyricistService:
 
         # === Step 1: Try syncedlyrics ===
         if status_callback: status_callback("Searching lyric databases...")
-        lyrics = self._try_syncedlyrics(track_name, artist_name, status_callback)
+        lyrics, reason = self._cached_lookup(
+            "syncedlyrics",
+            track_name,
+            artist_name,
+            refresh,
+            lambda: self._try_syncedlyrics(track_name, artist_name, status_callback),
+        )
         if lyrics:
             if validate_lrc(lyrics):
                 return {"lyrics": lyrics, "source": "syncedlyrics", "is_synced": True, "failure_reason": None}
@@ -78,12 +229,12 @@ class LyricistService:
                 "failure_reason": None,
             }
         else:
-            source_failures.append(self._last_syncedlyrics_reason)
+            source_failures.append(reason)
         
         # === Step 2: Try Gemini AI research ===
         logger.info("syncedlyrics failed or invalid, trying Gemini research...")
         if status_callback: status_callback("Databases failed. Researching with AI...")
-        lyrics = self._try_gemini_research(track_name, artist_name, status_callback)
+        lyrics, reason = self._try_gemini_research(track_name, artist_name, status_callback, refresh=refresh)
         if lyrics:
             if validate_lrc(lyrics):
                 return {"lyrics": lyrics, "source": "gemini_research", "is_synced": True, "failure_reason": None}
@@ -94,13 +245,13 @@ class LyricistService:
                 "failure_reason": None,
             }
         else:
-            source_failures.append(self._last_gemini_research_reason)
+            source_failures.append(reason)
         
         # === Step 3: Try Gemini audio transcription ===
         if file_path:
             logger.info("Gemini research failed, trying audio transcription...")
             if status_callback: status_callback("Research failed. Listening to audio...")
-            lyrics = self._try_gemini_transcription(file_path, track_name, artist_name, status_callback)
+            lyrics, reason = self._try_gemini_transcription(file_path, track_name, artist_name, status_callback, refresh=refresh)
             if lyrics:
                 if validate_lrc(lyrics):
                     return {"lyrics": lyrics, "source": "gemini_transcription", "is_synced": True, "failure_reason": None}
@@ -111,7 +262,7 @@ class LyricistService:
                     "failure_reason": None,
                 }
             else:
-                source_failures.append(self._last_gemini_transcription_reason)
+                source_failures.append(reason)
         
         if fallback_unsynced:
             return fallback_unsynced
@@ -130,82 +281,163 @@ class LyricistService:
             "failure_reason": failure_reason,
         }
 
-    @staticmethod
-    @contextmanager
-    def _temp_env(var_name: str, value: str | None):
-        """Temporarily set an env var for libraries that only support env-based config."""
-        previous = os.environ.get(var_name)
-        try:
-            if value:
-                os.environ[var_name] = value
-            else:
-                os.environ.pop(var_name, None)
-            yield
-        finally:
-            if previous is None:
-                os.environ.pop(var_name, None)
-            else:
-                os.environ[var_name] = previous
-    
-    def _try_syncedlyrics(self, track_name: str, artist_name: str, status_callback=None) -> str | None:
-        """Try multiple search variations with syncedlyrics"""
-        from . import settings_service
-        creds = settings_service.get_genius_credentials()
-        genius_token = creds.get("access_token")
-        
-        self._last_syncedlyrics_reason = "not_found"
+    def _syncedlyrics_attempts(self, track_name: str, artist_name: str) -> list[tuple[str, str | None]]:
+        """(search term, provider) pairs to race; provider None means syncedlyrics' own chain."""
         search_terms = [
             f"{track_name} {artist_name}",
             f"{self.clean_text(track_name)} {artist_name}",
             f"{track_name}"
         ]
-        
+
         # Remove duplicates while preserving order
         unique_terms = []
         [unique_terms.append(x) for x in search_terms if x not in unique_terms]
 
-        for term in unique_terms:
-            logger.info("[syncedlyrics] Searching: %s", term)
-            try:
-                with self._temp_env("GENIUS_ACCESS_TOKEN", genius_token):
-                    lrc = syncedlyrics.search(term)
-                if lrc:
-                    # Validate immediately? Or let main loop do it. 
-                    # Main loop does it, but we could do it here to retry other terms?
-                    # Minimal change: let main loop handle validation failure by proceeding to next source.
-                    # But syncedlyrics usually returns one result. If it's invalid, we probably want to try next source, not next term?
-                    # Syncedlyrics usually returns good LRC or nothing.
-                    logger.info("[syncedlyrics] Found lyrics")
-                    return lrc
-            except Exception as e:
-                logger.warning("[syncedlyrics] Error: %s", e)
-                self._last_syncedlyrics_reason = self._classify_source_error(str(e))
-                
-        return None
+        if not self.race_syncedlyrics_providers:
+            return [(term, None) for term in unique_terms]
+        return [(term, provider) for term in unique_terms for provider in lyric_providers.PROVIDER_NAMES]
+
+    @staticmethod
+    def _search_syncedlyrics(term: str, provider: str | None, genius_token: str | None, timeout: float) -> str | None:
+        return lyric_providers.search(
+            term,
+            genius_token=genius_token,
+            providers=[provider] if provider else None,
+            timeout=timeout,
+        )
+
+    def _try_syncedlyrics(self, track_name: str, artist_name: str, status_callback=None) -> tuple[str | None, str | None]:
+        """
+        Race search-term variants (and optionally providers) concurrently.
+
+        The first result that passes validate_lrc wins; queued attempts are
+        cancelled and running ones end at their per-provider request timeout.
+        If nothing validates, the non-empty result from the most specific
+        attempt is returned so the caller can keep it as an unsynced fallback.
+        Returns (lyrics, None) or (None, failure_reason).
+        """
+        from . import settings_service
+        creds = settings_service.get_genius_credentials()
+        genius_token = creds.get("access_token")
+
+        reason = "not_found"
+        attempts = self._syncedlyrics_attempts(track_name, artist_name)
+        unsynced: dict[int, str] = {}
+        timeout_seconds = self._breaker("syncedlyrics").timeout()
+
+        futures = {}
+        for index, (term, provider) in enumerate(attempts):
+            logger.info("[syncedlyrics] Searching: %s%s", term, f" ({provider})" if provider else "")
+            future = self._syncedlyrics_executor.submit(
+                self._search_syncedlyrics, term, provider, genius_token, timeout_seconds
+            )
+            futures[future] = index
+        try:
+            for future in as_completed(futures, timeout=timeout_seconds):
+                try:
+                    lrc = future.result()
+                except Exception as e:
+                    logger.warning("[syncedlyrics] Error: %s", e)
+                    reason = self._classify_source_error(str(e))
+                    continue
+                if not lrc:
+                    continue
+                if validate_lrc(lrc):
+                    term, provider = attempts[futures[future]]
+                    logger.info("[syncedlyrics] Found synced lyrics for: %s%s", term, f" ({provider})" if provider else "")
+                    return lrc, None
+                unsynced[futures[future]] = lrc
+        except FuturesTimeoutError:
+            logger.warning(
+                "[syncedlyrics] Search timed out after %.1fs",
+                timeout_seconds,
+            )
+            if not unsynced:
+                reason = "source_unavailable"
+        finally:
+            for future in futures:
+                future.cancel()
+
+        if unsynced:
+            logger.info("[syncedlyrics] Found unsynced lyrics")
+            return unsynced[min(unsynced)], None
+        return None, reason
     
-    def _try_gemini_research(self, track_name: str, artist_name: str, status_callback=None, model_id: str | None = None) -> str | None:
+    def _try_gemini_research(self, track_name: str, artist_name: str, status_callback=None, model_id: str | None = None, refresh: bool = False) -> tuple[str | None, str | None]:
         """Try Gemini AI knowledge-based lyric lookup"""
         if not gemini_service.is_available():
             logger.info("[Gemini] Service not available (API key not set)")
-            self._last_gemini_research_reason = "source_unavailable"
-            return None
-             
-        logger.info("[Gemini] Researching lyrics for: %s by %s", track_name, artist_name)
-        lyrics = gemini_service.research_lyrics(track_name, artist_name, status_callback, model_id=model_id)
-        self._last_gemini_research_reason = gemini_service.get_last_failure_reason() or "not_found"
-        return lyrics
+            return None, "source_unavailable"
+
+        def fetch():
+            logger.info("[Gemini] Researching lyrics for: %s by %s", track_name, artist_name)
+            return gemini_service.research_lyrics(
+                track_name,
+                artist_name,
+                status_callback,
+                model_id=model_id,
+                breaker=self._breaker("gemini_research"),
+            )
+
+        return self._cached_lookup(
+            "gemini_research",
+            track_name,
+            artist_name,
+            refresh,
+            fetch,
+            self.cache_provider("gemini_research", model_id),
+        )
     
-    def _try_gemini_transcription(self, file_path: str, track_name: str, artist_name: str, status_callback=None, model_id: str | None = None) -> str | None:
+    async def _try_gemini_research_async(self, track_name: str, artist_name: str, status_callback=None, model_id: str | None = None, refresh: bool = False) -> tuple[str | None, str | None]:
+        """_try_gemini_research on the async, hedged Gemini client (for request handlers)."""
+        if not gemini_service.is_available():
+            logger.info("[Gemini] Service not available (API key not set)")
+            return None, "source_unavailable"
+
+        async def fetch():
+            logger.info("[Gemini] Researching lyrics for: %s by %s", track_name, artist_name)
+            return await gemini_service.research_lyrics_async(
+                track_name,
+                artist_name,
+                status_callback,
+                model_id=model_id,
+                breaker=self._breaker("gemini_research"),
+            )
+
+        return await self._cached_lookup_async(
+            "gemini_research",
+            track_name,
+            artist_name,
+            refresh,
+            fetch,
+            self.cache_provider("gemini_research", model_id),
+        )
+
+    def _try_gemini_transcription(self, file_path: str, track_name: str, artist_name: str, status_callback=None, model_id: str | None = None, refresh: bool = False) -> tuple[str | None, str | None]:
         """Try Gemini AI audio transcription"""
         if not gemini_service.is_available():
             logger.info("[Gemini] Service not available (API key not set)")
-            self._last_gemini_transcription_reason = "source_unavailable"
-            return None
-             
-        logger.info("[Gemini] Transcribing audio: %s", file_path)
-        lyrics = gemini_service.transcribe_audio(file_path, track_name, artist_name, status_callback, model_id=model_id)
-        self._last_gemini_transcription_reason = gemini_service.get_last_failure_reason() or "not_found"
-        return lyrics
+            return None, "source_unavailable"
+
+        def fetch():
+            logger.info("[Gemini] Transcribing audio: %s", file_path)
+            return gemini_service.transcribe_audio(
+                file_path,
+                track_name,
+                artist_name,
+                status_callback,
+                model_id=model_id,
+                breaker=self._breaker("gemini_transcription"),
+            )
+
+        return self._cached_lookup(
+            "gemini_transcription",
+            track_name,
+            artist_name,
+            refresh,
+            fetch,
+            self.cache_provider("gemini_transcription", model_id, file_path),
+        )
 
     def validate_genius_token(self, token: str) -> bool:
         """Lightweight validation for Genius Access Token."""
@@ -0,0 +1,166 @@
+"""
+AudioPrefetcher - Warms the audio cache for likely-next songs.
+
+Clients report what is playing (plus their up-next queue) and the prefetcher
+picks expired songs worth re-ingesting before the user reaches them:
+1. Explicit up-next queue (in order)
+2. Songs that previously followed the current song in recent play history
+3. Library next-up ordering (same order as /library)
+
+Prefetch ingests are queued at low job priority so user-initiated work always
+runs first, and nothing is queued once the downloads cache is over budget.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import Counter, deque
+
+from sqlalchemy.orm import Session
+
+from database import models
+
+logger = logging.getLogger(__name__)
+
+# Worker claims higher priority first; user-initiated jobs use the default 0.
+PREFETCH_JOB_PRIORITY = -10
+
+# Rough size of a 192 kbps MP3 (ingest output) per second of audio.
+_ESTIMATED_BYTES_PER_SECOND = 192_000 // 8
+_DEFAULT_ESTIMATED_BYTES = 8 * 1024 * 1024
+
+
+class AudioPrefetcher:
+    def __init__(self, downloads_dir: str | None = None):
+        # Keep downloads dir consistent with backend/main.py and services/ingestor.py (AppData).
+        app_data = os.environ.get("APPDATA", os.path.expanduser("~"))
+        self.downloads_dir = downloads_dir or os.path.join(app_data, "LyricVault", "downloads")
+        self.enabled = os.getenv("LYRICVAULT_PREFETCH_ENABLED", "1") == "1"
+        self.lookahead = int(os.getenv("LYRICVAULT_PREFETCH_LOOKAHEAD", "2"))
+        # How far down the library order to look for expired songs (cached ones are skipped).
+        self.library_window = 10
+        self.cache_budget_bytes = int(os.getenv("LYRICVAULT_AUDIO_CACHE_BUDGET_MB", "512")) * 1024 * 1024
+        # Don't hammer a source that just failed (or is still downloading) on every track change.
+        self.retry_cooldown_seconds = 10 * 60
+        self._audio_extensions = {
+            ".mp3", ".m4a", ".wav", ".flac", ".ogg", ".aac", ".opus", ".webm", ".mp4"
+        }
+        self._lock = threading.Lock()
+        self._history: deque[int] = deque(maxlen=200)
+        self._last_attempt: dict[int, float] = {}
+
+    def record_play(self, song_id: int) -> None:
+        """Append a play to the in-memory history (consecutive repeats collapse)."""
+        with self._lock:
+            if self._history and self._history[-1] == song_id:
+                return
+            self._history.append(song_id)
+
+    def recent_plays(self) -> list[int]:
+        with self._lock:
+            return list(self._history)
+
+    def _history_successors(self, song_id: int) -> list[int]:
+        """Songs that followed song_id in play history, most frequent first."""
+        history = self.recent_plays()
+        counts: Counter[int] = Counter()
+        for prev, current in zip(history, history[1:]):
+            if prev == song_id and current != song_id:
+                counts[current] += 1
+        return [candidate for candidate, _ in counts.most_common()]
+
+    def cache_usage_bytes(self) -> int:
+        if not os.path.isdir(self.downloads_dir):
+            return 0
+        total = 0
+        for entry in os.scandir(self.downloads_dir):
+            if not entry.is_file():
+                continue
+            _, ext = os.path.splitext(entry.name)
+            if ext.lower() not in self._audio_extensions:
+                continue
+            try:
+                total += entry.stat().st_size
+            except OSError:
+                continue
+        return total
+
+    @staticmethod
+    def _estimated_size(song: models.Song) -> int:
+        try:
+            seconds = float(song.duration or 0)
+        except (TypeError, ValueError):
+            seconds = 0
+        if seconds <= 0:
+            return _DEFAULT_ESTIMATED_BYTES
+        return int(seconds * _ESTIMATED_BYTES_PER_SECOND)
+
+    @staticmethod
+    def _is_expired(song: models.Song) -> bool:
+        return not (song.file_path and os.path.exists(song.file_path))
+
+    def _library_next_up(self, db: Session, song_id: int, limit: int) -> list[int]:
+        # /library lists songs by id descending, so "next" is the next lower id.
+        rows = (
+            db.query(models.Song.id)
+            .filter(models.Song.id < song_id)
+            .order_by(models.Song.id.desc())
+            .limit(limit)
+            .all()
+        )
+        return [row[0] for row in rows]
+
+    def plan(self, db: Session, current_song_id: int, queue_ids: list[int] | None = None) -> list[models.Song]:
+        """
+        Pick expired songs to re-ingest ahead of playback.
+
+        Returns at most `lookahead` songs, in the order they are likely to play,
+        that still fit inside the cache budget. Songs are not marked as attempted
+        here; the caller does that with record_attempt() once their job is queued.
+        """
+        if not self.enabled or self.lookahead <= 0:
+            return []
+
+        ordered: list[int] = []
+        for candidate in (
+            list(queue_ids or [])
+            + self._history_successors(current_song_id)
+            + self._library_next_up(db, current_song_id, self.library_window)
+        ):
+            if candidate != current_song_id and candidate not in ordered:
+                ordered.append(candidate)
+        if not ordered:
+            return []
+
+        remaining = self.cache_budget_bytes - self.cache_usage_bytes()
+        if remaining <= 0:
+            logger.info("[Prefetch] Cache over budget; skipping prefetch.")
+            return []
+
+        now = time.monotonic()
+        selected: list[models.Song] = []
+        for candidate in ordered:
+            if len(selected) >= self.lookahead:
+                break
+            song = db.get(models.Song, candidate)
+            if not song or not song.source_url or not self._is_expired(song):
+                continue
+            with self._lock:
+                last = self._last_attempt.get(song.id)
+                if last is not None and (now - last) < self.retry_cooldown_seconds:
+                    continue
+            estimate = self._estimated_size(song)
+            if estimate > remaining:
+                break
+            remaining -= estimate
+            selected.append(song)
+        return selected
+
+    def record_attempt(self, song_id: int) -> None:
+        """Start the retry cooldown; call once the prefetch job row is committed."""
+        with self._lock:
+            self._last_attempt[song_id] = time.monotonic()
+
+
+prefetcher = AudioPrefetcher()
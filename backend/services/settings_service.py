@@ -4,20 +4,42 @@ Stores user preferences including their Gemini API key in a JSON file
 in the OS-appropriate user data directory.
 """
 
+import copy
 import json
 import os
 import base64
 import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 
 from utils import dpapi
 
 
+_SETTINGS_LOCK = threading.RLock()
+# Re-stat settings.json at most this often; writes through this module update the cache directly.
+_STAT_INTERVAL_SECONDS = 1.0
+
+# Process-wide snapshot of settings.json, invalidated by file mtime/size.
+_cache_settings: dict | None = None
+_cache_signature: tuple | None = None
+_cache_checked_at = 0.0
+# Decrypted secrets keyed by stored ciphertext, so DPAPI/base64 decoding runs once per value.
+_SECRET_CACHE_MAX = 16
+_secret_cache: OrderedDict[str, str] = OrderedDict()
+_settings_dirs: dict[str, Path] = {}
+
+
 def _get_settings_dir() -> Path:
     """Get the LyricVault settings directory in the user's AppData."""
     app_data = os.environ.get("APPDATA", os.path.expanduser("~"))
-    settings_dir = Path(app_data) / "LyricVault"
-    settings_dir.mkdir(parents=True, exist_ok=True)
+    settings_dir = _settings_dirs.get(app_data)
+    if settings_dir is None:
+        settings_dir = Path(app_data) / "LyricVault"
+        settings_dir.mkdir(parents=True, exist_ok=True)
+        _settings_dirs[app_data] = settings_dir
     return settings_dir
 
 
@@ -25,23 +47,76 @@ def _get_settings_path() -> Path:
     return _get_settings_dir() / "settings.json"
 
 
-def _load_settings() -> dict:
-    """Load settings from disk."""
-    path = _get_settings_path()
+def _file_signature(path: Path) -> tuple:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (str(path), None, None)
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+def _read_settings_file(path: Path) -> dict:
     if path.exists():
         try:
             with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
         except (json.JSONDecodeError, IOError):
             return {}
     return {}
 
 
+def _snapshot() -> dict:
+    """
+    Return the cached settings dict. Callers must treat it as read-only;
+    use _load_settings() for a mutable copy.
+    """
+    global _cache_settings, _cache_signature, _cache_checked_at
+    path = _get_settings_path()
+    with _SETTINGS_LOCK:
+        now = time.monotonic()
+        if (
+            _cache_settings is not None
+            and _cache_signature is not None
+            and _cache_signature[0] == str(path)
+            and (now - _cache_checked_at) < _STAT_INTERVAL_SECONDS
+        ):
+            return _cache_settings
+
+        signature = _file_signature(path)
+        _cache_checked_at = now
+        if _cache_settings is None or signature != _cache_signature:
+            _cache_settings = _read_settings_file(path)
+            _cache_signature = signature
+        return _cache_settings
+
+
+def _load_settings() -> dict:
+    """Load settings (mutable copy of the cached snapshot)."""
+    return copy.deepcopy(_snapshot())
+
+
 def _save_settings(settings: dict):
-    """Save settings to disk."""
+    """Atomically write settings to disk and refresh the cache."""
+    global _cache_settings, _cache_signature, _cache_checked_at
     path = _get_settings_path()
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(settings, f, indent=2)
+    with _SETTINGS_LOCK:
+        fd, tmp_path = tempfile.mkstemp(prefix=".settings-", suffix=".tmp", dir=str(path.parent))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(settings, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        _cache_settings = copy.deepcopy(settings)
+        _cache_signature = _file_signature(path)
+        _cache_checked_at = time.monotonic()
 
 
 _DPAPI_PREFIX = "dpapi:"
@@ -65,11 +140,30 @@ def _obfuscate(value: str) -> str:
 
 
 def _deobfuscate(value: str) -> str:
-    """Reverse the persisted secret encoding."""
+    """Reverse the persisted secret encoding (memoized by ciphertext)."""
+    with _SETTINGS_LOCK:
+        cached = _secret_cache.get(value)
+        if cached is not None:
+            _secret_cache.move_to_end(value)
+            return cached
+
     if value.startswith(_DPAPI_PREFIX):
         raw = value[len(_DPAPI_PREFIX):]
-        return dpapi.unprotect(raw)
-    return base64.b64decode(value.encode("utf-8")).decode("utf-8")
+        plaintext = dpapi.unprotect(raw)
+    else:
+        plaintext = base64.b64decode(value.encode("utf-8")).decode("utf-8")
+
+    with _SETTINGS_LOCK:
+        _secret_cache[value] = plaintext
+        while len(_secret_cache) > _SECRET_CACHE_MAX:
+            _secret_cache.popitem(last=False)
+    return plaintext
+
+
+def _clear_secret_cache():
+    """Drop decrypted secrets; called whenever stored credentials change."""
+    with _SETTINGS_LOCK:
+        _secret_cache.clear()
 
 
 def _normalize_api_key(value: str | None) -> str | None:
@@ -85,6 +179,17 @@ def _normalize_api_key(value: str | None) -> str | None:
     return key or None
 
 
+def _stored_secret(name: str) -> str | None:
+    """Decrypted, normalized secret from settings.json."""
+    stored = _snapshot().get(name)
+    if not stored:
+        return None
+    try:
+        return _normalize_api_key(_deobfuscate(stored))
+    except Exception:
+        return _normalize_api_key(stored)  # Fallback: treat as plain text
+
+
 def _looks_like_gemini_api_key(value: str | None) -> bool:
     """
     Lightweight format check.
@@ -104,16 +209,12 @@ def get_gemini_api_key() -> str | None:
     2. GEMINI_API_KEY environment variable
     3. None (disabled)
     """
-    settings = _load_settings()
-    stored_key = settings.get("gemini_api_key")
-    if stored_key:
-        try:
-            key = _normalize_api_key(_deobfuscate(stored_key))
-        except Exception:
-            key = _normalize_api_key(stored_key)  # Fallback: treat as plain text
+    if _snapshot().get("gemini_api_key"):
+        key = _stored_secret("gemini_api_key")
         if _looks_like_gemini_api_key(key):
             return key
         # Cleanup stale/placeholder keys so status reflects reality.
+        settings = _load_settings()
         settings.pop("gemini_api_key", None)
         _save_settings(settings)
 
@@ -131,6 +232,7 @@ def set_gemini_api_key(key: str):
     settings = _load_settings()
     settings["gemini_api_key"] = _obfuscate(normalized)
     _save_settings(settings)
+    _clear_secret_cache()
 
 
 def delete_gemini_api_key():
@@ -138,6 +240,7 @@ def delete_gemini_api_key():
     settings = _load_settings()
     settings.pop("gemini_api_key", None)
     _save_settings(settings)
+    _clear_secret_cache()
 
 
 def get_genius_credentials() -> dict:
@@ -147,15 +250,11 @@ def get_genius_credentials() -> dict:
     1. settings.json
     2. Environment variables (GENIUS_CLIENT_ID, GENIUS_CLIENT_SECRET, GENIUS_ACCESS_TOKEN)
     """
-    settings = _load_settings()
-    
+    settings = _snapshot()
+
     def fetch(key, env_var):
-        stored = settings.get(key)
-        if stored:
-            try:
-                return _normalize_api_key(_deobfuscate(stored))
-            except Exception:
-                return _normalize_api_key(stored)
+        if settings.get(key):
+            return _stored_secret(key)
         return _normalize_api_key(os.getenv(env_var))
 
     creds = {
@@ -181,6 +280,7 @@ def set_genius_credentials(client_id: str = None, client_secret: str = None, acc
             settings["genius_access_token"] = _obfuscate(normalized)
 
     _save_settings(settings)
+    _clear_secret_cache()
 
 
 def delete_genius_credentials():
@@ -192,6 +292,7 @@ def delete_genius_credentials():
     settings.pop("genius_access_token", None)
     settings.pop("genius_api_key", None) # legacy cleanup
     _save_settings(settings)
+    _clear_secret_cache()
     
     os.environ.pop("GENIUS_ACCESS_TOKEN", None)
 
@@ -202,8 +303,7 @@ def get_strict_lrc_mode() -> bool:
     True  -> strict LRC only
     False -> allow unsynced/plain-text fallback
     """
-    settings = _load_settings()
-    value = settings.get("strict_lrc")
+    value = _snapshot().get("strict_lrc")
 
     if isinstance(value, bool):
         return value
@@ -234,8 +334,7 @@ def has_gemini_api_key() -> bool:
 
 def get_ytdlp_state() -> dict:
     """Read persisted yt-dlp maintenance state."""
-    settings = _load_settings()
-    raw_state = settings.get("ytdlp_state")
+    raw_state = _snapshot().get("ytdlp_state")
     state = dict(raw_state) if isinstance(raw_state, dict) else {}
     return {
         "last_known_good_version": state.get("last_known_good_version"),
@@ -334,13 +433,13 @@ def get_stable_gemini_model() -> str:
 
 def get_gemini_model() -> str:
     """Get the user's preferred Gemini model (defaults to gemini-2.0-flash)."""
-    settings = _load_settings()
-    selected = settings.get("gemini_model", DEFAULT_MODEL)
+    selected = _snapshot().get("gemini_model", DEFAULT_MODEL)
     valid_ids = {m["id"] for m in AVAILABLE_MODELS}
     if selected in valid_ids:
         return selected
 
     # Heal stale/invalid saved model IDs from older configs.
+    settings = _load_settings()
     settings["gemini_model"] = DEFAULT_MODEL
     _save_settings(settings)
     return DEFAULT_MODEL
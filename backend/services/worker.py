@@ -4,18 +4,34 @@ import json
 import socket
 import os
 from datetime import datetime, timedelta, timezone
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import text
 from database.database import SessionLocal
 from database import models
 from services.ingestor import ingestor
 from services.lyricist import lyricist
+from services.gemini_service import gemini_service
+from services.lyric_batch import lyric_batch
+from services.audio_preprocessor import audio_preprocessor
 from services import settings_service
-from utils.lrc_validator import validate_lrc
+from utils.lrc_validator import song_timeline, validate_lrc
 from utils.event_bus import publish as publish_event
+from utils.readiness import readiness
+from utils.audio_stream import last_access_timestamp
 
 logger = logging.getLogger(__name__)
 
+def _job_song_id(job):
+    """Song a job concerns (from its payload or result), for song-filtered event subscribers."""
+    for raw in (job.payload, job.result_json):
+        try:
+            value = json.loads(raw or "{}").get("song_id")
+        except (ValueError, AttributeError):
+            continue
+        if value is not None:
+            return value
+    return None
+
 def _normalize_duration_seconds(value):
     """Store duration as integer seconds in DB."""
     if value is None:
@@ -42,6 +58,9 @@ class Worker:
         self.cleanup_interval_seconds = 10 * 60
         self.audio_ttl_seconds = 60 * 60
         self.legacy_lyrics_batch_size = 25
+        # Legacy lyric candidates are scanned in id-ordered pages of this size so
+        # startup never loads every unsynced song (and its lyrics) at once.
+        self.legacy_scan_page_size = 200
         # Keep downloads dir consistent with backend/main.py and services/ingestor.py (AppData).
         app_data = os.environ.get("APPDATA", os.path.expanduser("~"))
         self.downloads_dir = os.path.join(app_data, "LyricVault", "downloads")
@@ -70,8 +89,15 @@ class Worker:
 
     def _run(self):
         # Startup: Requeue stale jobs
-        self._requeue_stale_jobs()
-        self._queue_legacy_unsynced_lyrics()
+        readiness.begin("maintenance")
+        try:
+            self._requeue_stale_jobs()
+            self._queue_legacy_unsynced_lyrics()
+        except Exception as e:
+            logger.error(f"Startup maintenance failed: {e}", exc_info=True)
+            readiness.fail("maintenance", e)
+        else:
+            readiness.done("maintenance")
         
         while not self._stop_event.is_set():
             try:
@@ -124,10 +150,14 @@ class Worker:
     def _cleanup_loop(self):
         # Run once at startup, then every cleanup interval.
         self._cleanup_cached_audio()
+        self._cleanup_gemini_uploads()
+        self._poll_lyric_batches()
         self._check_auto_maintenance()
         while not self._stop_event.wait(self.cleanup_interval_seconds):
             try:
                 self._cleanup_cached_audio()
+                self._cleanup_gemini_uploads()
+                self._poll_lyric_batches()
                 self._check_auto_maintenance()
             except Exception as e:
                 logger.error(f"Audio cleanup loop error: {e}", exc_info=True)
@@ -147,16 +177,17 @@ class Worker:
                 continue
 
             try:
-                modified_ts = entry.stat().st_mtime
+                last_used_ts = last_access_timestamp(entry.stat())
             except OSError:
                 continue
 
-            if (now_ts - modified_ts) < self.audio_ttl_seconds:
+            if (now_ts - last_used_ts) < self.audio_ttl_seconds:
                 continue
 
             absolute_path = os.path.abspath(entry.path)
             try:
                 os.remove(absolute_path)
+                audio_preprocessor.discard(absolute_path)
                 removed_paths.append(absolute_path)
                 logger.info(f"Removed expired cached audio: {absolute_path}")
             except FileNotFoundError:
@@ -183,6 +214,26 @@ class Worker:
         finally:
             db.close()
 
+    def _cleanup_gemini_uploads(self):
+        try:
+            gemini_service.cleanup_expired_uploads()
+        except Exception as e:
+            logger.warning(f"Gemini upload cleanup failed: {e}")
+
+    def _poll_lyric_batches(self):
+        try:
+            if not gemini_service.is_available():
+                return
+            applied, song_ids = lyric_batch.poll(gemini_service.client)
+        except Exception as e:
+            logger.warning(f"Lyric batch poll failed: {e}")
+            return
+        if song_ids:
+            publish_event("song", {"action": "lyrics_updated", "song_ids": song_ids})
+        if applied:
+            # Songs the batch couldn't sync now have cached research; queue their next jobs.
+            self._queue_legacy_unsynced_lyrics()
+
     def _requeue_stale_jobs(self):
         db = SessionLocal()
         try:
@@ -238,7 +289,12 @@ class Worker:
     def _queue_legacy_unsynced_lyrics(self):
         """
         On startup, queue bounded lyric-regeneration jobs for legacy songs that
-        still contain non-LRC text.
+        still contain non-LRC text. Candidates are read with a keyset cursor one
+        page at a time, and each page's changes are committed before the next.
+
+        While Gemini batch mode is available, songs without a cached research
+        result are researched in one batch first (see lyric_batch) and only
+        get a job once that result is in.
         """
         if not settings_service.get_strict_lrc_mode():
             return
@@ -255,53 +311,89 @@ class Worker:
                 if song_id is not None:
                     active_song_ids.add(song_id)
 
-            candidates = db.query(models.Song).filter(
-                models.Song.lyrics_synced == False,  # noqa: E712 - SQLAlchemy comparison
-                models.Song.lyrics.isnot(None),
-                models.Song.lyrics != "",
-                models.Song.lyrics != "Lyrics not found.",
-            ).order_by(models.Song.id.asc()).all()
+            batching = lyric_batch.enabled and gemini_service.is_available()
+            in_flight = lyric_batch.in_flight_song_ids() if batching else set()
+            to_batch: list[dict] = []
 
             healed_count = 0
             queued_count = 0
             processed_count = 0
-            for song in candidates:
-                if processed_count >= self.legacy_lyrics_batch_size:
+            last_song_id = 0
+            scanning = True
+            while scanning and not self._stop_event.is_set():
+                page = db.query(models.Song).options(joinedload(models.Song.artist)).filter(
+                    models.Song.id > last_song_id,
+                    models.Song.lyrics_synced == False,  # noqa: E712 - SQLAlchemy comparison
+                    models.Song.lyrics.isnot(None),
+                    models.Song.lyrics != "",
+                    models.Song.lyrics != "Lyrics not found.",
+                ).order_by(models.Song.id.asc()).limit(self.legacy_scan_page_size).all()
+                if not page:
                     break
-
-                lyrics_text = song.lyrics or ""
-                if validate_lrc(lyrics_text):
-                    song.lyrics_synced = True
-                    healed_count += 1
+                last_song_id = page[-1].id
+                existing_keys = {
+                    key for (key,) in db.query(models.Job.idempotency_key).filter(
+                        models.Job.idempotency_key.in_([f"lyrics_legacy_migrate_{song.id}" for song in page])
+                    )
+                }
+                unresearched = lyric_batch.unresearched_song_ids([
+                    {"song_id": song.id, "title": song.title, "artist": song.artist.name if song.artist else "Unknown"}
+                    for song in page
+                ]) if batching else set()
+
+                page_changed = False
+                for song in page:
+                    jobs_full = processed_count >= self.legacy_lyrics_batch_size
+                    if jobs_full and (not batching or len(to_batch) >= lyric_batch.max_songs):
+                        scanning = False
+                        break
+
+                    lyrics_text = song.lyrics or ""
+                    if validate_lrc(lyrics_text):
+                        song.lyrics_synced = True
+                        healed_count += 1
+                        processed_count += 1
+                        page_changed = True
+                        continue
+
+                    if song.id in active_song_ids or song.id in in_flight:
+                        continue
+
+                    idempotency_key = f"lyrics_legacy_migrate_{song.id}"
+                    if idempotency_key in existing_keys:
+                        continue
+
+                    artist_name = song.artist.name if song.artist else "Unknown"
+                    if song.id in unresearched:
+                        if len(to_batch) < lyric_batch.max_songs:
+                            to_batch.append({"song_id": song.id, "title": song.title, "artist": artist_name})
+                        continue
+                    if jobs_full:
+                        continue
+
+                    payload = {
+                        "song_id": song.id,
+                        "title": song.title,
+                        "artist": artist_name,
+                        "file_path": song.file_path,
+                    }
+                    db.add(models.Job(
+                        type="generate_lyrics",
+                        status="pending",
+                        title=f"Lyrics Migration: {payload['artist']} - {payload['title']}",
+                        idempotency_key=idempotency_key,
+                        payload=json.dumps(payload),
+                    ))
+                    queued_count += 1
                     processed_count += 1
-                    continue
-
-                if song.id in active_song_ids:
-                    continue
+                    page_changed = True
 
-                idempotency_key = f"lyrics_legacy_migrate_{song.id}"
-                existing = db.query(models.Job).filter(models.Job.idempotency_key == idempotency_key).first()
-                if existing:
-                    continue
-
-                payload = {
-                    "song_id": song.id,
-                    "title": song.title,
-                    "artist": song.artist.name if song.artist else "Unknown",
-                    "file_path": song.file_path,
-                }
-                db.add(models.Job(
-                    type="generate_lyrics",
-                    status="pending",
-                    title=f"Lyrics Migration: {payload['artist']} - {payload['title']}",
-                    idempotency_key=idempotency_key,
-                    payload=json.dumps(payload),
-                ))
-                queued_count += 1
-                processed_count += 1
+                if page_changed:
+                    db.commit()
+                # Drop the page's rows (and their lyrics) before reading the next one.
+                db.expunge_all()
 
             if healed_count or queued_count:
-                db.commit()
                 logger.info(
                     "Legacy lyric migration pass completed: healed=%s queued=%s batch_limit=%s",
                     healed_count,
@@ -311,9 +403,13 @@ class Worker:
         except Exception as e:
             db.rollback()
             logger.error(f"Legacy lyric migration pass failed: {e}", exc_info=True)
+            to_batch = []
         finally:
             db.close()
 
+        if to_batch:
+            lyric_batch.submit(gemini_service.client, gemini_service.model, to_batch)
+
     def _check_auto_maintenance(self):
         """No-op: yt-dlp updates ship with signed app releases (no runtime self-update)."""
         return
@@ -338,7 +434,7 @@ class Worker:
                     WHERE (status='pending' OR status='retrying')
                       AND available_at <= :now
                       AND retry_count < max_retries
-                    ORDER BY created_at ASC 
+                    ORDER BY COALESCE(priority, 0) DESC, created_at ASC
                     LIMIT 1
                 )
                 RETURNING id
@@ -362,7 +458,17 @@ class Worker:
                 return False
 
             logger.info(f"[{self.worker_id}] Claimed job {job.id} ({job.type}) - {job.title or 'No Title'}")
-            publish_event("job", {"id": job.id, "type": job.type, "status": job.status, "title": job.title, "progress": job.progress})
+            publish_event(
+                "job",
+                {
+                    "id": job.id,
+                    "type": job.type,
+                    "status": job.status,
+                    "title": job.title,
+                    "progress": job.progress,
+                    "song_id": _job_song_id(job),
+                },
+            )
 
             heartbeat_stop = threading.Event()
             heartbeat_thread = threading.Thread(
@@ -440,6 +546,7 @@ class Worker:
                     "max_retries": job.max_retries,
                     "last_error": job.last_error,
                     "result_json": job.result_json,
+                    "song_id": _job_song_id(job),
                 },
             )
             return True
@@ -558,6 +665,7 @@ class Worker:
         file_path = payload.get("file_path")
         mode = payload.get("mode", "auto")
         model_id = payload.get("model_id")
+        refresh = bool(payload.get("refresh"))
 
         if not job.title and title:
             job.title = f"Lyrics: {artist or 'Unknown'} - {title}"
@@ -572,32 +680,24 @@ class Worker:
         if mode == "transcribe":
             if not file_path or not os.path.exists(file_path):
                 raise ValueError("Audio file not found for transcription.")
-            lyrics = lyricist._try_gemini_transcription(file_path, title, artist, model_id=model_id)
+            lyrics, failure_reason = lyricist._try_gemini_transcription(file_path, title, artist, model_id=model_id, refresh=refresh)
             source = "gemini_transcription"
             is_synced = bool(lyrics and validate_lrc(lyrics))
-            if not lyrics:
-                failure_reason = lyricist._last_gemini_transcription_reason
         elif mode == "research":
-            lyrics = lyricist._try_gemini_research(title, artist, model_id=model_id)
+            lyrics, failure_reason = lyricist._try_gemini_research(title, artist, model_id=model_id, refresh=refresh)
             source = "gemini_research"
             is_synced = bool(lyrics and validate_lrc(lyrics))
-            if not lyrics:
-                failure_reason = lyricist._last_gemini_research_reason
         elif model_id:
             # Respect explicit model selection when manually queued.
-            lyrics = lyricist._try_gemini_research(title, artist, model_id=model_id)
+            lyrics, failure_reason = lyricist._try_gemini_research(title, artist, model_id=model_id, refresh=refresh)
             source = "gemini_research"
             is_synced = bool(lyrics and validate_lrc(lyrics))
-            if not lyrics:
-                failure_reason = lyricist._last_gemini_research_reason
             if not lyrics and file_path and os.path.exists(file_path):
-                lyrics = lyricist._try_gemini_transcription(file_path, title, artist, model_id=model_id)
+                lyrics, failure_reason = lyricist._try_gemini_transcription(file_path, title, artist, model_id=model_id, refresh=refresh)
                 source = "gemini_transcription"
                 is_synced = bool(lyrics and validate_lrc(lyrics))
-                if not lyrics:
-                    failure_reason = lyricist._last_gemini_transcription_reason
         else:
-            outcome = lyricist.transcribe(title, artist, file_path)
+            outcome = lyricist.transcribe(title, artist, file_path, refresh=refresh)
             if isinstance(outcome, dict):
                 lyrics = outcome.get("lyrics")
                 source = outcome.get("source", "auto")
@@ -611,7 +711,7 @@ class Worker:
 
         song = db.get(models.Song, song_id)
         if song:
-            existing_synced = bool(song.lyrics_synced and song.lyrics and validate_lrc(song.lyrics))
+            existing_synced = bool(song.lyrics_synced and song.lyrics and song_timeline(song.id, song.lyrics).is_valid())
             if lyrics and is_synced:
                 song.lyrics = lyrics
                 song.lyrics_synced = True
@@ -43,11 +43,11 @@ def test_research_lyrics_keeps_event_loop_responsive(monkeypatch):
     )
     db = FakeDB(song)
 
-    def blocking_research(*_args, **_kwargs):
-        time.sleep(0.25)
-        return "Line 1\nLine 2"
+    async def slow_research(*_args, **_kwargs):
+        await asyncio.sleep(0.25)
+        return "Line 1\nLine 2", None
 
-    monkeypatch.setattr(lyricist, "_try_gemini_research", blocking_research)
+    monkeypatch.setattr(lyricist, "_try_gemini_research_async", slow_research)
     # Make test deterministic regardless of persisted user settings.
     monkeypatch.setattr(settings_service, "get_strict_lrc_mode", lambda: False)
 
@@ -55,7 +55,7 @@ def test_lyric_research():
     _print_header("TEST 2: Lyric Research")
     _require_service_or_skip()
 
-    lyrics = gemini_service.research_lyrics("Bohemian Rhapsody", "Queen")
+    lyrics, _reason = gemini_service.research_lyrics("Bohemian Rhapsody", "Queen")
     assert lyrics is not None, "No lyrics returned from Gemini research."
     assert len(lyrics) >= 100, "Lyrics output is unexpectedly short."
     print("PASS: Successfully retrieved lyrics")
@@ -72,7 +72,7 @@ def test_audio_transcription():
         pytest.skip("No mp3 file found in backend/downloads for transcription test.")
 
     print(f"Testing with: {Path(audio_file).name}")
-    lyrics = gemini_service.transcribe_audio(audio_file, "Test Song", "Test Artist")
+    lyrics, _reason = gemini_service.transcribe_audio(audio_file, "Test Song", "Test Artist")
     assert lyrics is not None, "No transcription returned from Gemini."
     assert len(lyrics) >= 50, "Transcription output is unexpectedly short."
     print("PASS: Successfully transcribed audio")
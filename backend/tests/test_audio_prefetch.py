@@ -0,0 +1,160 @@
+import sys
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from database import models
+import services.worker as worker_module
+from services.prefetcher import AudioPrefetcher
+from services.worker import Worker
+
+
+def _build_test_session(tmp_path):
+    db_path = tmp_path / "prefetch_test.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"check_same_thread": False},
+    )
+    session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    models.Base.metadata.create_all(bind=engine)
+    return session_local
+
+
+def _seed_songs(db, count: int, cached_dir: Path | None = None, cached: tuple[int, ...] = ()):
+    """Add `count` songs; those at the `cached` positions get an audio file in cached_dir."""
+    artist = models.Artist(name=f"prefetch-artist-{uuid.uuid4().hex}")
+    db.add(artist)
+    db.flush()
+    ids = []
+    for i in range(count):
+        song = models.Song(
+            title=f"prefetch-song-{i}",
+            artist_id=artist.id,
+            source_url=f"https://www.youtube.com/watch?v={uuid.uuid4().hex[:11]}",
+            duration=180,
+            lyrics_synced=False,
+        )
+        db.add(song)
+        db.flush()
+        ids.append(song.id)
+    for index in cached:
+        path = cached_dir / f"cached-{ids[index]}.mp3"
+        path.write_bytes(b"audio")
+        db.get(models.Song, ids[index]).file_path = str(path)
+    db.commit()
+    return ids
+
+
+def test_plan_prefers_queue_then_history_then_library(tmp_path):
+    session_local = _build_test_session(tmp_path)
+    db = session_local()
+    try:
+        ids = _seed_songs(db, 6)
+        prefetcher = AudioPrefetcher(downloads_dir=str(tmp_path))
+        prefetcher.lookahead = 3
+
+        current = ids[5]
+        # History says ids[0] usually follows the current song.
+        for song_id in (current, ids[0], ids[2], current, ids[0]):
+            prefetcher.record_play(song_id)
+
+        planned = [song.id for song in prefetcher.plan(db, current, queue_ids=[ids[1]])]
+        assert planned == [ids[1], ids[0], ids[4]]
+    finally:
+        db.close()
+
+
+def test_plan_skips_cached_songs_and_honors_budget_and_cooldown(tmp_path):
+    session_local = _build_test_session(tmp_path)
+    db = session_local()
+    try:
+        ids = _seed_songs(db, 4, cached_dir=tmp_path, cached=(2,))
+
+        prefetcher = AudioPrefetcher(downloads_dir=str(tmp_path))
+        prefetcher.lookahead = 2
+
+        first = [song.id for song in prefetcher.plan(db, ids[3])]
+        assert first == [ids[1], ids[0]]
+
+        # Planning alone doesn't start the cooldown; only a queued job does.
+        assert [song.id for song in prefetcher.plan(db, ids[3])] == first
+        for song_id in first:
+            prefetcher.record_attempt(song_id)
+        assert prefetcher.plan(db, ids[3]) == []
+
+        prefetcher.cache_budget_bytes = 0
+        prefetcher.retry_cooldown_seconds = 0
+        assert prefetcher.plan(db, ids[3]) == []
+    finally:
+        db.close()
+
+
+def test_worker_claims_user_jobs_before_prefetch_jobs(monkeypatch, tmp_path):
+    session_local = _build_test_session(tmp_path)
+    monkeypatch.setattr(worker_module, "SessionLocal", session_local)
+
+    db = session_local()
+    try:
+        now = datetime.now(timezone.utc)
+        prefetch_job = models.Job(
+            type="maintenance_update_ytdlp",
+            status="pending",
+            priority=-10,
+            idempotency_key=f"prefetch-{uuid.uuid4().hex}",
+            payload="{}",
+            available_at=now,
+            created_at=now,
+        )
+        db.add(prefetch_job)
+        db.commit()
+        user_job = models.Job(
+            type="maintenance_update_ytdlp",
+            status="pending",
+            idempotency_key=f"user-{uuid.uuid4().hex}",
+            payload="{}",
+            available_at=now,
+        )
+        db.add(user_job)
+        db.commit()
+        prefetch_id, user_id = prefetch_job.id, user_job.id
+    finally:
+        db.close()
+
+    worker = Worker(worker_id="prefetch_priority_worker")
+    assert worker._process_one_job() is True
+
+    db = session_local()
+    try:
+        assert db.get(models.Job, user_id).status == "failed"
+        assert db.get(models.Job, prefetch_id).status == "pending"
+    finally:
+        db.close()
+
+
+def test_failed_enqueue_does_not_start_cooldown(monkeypatch, tmp_path):
+    import main as main_module
+
+    session_local = _build_test_session(tmp_path)
+    db = session_local()
+    try:
+        ids = _seed_songs(db, 3)
+        prefetcher = AudioPrefetcher(downloads_dir=str(tmp_path))
+        prefetcher.lookahead = 1
+        monkeypatch.setattr(main_module, "prefetcher", prefetcher)
+
+        def failing_enqueue(*_args, **_kwargs):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(main_module, "_enqueue_ingest_job", failing_enqueue)
+        request = main_module.NowPlayingRequest(song_id=ids[2])
+        assert main_module.report_now_playing(request, db)["prefetching"] == []
+        assert [song.id for song in prefetcher.plan(db, ids[2])] == [ids[1]]
+    finally:
+        db.close()
@@ -0,0 +1,125 @@
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+import services.audio_preprocessor as preprocessor_module
+from services.audio_preprocessor import AudioPreprocessor
+from services.prefetcher import AudioPrefetcher
+from utils.lrc_validator import shift_lrc, validate_lrc
+
+SILENCEDETECT_OUTPUT = """
+  Duration: 00:03:20.00, start: 0.000000, bitrate: 192 kb/s
+[silencedetect @ 0x1] silence_start: 0
+[silencedetect @ 0x1] silence_end: 2.5 | silence_duration: 2.5
+[silencedetect @ 0x1] silence_start: 61.2
+[silencedetect @ 0x1] silence_end: 62.0 | silence_duration: 0.8
+[silencedetect @ 0x1] silence_start: 195.4
+"""
+
+
+class FakeFfmpeg:
+    def __init__(self):
+        self.encodes = []
+
+    def __call__(self, args):
+        if "null" in args:
+            return SimpleNamespace(returncode=0, stderr=SILENCEDETECT_OUTPUT)
+        self.encodes.append(args)
+        Path(args[-1]).write_bytes(b"small")
+        return SimpleNamespace(returncode=0, stderr="")
+
+
+def _preprocessor(monkeypatch, tmp_path, trim: bool = False) -> tuple[AudioPreprocessor, FakeFfmpeg]:
+    fake = FakeFfmpeg()
+    processor = AudioPreprocessor(cache_dir=str(tmp_path / "transcribe_cache"))
+    processor.enabled = True
+    processor.trim_silence = trim
+    monkeypatch.setattr(preprocessor_module, "_ffmpeg_executable", lambda: "ffmpeg")
+    monkeypatch.setattr(processor, "_run", fake)
+    return processor, fake
+
+
+def _source(tmp_path) -> str:
+    downloads = tmp_path / "downloads"
+    downloads.mkdir(exist_ok=True)
+    path = downloads / "song.mp3"
+    path.write_bytes(b"x" * 4096)
+    return str(path)
+
+
+def test_downmixes_resamples_and_caches_outside_downloads(monkeypatch, tmp_path):
+    processor, fake = _preprocessor(monkeypatch, tmp_path)
+    source = _source(tmp_path)
+
+    prepared = processor.prepare(source)
+    assert Path(prepared.path).parent == tmp_path / "transcribe_cache"
+    assert Path(prepared.path).name.startswith("song-")
+    assert prepared.path.endswith(".transcribe.mp3")
+    assert prepared.offset_ms == 0
+    args = fake.encodes[0]
+    assert args[args.index("-ac") + 1] == "1"
+    assert args[args.index("-ar") + 1] == "16000"
+    assert "-ss" not in args
+
+    assert processor.prepare(source) == prepared
+    assert len(fake.encodes) == 1
+
+    st = os.stat(source)
+    os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    processor.prepare(source)
+    assert len(fake.encodes) == 2
+
+    processor.discard(source)
+    assert list((tmp_path / "transcribe_cache").iterdir()) == []
+    assert [p.name for p in (tmp_path / "downloads").iterdir()] == ["song.mp3"]
+
+
+def test_derivatives_do_not_count_against_prefetch_budget(monkeypatch, tmp_path):
+    processor, _ = _preprocessor(monkeypatch, tmp_path)
+    source = _source(tmp_path)
+    prefetcher = AudioPrefetcher(downloads_dir=str(tmp_path / "downloads"))
+    before = prefetcher.cache_usage_bytes()
+
+    processor.prepare(source)
+    assert prefetcher.cache_usage_bytes() == before == os.path.getsize(source)
+
+
+def test_trim_records_leading_offset(monkeypatch, tmp_path):
+    processor, fake = _preprocessor(monkeypatch, tmp_path, trim=True)
+    prepared = processor.prepare(_source(tmp_path))
+
+    args = fake.encodes[0]
+    assert args[args.index("-ss") + 1] == "2.500"
+    assert args[args.index("-t") + 1] == "192.900"
+    assert prepared.offset_ms == 2500
+
+    transcribed = "\n".join(f"[00:0{i}.00] line {i}" for i in range(1, 7))
+    shifted = shift_lrc(transcribed, prepared.offset_ms)
+    assert shifted.splitlines()[0] == "[00:03.50] line 1"
+    assert validate_lrc(shifted)
+
+
+def test_ffmpeg_failure_falls_back_to_source(monkeypatch, tmp_path):
+    processor, _ = _preprocessor(monkeypatch, tmp_path)
+    monkeypatch.setattr(processor, "_run", lambda args: SimpleNamespace(returncode=1, stderr="bad input"))
+    source = _source(tmp_path)
+
+    assert processor.prepare(source).path == source
+    assert [p.name for p in (tmp_path / "downloads").iterdir()] == ["song.mp3"]
+    assert list((tmp_path / "transcribe_cache").iterdir()) == []
+
+
+def test_split_windows_overlap_and_cleanup(monkeypatch, tmp_path):
+    processor, fake = _preprocessor(monkeypatch, tmp_path)
+    source = _source(tmp_path)
+
+    with processor.split_windows(source, 250.0, 120.0, 10.0) as windows:
+        assert [w.start_ms for w in windows] == [0, 110_000, 220_000]
+        assert all(os.path.isfile(w.path) for w in windows)
+        assert fake.encodes[1][fake.encodes[1].index("-ss") + 1] == "110.000"
+    assert not any(os.path.exists(w.path) for w in windows)
@@ -0,0 +1,83 @@
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from main import DOWNLOADS_DIR, app
+from utils import audio_stream
+
+
+def _write_audio(payload: bytes) -> Path:
+    path = Path(DOWNLOADS_DIR) / f"range-{uuid.uuid4().hex}.mp3"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(payload)
+    return path
+
+
+def test_stream_serves_byte_ranges_with_strong_etag():
+    payload = bytes(range(256)) * 40
+    path = _write_audio(payload)
+    try:
+        with TestClient(app) as client:
+            full = client.get(f"/stream/{path.name}")
+            assert full.status_code == 200
+            assert full.content == payload
+            assert full.headers["accept-ranges"] == "bytes"
+            assert full.headers["cache-control"]
+            etag = full.headers["etag"]
+            assert etag.startswith('"') and not etag.startswith("W/")
+
+            partial = client.get(f"/stream/{path.name}", headers={"Range": "bytes=100-199"})
+            assert partial.status_code == 206
+            assert partial.content == payload[100:200]
+            assert partial.headers["content-range"] == f"bytes 100-199/{len(payload)}"
+
+            suffix = client.get(f"/stream/{path.name}", headers={"Range": "bytes=-10"})
+            assert suffix.status_code == 206
+            assert suffix.content == payload[-10:]
+
+            open_ended = client.get(f"/stream/{path.name}", headers={"Range": f"bytes={len(payload) - 5}-"})
+            assert open_ended.content == payload[-5:]
+
+            unsatisfiable = client.get(f"/stream/{path.name}", headers={"Range": f"bytes={len(payload)}-"})
+            assert unsatisfiable.status_code == 416
+            assert unsatisfiable.headers["content-range"] == f"bytes */{len(payload)}"
+
+            not_modified = client.get(f"/stream/{path.name}", headers={"If-None-Match": etag})
+            assert not_modified.status_code == 304
+            assert not_modified.headers["etag"] == etag and not_modified.content == b""
+
+            head = client.head(f"/stream/{path.name}", headers={"Range": "bytes=0-9"})
+            assert head.status_code == 206 and head.headers["content-length"] == "10"
+
+            stale_if_range = client.get(
+                f"/stream/{path.name}",
+                headers={"Range": "bytes=0-9", "If-Range": '"stale"'},
+            )
+            assert stale_if_range.status_code == 200
+            assert stale_if_range.content == payload
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def test_stream_records_last_access_without_touching_mtime():
+    path = _write_audio(b"recent-play")
+    old = time.time() - 7200
+    os.utime(path, (old, old))
+    try:
+        with TestClient(app) as client:
+            res = client.get(f"/stream/{path.name}", headers={"Range": "bytes=0-3"})
+        assert res.status_code == 206
+
+        st = os.stat(path)
+        assert abs(st.st_mtime - old) < 1
+        assert time.time() - audio_stream.last_access_timestamp(st) < 60
+    finally:
+        path.unlink(missing_ok=True)
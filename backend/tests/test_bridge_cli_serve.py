@@ -0,0 +1,95 @@
+import io
+import json
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+import tools.bridge_cli as bridge_cli
+
+
+def _serve(monkeypatch, lines, actions, workers=4):
+    idle = SimpleNamespace(resolve=lambda: None)
+    monkeypatch.setattr(bridge_cli, "ingestor", idle)
+    monkeypatch.setattr(bridge_cli, "lyricist", idle)
+    monkeypatch.setattr(bridge_cli, "ACTIONS", actions)
+    stdout = io.StringIO()
+    assert bridge_cli.serve(io.StringIO("\n".join(lines) + "\n"), stdout, workers=workers) == 0
+    return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+
+def test_requests_run_concurrently_and_answer_as_they_complete(monkeypatch):
+    release_slow = threading.Event()
+
+    def slow(payload):
+        assert release_slow.wait(5)
+        return "slow"
+
+    def fast(payload):
+        release_slow.set()
+        return payload["n"]
+
+    responses = _serve(
+        monkeypatch,
+        [
+            json.dumps({"id": "a", "action": "slow"}),
+            json.dumps({"id": "b", "action": "fast", "payload": {"n": 2}}),
+        ],
+        {"slow": slow, "fast": fast},
+    )
+
+    assert responses == [
+        {"id": "b", "ok": True, "data": 2},
+        {"id": "a", "ok": True, "data": "slow"},
+    ]
+
+
+def test_bad_requests_get_tagged_errors(monkeypatch):
+    def fail(payload):
+        raise ValueError("Missing required field: url")
+
+    responses = _serve(
+        monkeypatch,
+        [
+            "not json",
+            "",
+            json.dumps({"id": 1, "action": "unknown"}),
+            json.dumps({"id": 2, "action": "fail"}),
+            json.dumps({"id": 3, "action": "fail", "payload": []}),
+        ],
+        {"fail": fail},
+        workers=1,
+    )
+
+    assert responses[0]["id"] is None and not responses[0]["ok"]
+    assert {response["id"]: response["error"] for response in responses[1:]} == {
+        1: "Unknown action: unknown",
+        2: "Missing required field: url",
+        3: "Payload must be a JSON object",
+    }
+
+
+def test_concurrent_research_requests_keep_their_own_failure_reason(monkeypatch):
+    both_started = threading.Barrier(2, timeout=5)
+    reasons = {"Slow Song": "rate_limited", "Missing Song": "not_found"}
+
+    def research(title, artist, model_id=None, refresh=False):
+        both_started.wait()
+        return None, reasons[title]
+
+    lyricist = SimpleNamespace(resolve=lambda: None, _try_gemini_research=research)
+    monkeypatch.setattr(bridge_cli, "ingestor", SimpleNamespace(resolve=lambda: None))
+    monkeypatch.setattr(bridge_cli, "lyricist", lyricist)
+    stdout = io.StringIO()
+    lines = [
+        json.dumps({"id": title, "action": "research_lyrics", "payload": {"title": title, "mode": "research"}})
+        for title in reasons
+    ]
+    assert bridge_cli.serve(io.StringIO("\n".join(lines) + "\n"), stdout, workers=2) == 0
+
+    responses = {r["id"]: r["data"]["failure_reason"] for r in map(json.loads, stdout.getvalue().splitlines())}
+    assert responses == reasons
@@ -0,0 +1,97 @@
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+import services.gemini_service as gemini_module
+from services.audio_preprocessor import AudioWindow, PreparedAudio
+from services.gemini_service import GeminiService
+from utils.lrc_stitch import stitch_chunks
+from utils.lrc_validator import validate_lrc
+
+
+def test_stitch_offsets_windows_and_drops_overlap_duplicates():
+    chunks = [
+        (0, "[00:05.00] one\n[00:50.00] two\n[01:54.90] seam line\n[01:59.00] heard twice"),
+        (110_000, "[00:05.10] Seam line!\n[00:09.00] heard twice\n[00:20.00] three\n"),
+        (220_000, "[Chorus]\n[00:08.00] four\n[00:30.00] five"),
+    ]
+    stitched = stitch_chunks(chunks, overlap_ms=10_000)
+
+    assert stitched.splitlines() == [
+        "[00:05.00] one",
+        "[00:50.00] two",
+        "[01:54.90] seam line",
+        "[01:59.00] heard twice",
+        "[02:10.00] three",
+        "[03:48.00] four",
+        "[04:10.00] five",
+    ]
+    assert validate_lrc(stitched)
+
+
+def test_stitch_keeps_timestamps_strictly_increasing():
+    stitched = stitch_chunks([(0, "[00:01.001] a\n[00:01.005] b\n[00:02.00] c\n[00:03.00] d\n[00:04.00] e")], 0)
+    assert stitched.splitlines()[:2] == ["[00:01.00] a", "[00:01.01] b"]
+    assert validate_lrc(stitched)
+
+
+class FakeWindowModels:
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def generate_content(self, *, model, contents, config=None):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.2)
+        with self._lock:
+            self.active -= 1
+        index = int(contents[1].inline_data.data.decode())
+        text = "\n".join(f"[00:{10 * n:02d}.00] window {index} line {n}" for n in range(1, 6))
+        return SimpleNamespace(candidates=[SimpleNamespace(finish_reason="STOP")], text=text)
+
+
+def test_long_track_windows_are_transcribed_concurrently(monkeypatch, tmp_path):
+    audio = tmp_path / "long.mp3"
+    audio.write_bytes(b"audio")
+    window_paths = []
+    for index in range(4):
+        path = tmp_path / f"window-{index}.mp3"
+        path.write_bytes(str(index).encode())
+        window_paths.append(AudioWindow(path=str(path), start_ms=index * 110_000))
+
+    @contextmanager
+    def fake_split(path, duration, window_seconds, overlap_seconds):
+        yield window_paths
+
+    preprocessor = gemini_module.audio_preprocessor
+    monkeypatch.setattr(preprocessor, "prepare", lambda path, callback=None: PreparedAudio(path=path))
+    monkeypatch.setattr(preprocessor, "probe_duration", lambda path: 450.0)
+    monkeypatch.setattr(preprocessor, "split_windows", fake_split)
+    monkeypatch.setattr(gemini_module.gemini_scheduler, "enabled", False)
+    monkeypatch.setenv("LYRICVAULT_TRANSCRIBE_CHUNKING", "auto")
+
+    service = GeminiService()
+    models = FakeWindowModels()
+    service.client = SimpleNamespace(models=models)
+    monkeypatch.setattr(service, "is_available", lambda: True)
+
+    start = time.perf_counter()
+    result, _reason = service.transcribe_audio(str(audio), "Song", "Artist")
+    elapsed = time.perf_counter() - start
+
+    assert models.peak == 4
+    assert elapsed < 0.6
+    assert validate_lrc(result)
+    lines = result.splitlines()
+    assert lines[0] == "[00:10.00] window 0 line 1"
+    assert "[05:40.00] window 3 line 1" in lines
@@ -0,0 +1,92 @@
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+import services.gemini_service as gemini_module
+import services.lyricist as lyricist_module
+from services.gemini_service import GeminiService
+from services.lyricist import LyricistService
+from utils import circuit_breaker
+from utils.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+
+
+def test_breaker_opens_then_half_open_probe_closes_it():
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure("source_unavailable")
+    assert breaker.allow()
+    breaker.record_failure("source_unavailable")
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+
+    time.sleep(0.06)
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()  # Only one probe at a time.
+
+    breaker.record_failure("rate_limited")
+    assert breaker.state == OPEN
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_success(0.1)
+    assert breaker.state == CLOSED
+
+
+def test_timeout_tracks_p95_latency_within_bounds():
+    breaker = CircuitBreaker("test", default_timeout=30.0, min_timeout=1.0, max_timeout=10.0)
+    assert breaker.timeout() == 30.0
+    for latency in [0.5] * 19 + [2.0]:
+        breaker.record_success(latency)
+    assert breaker.latency_percentile(95) == 0.5
+    assert breaker.timeout() == 1.0
+
+    for _ in range(5):
+        breaker.record_success(20.0)
+    assert breaker.timeout() == 10.0
+
+
+def test_open_breaker_skips_source_without_calling_it(monkeypatch):
+    monkeypatch.setattr(circuit_breaker, "_breakers", {})
+    monkeypatch.setattr(lyricist_module.lyric_cache, "enabled", False)
+    gemini = lyricist_module.gemini_service
+    calls = []
+
+    def failing_research(*_args, **_kwargs):
+        calls.append(1)
+        return None, "rate_limited"
+
+    monkeypatch.setattr(gemini, "is_available", lambda: True)
+    monkeypatch.setattr(gemini, "research_lyrics", failing_research)
+
+    service = LyricistService()
+    for _ in range(3):
+        assert service._try_gemini_research("Song", "Artist") == (None, "rate_limited")
+    assert len(calls) == 3
+
+    start = time.perf_counter()
+    assert service._try_gemini_research("Song", "Artist") == (None, "rate_limited")
+    assert time.perf_counter() - start < 0.1
+    assert len(calls) == 3
+
+
+def test_retry_ladder_stops_once_breaker_is_open(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(gemini_module.time, "sleep", lambda seconds: sleeps.append(seconds))
+    breaker = CircuitBreaker("gemini_research", failure_threshold=1, reset_timeout=60)
+    attempts = []
+
+    def call():
+        attempts.append(1)
+        if len(attempts) == 1:
+            breaker.record_failure("rate_limited")  # Another job trips the breaker meanwhile.
+        raise Exception("429 Resource exhausted")
+
+    with pytest.raises(Exception):
+        GeminiService._call_with_retry(object(), call, breaker=breaker)
+    assert attempts == [1]
+    assert sleeps == []
@@ -0,0 +1,211 @@
+import asyncio
+import itertools
+import json
+import sys
+from collections import OrderedDict, deque
+from pathlib import Path
+
+import pytest
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from utils import event_bus
+
+
+@pytest.fixture(autouse=True)
+def fresh_bus(monkeypatch):
+    monkeypatch.setattr(event_bus, "_subscribers", set())
+    monkeypatch.setattr(event_bus, "_history", deque(maxlen=5))
+    monkeypatch.setattr(event_bus, "_last_id", 1000)
+    monkeypatch.setattr(event_bus, "_pending", OrderedDict())
+    monkeypatch.setattr(event_bus, "_unkeyed", itertools.count(1))
+    monkeypatch.setattr(event_bus, "_barrier", 0)
+    monkeypatch.setattr(event_bus, "_coalesce_seconds", 0.0)
+
+
+def _events(items):
+    events = []
+    for item in items:
+        # Queue frames are (id, data); replay backlogs hold Event records.
+        parsed = json.loads(item.payload if isinstance(item, event_bus.Event) else item[1])
+        events.extend(parsed if isinstance(parsed, list) else [parsed])
+    return [event["data"]["n"] for event in events]
+
+
+def _drain(sub):
+    items = []
+    while not sub.queue.empty():
+        items.append(sub.queue.get_nowait())
+    return items
+
+
+def test_ids_increase_and_are_buffered_without_subscribers():
+    event_bus.publish("job", {"n": 1})
+    event_bus.publish("job", {"n": 2})
+
+    assert [event.id for event in event_bus._history] == [1001, 1002]
+    assert event_bus.last_event_id() == 1002
+
+
+def test_resume_replays_only_missed_events_then_streams_live():
+    async def scenario():
+        for n in range(1, 4):
+            event_bus.publish("job", {"n": n})
+        sub = event_bus.subscribe(last_event_id=1001)
+        event_bus.publish("job", {"n": 4})
+        await asyncio.sleep(0)
+        return sub
+
+    sub = asyncio.run(scenario())
+    assert sub.replay_complete
+    assert _events(sub.backlog) == [2, 3]
+    assert _events(_drain(sub)) == [4]
+
+
+def test_resume_replays_through_the_subscription_filter():
+    event_bus.publish("job", {"id": 1, "type": "ingest_audio", "n": 1})
+    event_bus.publish("job", {"id": 2, "type": "generate_lyrics", "song_id": 9, "n": 2})
+
+    async def scenario():
+        lyric_jobs = event_bus.EventFilter(job_types=frozenset({"generate_lyrics"}))
+        return event_bus.subscribe(last_event_id=1000, event_filter=lyric_jobs)
+
+    assert _events(asyncio.run(scenario()).backlog) == [2]
+
+
+def test_resume_from_expired_or_foreign_id_requests_resync():
+    for n in range(1, 9):
+        event_bus.publish("job", {"n": n})
+
+    async def subscribe(last_id):
+        sub = event_bus.subscribe(last_event_id=last_id)
+        event_bus.unsubscribe(sub)
+        return sub
+
+    # The buffer holds 1004..1008, so resuming after 1003 is still gap-free.
+    assert asyncio.run(subscribe(1003)).replay_complete
+    assert not asyncio.run(subscribe(1002)).replay_complete
+    # An id ahead of this process (e.g. before a restart with a clock change) cannot be trusted.
+    assert not asyncio.run(subscribe(5000)).replay_complete
+    caught_up = asyncio.run(subscribe(1008))
+    assert caught_up.replay_complete and caught_up.backlog == []
+
+    # The resync notice carries the current id, so resuming from it is gap-free.
+    expired = asyncio.run(subscribe(1002))
+    assert expired.resync_id == 1008
+    assert asyncio.run(subscribe(expired.resync_id)).replay_complete
+
+
+def test_full_queue_marks_overflow_instead_of_dropping_silently():
+    async def scenario():
+        sub = event_bus.subscribe(max_queue=2)
+        for n in range(1, 5):
+            event_bus.publish("job", {"n": n})
+        await asyncio.sleep(0)
+        return sub
+
+    sub = asyncio.run(scenario())
+    assert sub.overflowed
+    assert _events(_drain(sub)) == [1, 2]
+
+
+def test_window_coalesces_job_updates_into_one_batch(monkeypatch):
+    # Hold events in the window; the test flushes by hand instead of the background thread.
+    monkeypatch.setattr(event_bus, "_coalesce_seconds", 60.0)
+    monkeypatch.setattr(event_bus, "_flusher_started", True)
+
+    async def scenario():
+        subs = [event_bus.subscribe(), event_bus.subscribe()]
+        event_bus.publish("job", {"id": 7, "progress": 20, "n": 1})
+        event_bus.publish("song", {"action": "lyrics_updated", "n": 2})
+        event_bus.publish("job", {"id": 7, "progress": 60, "n": 3})
+        event_bus.publish("job", {"id": 8, "progress": 10, "n": 4})
+        assert subs[0].queue.empty()
+        event_bus.flush()
+        await asyncio.sleep(0)
+        return subs
+
+    subs = asyncio.run(scenario())
+    for sub in subs:
+        batches = _drain(sub)
+        assert len(batches) == 1
+        assert batches[0][0] == 1004
+        # Job 7's updates don't collapse across the song event, which isn't coalesced.
+        assert _events(batches) == [1, 2, 3, 4]
+    assert [event.id for event in event_bus._history] == [1001, 1002, 1003, 1004]
+
+
+def test_coalesced_update_moves_to_its_latest_publish_position(monkeypatch):
+    monkeypatch.setattr(event_bus, "_coalesce_seconds", 60.0)
+    monkeypatch.setattr(event_bus, "_flusher_started", True)
+
+    async def scenario():
+        sub = event_bus.subscribe()
+        event_bus.publish("job", {"id": 7, "progress": 20, "n": 1})
+        event_bus.publish("job", {"id": 8, "progress": 10, "n": 2})
+        event_bus.publish("job", {"id": 7, "progress": 60, "n": 3})
+        event_bus.publish("song", {"action": "lyrics_updated", "n": 4})
+        event_bus.publish("job", {"id": 7, "progress": 100, "n": 5})
+        event_bus.flush()
+        await asyncio.sleep(0)
+        return sub
+
+    sub = asyncio.run(scenario())
+    assert _events(_drain(sub)) == [2, 3, 4, 5]
+
+
+def test_deliveries_are_scheduled_once_per_loop(monkeypatch):
+    calls = []
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        original = loop.call_soon_threadsafe
+
+        def counting(callback, *args):
+            calls.append(callback)
+            return original(callback, *args)
+
+        monkeypatch.setattr(loop, "call_soon_threadsafe", counting)
+        subs = [event_bus.subscribe() for _ in range(3)]
+        event_bus.publish("job", {"id": 1, "n": 1})
+        await asyncio.sleep(0)
+        return subs
+
+    subs = asyncio.run(scenario())
+    assert len(calls) == 1
+    assert all(_events(_drain(sub)) == [1] for sub in subs)
+
+
+def test_filters_are_applied_before_enqueueing():
+    async def scenario():
+        everything = event_bus.subscribe()
+        one_song = event_bus.subscribe(event_filter=event_bus.EventFilter(song_ids=frozenset({42})))
+        one_job = event_bus.subscribe(
+            event_filter=event_bus.EventFilter(topics=frozenset({"job"}), job_ids=frozenset({5}))
+        )
+        event_bus.publish("job", {"id": 5, "type": "generate_lyrics", "song_id": 42, "n": 1})
+        event_bus.publish("job", {"id": 6, "type": "ingest_audio", "song_id": None, "n": 2})
+        event_bus.publish("song", {"action": "lyrics_updated", "song_ids": [41, 42], "n": 3})
+        event_bus.publish("song", {"action": "cache_expired", "song_ids": [7], "n": 4})
+        await asyncio.sleep(0)
+        return everything, one_song, one_job
+
+    everything, one_song, one_job = asyncio.run(scenario())
+    assert _events(_drain(everything)) == [1, 2, 3, 4]
+    assert _events(_drain(one_song)) == [1, 3]
+    assert _events(_drain(one_job)) == [1]
+
+
+def test_idle_filtered_subscribers_do_not_wake_their_loop(monkeypatch):
+    calls = []
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        monkeypatch.setattr(loop, "call_soon_threadsafe", lambda *args: calls.append(args))
+        event_bus.subscribe(event_filter=event_bus.EventFilter(topics=frozenset({"song"})))
+        event_bus.publish("job", {"id": 1, "n": 1})
+
+    asyncio.run(scenario())
+    assert calls == []
@@ -0,0 +1,33 @@
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from main import _event_filter
+from utils.event_bus import EventFilter
+
+
+def test_query_params_build_an_event_filter():
+    event_filter = _event_filter("job, song", "3,4", "42", "generate_lyrics")
+
+    assert event_filter == EventFilter(
+        topics=frozenset({"job", "song"}),
+        job_ids=frozenset({3, 4}),
+        song_ids=frozenset({42}),
+        job_types=frozenset({"generate_lyrics"}),
+    )
+
+
+def test_no_params_means_unfiltered():
+    assert _event_filter(None, None, "", None) is None
+
+
+def test_non_numeric_ids_are_rejected():
+    with pytest.raises(HTTPException) as excinfo:
+        _event_filter(None, "abc", None, None)
+    assert excinfo.value.status_code == 400
@@ -0,0 +1,104 @@
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+import services.gemini_service as gemini_module
+from services.gemini_service import GeminiService
+from utils.circuit_breaker import CircuitBreaker
+
+
+LYRICS = "\n".join(f"Line {i} of a song that is long enough to count as lyrics" for i in range(5))
+
+
+def _response(text=LYRICS):
+    return SimpleNamespace(candidates=[SimpleNamespace(finish_reason="STOP")], text=text)
+
+
+class FakeAioModels:
+    """Async generate_content with a per-model delay (or exception)."""
+
+    def __init__(self, behaviour: dict):
+        self.behaviour = behaviour
+        self.calls = []
+        self.cancelled = []
+
+    async def generate_content(self, *, model, contents, config=None):
+        self.calls.append(model)
+        delay, outcome = self.behaviour[model]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(model)
+            raise
+        if isinstance(outcome, Exception):
+            raise outcome
+        return _response(outcome)
+
+
+def _service(monkeypatch, behaviour):
+    service = GeminiService()
+    models = FakeAioModels(behaviour)
+    service.client = SimpleNamespace(aio=SimpleNamespace(models=models))
+    monkeypatch.setattr(gemini_module.gemini_scheduler, "enabled", False)
+    monkeypatch.setattr(gemini_module, "get_stable_gemini_model", lambda: "stable")
+    monkeypatch.setattr(gemini_module, "get_gemini_model", lambda: "primary")
+    monkeypatch.setattr(gemini_module, "HEDGE_DEFAULT_AFTER_SECONDS", 0.05)
+    return service, models
+
+
+def test_slow_request_is_hedged_to_stable_model(monkeypatch):
+    service, models = _service(monkeypatch, {"primary": (5.0, LYRICS), "stable": (0.01, LYRICS + "\nhedged")})
+
+    result, reason = asyncio.run(service.research_lyrics_async("Song", "Artist"))
+
+    assert result.endswith("hedged") and reason is None
+    assert models.calls == ["primary", "stable"]
+    assert models.cancelled == ["primary"]
+
+
+def test_fast_request_is_not_hedged(monkeypatch):
+    service, models = _service(monkeypatch, {"primary": (0.0, LYRICS), "stable": (0.0, LYRICS)})
+
+    assert asyncio.run(service.research_lyrics_async("Song", "Artist")) == (LYRICS, None)
+    assert models.calls == ["primary"]
+
+
+def test_hedge_threshold_follows_breaker_p95(monkeypatch):
+    breaker = CircuitBreaker("gemini_research")
+    for latency in (1.0, 1.0, 1.0, 1.0, 2.0):
+        breaker.record_success(latency)
+    assert GeminiService._hedge_after(breaker) == 2.0
+    assert GeminiService._hedge_after(CircuitBreaker("fresh")) == gemini_module.HEDGE_DEFAULT_AFTER_SECONDS
+
+    monkeypatch.setenv("LYRICVAULT_GEMINI_HEDGE", "0")
+    assert GeminiService._hedge_after(breaker) is None
+
+
+def test_unavailable_model_falls_back_without_waiting_for_hedge(monkeypatch):
+    persisted = []
+    monkeypatch.setattr(gemini_module, "set_gemini_model", lambda model_id: persisted.append(model_id))
+    service, models = _service(
+        monkeypatch,
+        {"primary": (0.0, Exception("404 model primary is not found")), "stable": (0.0, LYRICS)},
+    )
+    monkeypatch.setattr(gemini_module, "HEDGE_DEFAULT_AFTER_SECONDS", 10.0)
+
+    assert asyncio.run(service.research_lyrics_async("Song", "Artist")) == (LYRICS, None)
+    assert models.calls == ["primary", "stable"]
+    assert persisted == ["stable"]
+
+
+def test_both_attempts_failing_reports_reason(monkeypatch):
+    service, models = _service(
+        monkeypatch,
+        {"primary": (0.1, Exception("connection reset")), "stable": (0.0, Exception("connection reset"))},
+    )
+    monkeypatch.setattr(gemini_module, "MAX_RETRIES", 0)
+
+    assert asyncio.run(service.research_lyrics_async("Song", "Artist")) == (None, "source_unavailable")
+    assert models.calls == ["primary", "stable"]
@@ -0,0 +1,93 @@
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+import services.gemini_service as gemini_module
+from services.gemini_service import GeminiService
+
+GOOD_KEY = "AIza" + "g" * 35
+BAD_KEY = "AIza" + "b" * 35
+
+
+class FakeClient:
+    built: list[str] = []
+
+    def __init__(self, *, api_key, http_options=None):
+        FakeClient.built.append(api_key)
+        self.api_key = api_key
+        self.calls = 0
+        self.models = SimpleNamespace(generate_content=self._generate)
+
+    def _generate(self, **_kwargs):
+        self.calls += 1
+        if self.api_key == BAD_KEY:
+            raise Exception("400 API key not valid. Please pass a valid API key.")
+        if getattr(self, "rate_limited", False):
+            raise Exception("429 Resource has been exhausted")
+        return "ok"
+
+
+def _service(monkeypatch, stored_key=None):
+    FakeClient.built = []
+    settings = {"key": stored_key}
+    monkeypatch.setattr(gemini_module.genai, "Client", FakeClient)
+    monkeypatch.setattr(gemini_module, "get_gemini_api_key", lambda: settings["key"])
+    return GeminiService(), settings
+
+
+def test_validation_is_cached_per_key(monkeypatch):
+    service, _ = _service(monkeypatch)
+
+    assert service.validate_key(GOOD_KEY) is True
+    assert service.validate_key(GOOD_KEY) is True
+    assert service.validate_key(BAD_KEY) is False
+    assert service.validate_key(BAD_KEY) is False
+    assert service._last_validation_error == "Authentication failed. Please check your API key."
+    assert FakeClient.built == [GOOD_KEY, BAD_KEY]
+
+
+def test_expired_validation_calls_the_api_again(monkeypatch):
+    service, _ = _service(monkeypatch)
+    service.validation_ttl_seconds = 0
+
+    service.validate_key(GOOD_KEY)
+    service.validate_key(GOOD_KEY)
+    # Re-validated, but through the client already built for that key.
+    assert service._client_for_key(GOOD_KEY).calls == 2
+    assert FakeClient.built == [GOOD_KEY]
+
+
+def test_transient_failures_are_not_cached(monkeypatch):
+    service, _ = _service(monkeypatch)
+    client = service._client_for_key(GOOD_KEY)
+    client.rate_limited = True
+
+    assert service.validate_key(GOOD_KEY) is False
+    client.rate_limited = False
+    assert service.validate_key(GOOD_KEY) is True
+    assert client.calls == 2
+
+
+def test_client_is_rebuilt_only_when_key_changes(monkeypatch):
+    service, settings = _service(monkeypatch, stored_key=GOOD_KEY)
+    original = service.client
+
+    service.reload()
+    assert service.client is original
+
+    # Validating then saving a new key adopts the client built for validation.
+    other_key = "AIza" + "o" * 35
+    assert service.validate_key(other_key) is True
+    settings["key"] = other_key
+    service.reload()
+    assert service.client is not original
+    assert service.client.api_key == other_key
+    assert FakeClient.built == [GOOD_KEY, other_key]
+
+    settings["key"] = None
+    service.reload()
+    assert service.client is None
@@ -12,7 +12,8 @@ from services.gemini_service import GeminiService
 def test_model_fallback_retries_with_stable_model(monkeypatch):
     service = GeminiService()
 
-    monkeypatch.setattr(service, "_call_with_retry", lambda fn: fn())
+    monkeypatch.setattr(service, "_call_with_retry", lambda fn, **_kwargs: fn())
+    monkeypatch.setattr(gemini_module.gemini_scheduler, "enabled", False)
     monkeypatch.setattr(gemini_module, "get_stable_gemini_model", lambda: "gemini-2.0-flash")
     persisted = []
     monkeypatch.setattr(gemini_module, "set_gemini_model", lambda model_id: persisted.append(model_id))
@@ -0,0 +1,114 @@
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+import services.gemini_service as gemini_module
+from services.gemini_scheduler import GeminiQuotaExceeded, GeminiScheduler, parse_rate_limit
+from services.gemini_service import GeminiService
+import utils.rate_limiter as rate_limiter_module
+from utils.rate_limiter import TokenBucket
+
+
+def test_parse_rate_limit_from_model_metadata():
+    assert parse_rate_limit("15 RPM / 1,500 RPD") == (15, 1500)
+    assert parse_rate_limit("5 RPM / 200 RPD") == (5, 200)
+    assert parse_rate_limit("unlimited") is None
+
+
+def test_reservations_queue_behind_each_other():
+    bucket = TokenBucket()
+    args = {"capacity": 1, "refill_per_sec": 20.0}
+    waits = [bucket.reserve("model", **args)[1] for _ in range(3)]
+    assert waits[0] == 0
+    assert waits[1] == pytest.approx(0.05, abs=0.01)
+    assert waits[2] == pytest.approx(0.10, abs=0.01)
+    assert bucket.estimate_wait("model", **args) == pytest.approx(0.15, abs=0.01)
+
+
+def test_daily_limit_persists_across_restarts(tmp_path):
+    state_path = str(tmp_path / "quota.json")
+    args = {"capacity": 10, "refill_per_sec": 10.0, "daily_limit": 2}
+    bucket = TokenBucket(state_path=state_path)
+    assert bucket.reserve("model", **args) == (True, 0.0)
+    assert bucket.reserve("model", **args) == (True, 0.0)
+
+    restarted = TokenBucket(state_path=state_path)
+    assert restarted.daily_count("model") == 2
+    reserved, wait = restarted.reserve("model", max_wait=60, **args)
+    assert reserved is False
+    assert 0 < wait <= 86400
+    assert restarted.daily_count("model") == 2
+
+
+def test_reservation_pushed_past_midnight_keeps_todays_cap(monkeypatch, tmp_path):
+    midnight = 20000 * 86400.0
+    clock = SimpleNamespace(monotonic=time.monotonic, time=lambda: midnight - 10)
+    monkeypatch.setattr(rate_limiter_module, "time", clock)
+    state_path = str(tmp_path / "quota.json")
+    args = {"capacity": 10, "refill_per_sec": 10.0, "daily_limit": 2}
+    bucket = TokenBucket(state_path=state_path)
+    assert bucket.reserve("model", **args) == (True, 0.0)
+    assert bucket.reserve("model", **args) == (True, 0.0)
+
+    reserved, wait = bucket.reserve("model", **args)
+    assert reserved is True
+    assert wait == pytest.approx(10)
+    assert bucket.daily_count("model") == 2
+    assert bucket.estimate_wait("model", **args) == pytest.approx(10)
+
+    # Tomorrow fills up too, so the next slot is the day after.
+    assert bucket.reserve("model", **args)[1] == pytest.approx(10)
+    assert bucket.reserve("model", **args)[1] == pytest.approx(86400 + 10)
+
+    restarted = TokenBucket(state_path=state_path)
+    assert restarted.daily_count("model") == 2
+    clock.time = lambda: midnight + 1
+    assert restarted.daily_count("model") == 2
+    assert restarted.estimate_wait("model", **args) == pytest.approx(86400 - 1)
+
+
+def _scheduler(tmp_path, monkeypatch, rpm: int, rpd: int) -> GeminiScheduler:
+    scheduler = GeminiScheduler(state_path=str(tmp_path / "gemini_quota.json"))
+    monkeypatch.setattr(scheduler, "limits_for", lambda _model_id: (rpm, rpd))
+    monkeypatch.setattr(gemini_module, "gemini_scheduler", scheduler)
+    return scheduler
+
+
+def test_requests_are_paced_at_the_rpm_ceiling(monkeypatch, tmp_path):
+    scheduler = _scheduler(tmp_path, monkeypatch, rpm=1200, rpd=1000)  # One slot every 50ms.
+    service = GeminiService()
+    sent = []
+
+    def call_builder(model_name):
+        sent.append(time.monotonic())
+        return {"ok": True}
+
+    statuses = []
+    for _ in range(3):
+        service._call_with_model_fallback(call_builder, "gemini-2.0-flash", status_callback=statuses.append)
+
+    assert sent[2] - sent[0] >= 0.09
+    assert any("quota" in status for status in statuses)
+    assert scheduler.status("gemini-2.0-flash")["used_today"] == 3
+
+
+def test_exhausted_quota_fails_fast_without_calling_api(monkeypatch, tmp_path):
+    scheduler = _scheduler(tmp_path, monkeypatch, rpm=60, rpd=1)
+    scheduler.max_wait_seconds = 5
+    service = GeminiService()
+    sent = []
+
+    service._call_with_model_fallback(lambda model: sent.append(model), "gemini-2.0-flash")
+    assert scheduler.expected_wait("gemini-2.0-flash") > 5
+
+    with pytest.raises(GeminiQuotaExceeded) as excinfo:
+        service._call_with_model_fallback(lambda model: sent.append(model), "gemini-2.0-flash")
+    assert len(sent) == 1
+    assert GeminiService._classify_failure_reason(str(excinfo.value)) == "rate_limited"
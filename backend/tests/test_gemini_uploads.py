@@ -0,0 +1,130 @@
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+from google.genai import types
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+import services.gemini_service as gemini_module
+from services.gemini_service import GeminiService
+from services.gemini_uploads import GeminiUploadCache
+
+
+class FakeFiles:
+    """Local stand-in for the Files API: reads uploads from disk in chunks like the SDK."""
+
+    def __init__(self):
+        self.files: dict[str, types.File] = {}
+        self.uploads = []
+        self.deleted = []
+
+    def upload(self, *, file, config=None):
+        assert isinstance(file, str), "uploads must stream from a path, not in-memory bytes"
+        size = 0
+        with open(file, "rb") as f:
+            for chunk in iter(lambda: f.read(64 * 1024), b""):
+                size += len(chunk)
+        name = f"files/{len(self.uploads) + 1}"
+        self.uploads.append(file)
+        uploaded = types.File(
+            name=name,
+            uri=f"https://files.example/{name}",
+            mime_type=config.mime_type,
+            size_bytes=size,
+            state="ACTIVE",
+            expiration_time=datetime.now(timezone.utc) + timedelta(hours=48),
+        )
+        self.files[name] = uploaded
+        return uploaded
+
+    def get(self, *, name):
+        if name not in self.files:
+            raise Exception(f"404 File {name} not found")
+        return self.files[name]
+
+    def delete(self, *, name):
+        self.deleted.append(name)
+        self.files.pop(name, None)
+
+
+class FakeModels:
+    def __init__(self):
+        self.contents = []
+
+    def generate_content(self, *, model, contents, config=None):
+        self.contents.append(contents)
+        candidate = SimpleNamespace(finish_reason="STOP")
+        return SimpleNamespace(candidates=[candidate], text="[00:01.00] transcribed")
+
+
+def _service(monkeypatch, tmp_path):
+    uploads = GeminiUploadCache(registry_path=str(tmp_path / "uploads.json"))
+    monkeypatch.setattr(gemini_module, "gemini_uploads", uploads)
+    monkeypatch.setattr(gemini_module.gemini_scheduler, "enabled", False)
+    monkeypatch.setattr(gemini_module, "INLINE_AUDIO_MAX_BYTES", 1024)
+    monkeypatch.setattr(gemini_module.audio_preprocessor, "enabled", False)
+    monkeypatch.delenv("LYRICVAULT_GEMINI_UPLOAD_MODE", raising=False)
+    monkeypatch.setenv("LYRICVAULT_TRANSCRIBE_CHUNKING", "off")
+    service = GeminiService()
+    service.client = SimpleNamespace(files=FakeFiles(), models=FakeModels())
+    monkeypatch.setattr(service, "is_available", lambda: True)
+    return service, uploads
+
+
+def _audio(tmp_path, name="song.mp3", size=200_000) -> str:
+    path = tmp_path / name
+    path.write_bytes(b"\x01" * size)
+    return str(path)
+
+
+def test_large_audio_is_uploaded_once_and_reused(monkeypatch, tmp_path):
+    service, _ = _service(monkeypatch, tmp_path)
+    path = _audio(tmp_path)
+
+    assert service.transcribe_audio(path, "Song", "Artist") == ("[00:01.00] transcribed", None)
+    assert service.transcribe_audio(path, "Song", "Artist") == ("[00:01.00] transcribed", None)
+
+    assert service.client.files.uploads == [path]
+    for contents in service.client.models.contents:
+        audio_part = contents[1]
+        assert audio_part.inline_data is None
+        assert audio_part.file_data.file_uri == "https://files.example/files/1"
+
+
+def test_small_audio_stays_inline(monkeypatch, tmp_path):
+    service, _ = _service(monkeypatch, tmp_path)
+    path = _audio(tmp_path, size=512)
+
+    service.transcribe_audio(path, "Song", "Artist")
+    assert service.client.files.uploads == []
+    assert service.client.models.contents[0][1].inline_data.data == b"\x01" * 512
+
+
+def test_missing_remote_upload_is_replaced(monkeypatch, tmp_path):
+    service, _ = _service(monkeypatch, tmp_path)
+    path = _audio(tmp_path)
+
+    service.transcribe_audio(path, "Song", "Artist")
+    service.client.files.files.clear()
+    service.transcribe_audio(path, "Song", "Artist")
+    assert len(service.client.files.uploads) == 2
+
+
+def test_cleanup_prunes_expired_uploads(monkeypatch, tmp_path):
+    service, uploads = _service(monkeypatch, tmp_path)
+    path = _audio(tmp_path)
+    service.transcribe_audio(path, "Song", "Artist")
+
+    registry = json.loads(Path(uploads.registry_path).read_text(encoding="utf-8"))
+    for entry in registry.values():
+        entry["expiration_time"] = (datetime.now(timezone.utc) - timedelta(minutes=1)).isoformat()
+    Path(uploads.registry_path).write_text(json.dumps(registry), encoding="utf-8")
+
+    assert service.cleanup_expired_uploads() == 1
+    assert service.client.files.deleted == ["files/1"]
+    assert json.loads(Path(uploads.registry_path).read_text(encoding="utf-8")) == {}
@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from tools.import_profile import deferred_modules_loaded, profile_import
+from utils.lazy_import import LazyObject
+
+
+def test_importing_main_defers_heavy_sdks():
+    entries = profile_import("main")
+
+    assert any(name == "main" for name, _self_us, _cumulative_us in entries)
+    assert deferred_modules_loaded(entries) == []
+
+
+def test_lazy_object_forwards_reads_and_writes():
+    proxy = LazyObject("utils.event_bus", "EventFilter")
+    assert not proxy.loaded
+
+    assert proxy.__name__ == "EventFilter"
+    assert proxy.loaded and proxy.resolve() is sys.modules["utils.event_bus"].EventFilter
+
+    proxy.example_flag = True
+    try:
+        assert sys.modules["utils.event_bus"].EventFilter.example_flag is True
+    finally:
+        del proxy.example_flag
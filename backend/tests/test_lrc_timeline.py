@@ -0,0 +1,67 @@
+import sys
+from array import array
+from pathlib import Path
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from utils.lrc_validator import LrcTimeline, parse_lrc, shift_lrc, song_timeline, validate_lrc
+
+LRC = "\n".join([
+    "[ti:Example]",
+    "[00:01.00] First line",
+    "[00:02.50]  Second line  ",
+    "plain interlude",
+    "[00:04.123] Third line",
+    "[00:05.00]",
+    "[01:00.00] Last line",
+])
+
+
+def test_timeline_stores_parallel_offsets():
+    timeline = LrcTimeline(LRC)
+
+    assert isinstance(timeline.times_ms, array) and timeline.times_ms.typecode == "I"
+    assert list(timeline.times_ms) == [1000, 2500, 4123, 5000, 60000]
+    assert [timeline.lyric(i) for i in range(len(timeline))] == [
+        "First line", "Second line", "Third line", "", "Last line",
+    ]
+    assert not hasattr(timeline, "__dict__")
+    assert timeline.is_valid()
+
+
+def test_index_at_finds_active_line():
+    timeline = parse_lrc(LRC)
+    assert timeline.index_at(0) == -1
+    assert timeline.index_at(1000) == 0
+    assert timeline.index_at(4122) == 1
+    assert timeline.index_at(59_999) == 3
+    assert timeline.index_at(10 ** 7) == 4
+
+
+def test_validation_matches_strict_rules():
+    assert validate_lrc(LRC)
+    assert not validate_lrc("[00:01.00] a\n[00:02.00] b")
+    assert not validate_lrc(LRC.replace("[00:04.123]", "[00:02.00]"))
+    assert not validate_lrc(LRC.replace("[01:00.00]", "[00:75.00]"))
+    assert not validate_lrc(None)
+
+
+def test_shift_only_touches_leading_timestamps():
+    shifted = shift_lrc(LRC, 1500)
+    lines = shifted.splitlines()
+    assert lines[0] == "[ti:Example]"
+    assert lines[1] == "[00:02.50] First line"
+    assert lines[3] == "plain interlude"
+    assert lines[4] == "[00:05.62] Third line"
+    assert shift_lrc(LRC, -5000).splitlines()[1] == "[00:00.00] First line"
+
+
+def test_song_timeline_is_reused_until_lyrics_change():
+    first = song_timeline(987654, LRC)
+    assert song_timeline(987654, "".join(LRC)) is first
+
+    updated = song_timeline(987654, LRC + "\n[01:05.00] Encore")
+    assert updated is not first
+    assert len(updated) == len(first) + 1
@@ -0,0 +1,71 @@
+import sys
+from pathlib import Path
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from utils.lrc_tokenizer import LrcLine, LrcMeta, LrcText, tokenize_lrc
+from utils.lrc_validator import parse_lrc, shift_lrc, validate_lrc
+
+COMPRESSED = "\n".join([
+    "[ar:Artist]",
+    "[ti:Song]",
+    "[length: 03:20]",
+    "[00:05.00]Verse one",
+    "[00:10.00][00:40.00]Chorus line",
+    "[00:15.00]Verse two",
+    "[00:20.00][00:45.00]Chorus again",
+    "[00:30.00]Bridge",
+])
+
+
+def test_tokenizer_yields_tags_lines_and_text():
+    tokens = list(tokenize_lrc("[ar: Someone ]\n[00:01][00:02.5] Hi\nno stamp\n".splitlines(keepends=True)))
+
+    assert tokens[0] == LrcMeta("ar", "Someone")
+    assert isinstance(tokens[1], LrcLine)
+    assert tokens[1].times == (1000, 2500)
+    assert tokens[2] == LrcText("no stamp")
+
+
+def test_multi_timestamp_lines_expand_in_time_order():
+    timeline = parse_lrc(COMPRESSED)
+
+    assert list(timeline.times_ms) == [5000, 10000, 15000, 20000, 30000, 40000, 45000]
+    assert [timeline.lyric(i) for i in range(len(timeline))] == [
+        "Verse one", "Chorus line", "Verse two", "Chorus again", "Bridge", "Chorus line", "Chorus again",
+    ]
+    assert timeline.meta == {"ar": "Artist", "ti": "Song", "length": "03:20"}
+    assert validate_lrc(COMPRESSED)
+
+
+def test_duplicate_expanded_times_are_invalid():
+    assert not validate_lrc(COMPRESSED.replace("[00:40.00]", "[00:30.00]"))
+
+
+def test_offset_tag_moves_lyrics_earlier():
+    timeline = parse_lrc("[offset:+500]\n" + COMPRESSED)
+    assert timeline.offset_ms == 500
+    assert timeline.times_ms[0] == 4500
+    assert timeline.index_at(4600) == 0
+
+
+def test_word_timings_are_parsed_and_hidden_from_lyrics():
+    text = "\n".join(
+        f"[00:0{i}.00]<00:0{i}.00>Hello <00:0{i}.50>world {i}" for i in range(1, 6)
+    )
+    timeline = parse_lrc(text)
+
+    assert validate_lrc(text)
+    assert timeline.lyric(0) == "Hello world 1"
+    assert timeline.words(0) == [(1000, "Hello"), (1500, "world 1")]
+
+    shifted = shift_lrc(text, 1000).splitlines()[0]
+    assert shifted == "[00:02.00]<00:02.00>Hello <00:02.50>world 1"
+
+
+def test_previously_unrecognized_stamp_forms_count_as_synced():
+    short_fraction = "\n".join(f"[00:{i:02d}] line {i}" for i in range(1, 7))
+    assert validate_lrc(short_fraction)
+    assert not validate_lrc("\n".join(f"[00:{i:02d}.0] line" for i in (1, 3, 2, 4, 5, 6)))
@@ -0,0 +1,165 @@
+import sys
+from pathlib import Path
+
+from google.genai import types
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from database import models
+from services import gemini_service as gemini_module
+from services.lyric_batch import LyricBatchMigrator
+from services.lyric_cache import LyricCache
+from services.lyricist import lyricist
+
+VALID_LRC = "\n".join(f"[00:0{i}.00] line {i}" for i in range(1, 7))
+PLAIN_LYRICS = "\n".join(f"Plain line {i} of a song long enough to count as lyrics" for i in range(4))
+
+
+class FakeBatches:
+    """Local stand-in for the Batch API: jobs stay RUNNING for a number of polls, then answer."""
+
+    def __init__(self, answer, polls_until_done: int = 1, final_state: str = "JOB_STATE_SUCCEEDED"):
+        self.answer = answer
+        self.polls_until_done = polls_until_done
+        self.final_state = final_state
+        self.jobs: dict[str, dict] = {}
+
+    def create(self, *, model, src, config=None):
+        name = f"batches/{len(self.jobs) + 1}"
+        self.jobs[name] = {"model": model, "requests": list(src), "polls": 0}
+        return types.BatchJob(name=name, state="JOB_STATE_PENDING", model=model)
+
+    def get(self, *, name, config=None):
+        job = self.jobs[name]
+        job["polls"] += 1
+        if job["polls"] < self.polls_until_done:
+            return types.BatchJob(name=name, state="JOB_STATE_RUNNING")
+        if self.final_state != "JOB_STATE_SUCCEEDED":
+            return types.BatchJob(name=name, state=self.final_state)
+        responses = [self.answer(request) for request in job["requests"]]
+        return types.BatchJob(
+            name=name,
+            state=self.final_state,
+            dest=types.BatchJobDestination(inlined_responses=responses),
+        )
+
+
+class FakeClient:
+    def __init__(self, batches: FakeBatches):
+        self.batches = batches
+
+
+def _response(text: str) -> types.GenerateContentResponse:
+    return types.GenerateContentResponse(candidates=[
+        types.Candidate(
+            content=types.Content(role="model", parts=[types.Part(text=text)]),
+            finish_reason="STOP",
+        )
+    ])
+
+
+def _answer(request: types.InlinedRequest) -> types.InlinedResponse:
+    prompt = request.contents
+    if "Synced Song" in prompt:
+        item = _response(VALID_LRC)
+    elif "Plain Song" in prompt:
+        item = _response(PLAIN_LYRICS)
+    elif "Broken Song" in prompt:
+        return types.InlinedResponse(metadata=request.metadata, error=types.JobError(code=500, message="boom"))
+    else:
+        item = _response("LYRICS_NOT_FOUND")
+    return types.InlinedResponse(metadata=request.metadata, response=item)
+
+
+def _setup(tmp_path, monkeypatch):
+    # unresearched_song_ids() checks the cache entry for the currently selected model.
+    monkeypatch.setattr(gemini_module, "get_gemini_model", lambda: "gemini-2.5-flash")
+    engine = create_engine(f"sqlite:///{tmp_path / 'library.db'}", connect_args={"check_same_thread": False})
+    models.Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine)
+    cache = LyricCache(session_factory=session_factory, bind=engine)
+
+    db = session_factory()
+    artist = models.Artist(name="Artist")
+    db.add(artist)
+    titles = ["Synced Song", "Plain Song", "Missing Song", "Broken Song"]
+    for title in titles:
+        db.add(models.Song(title=title, artist=artist, lyrics="old plain text", lyrics_synced=False))
+    db.commit()
+    songs = [{"song_id": song.id, "title": song.title, "artist": "Artist"} for song in db.query(models.Song).all()]
+    db.close()
+
+    migrator = LyricBatchMigrator(
+        registry_path=str(tmp_path / "batches.json"),
+        session_factory=session_factory,
+        cache=cache,
+    )
+    return migrator, cache, session_factory, songs
+
+
+def test_batch_results_are_applied_in_bulk_after_completion(tmp_path, monkeypatch):
+    migrator, cache, session_factory, songs = _setup(tmp_path, monkeypatch)
+    client = FakeClient(FakeBatches(_answer, polls_until_done=2))
+
+    name = migrator.submit(client, "gemini-2.5-flash", songs)
+    assert name == "batches/1"
+    assert len(client.batches.jobs[name]["requests"]) == 4
+    assert migrator.in_flight_song_ids() == {song["song_id"] for song in songs}
+
+    # Still running: nothing applied, batch stays registered.
+    assert migrator.poll(client) == (0, [])
+    assert migrator.in_flight_song_ids()
+
+    applied, updated = migrator.poll(client)
+    assert applied == 1
+    assert migrator.in_flight_song_ids() == set()
+
+    db = session_factory()
+    by_title = {song.title: song for song in db.query(models.Song).all()}
+    assert updated == [by_title["Synced Song"].id]
+    assert by_title["Synced Song"].lyrics == VALID_LRC
+    assert by_title["Synced Song"].lyrics_synced is True
+    assert by_title["Synced Song"].lyrics_source == "gemini_research"
+    assert by_title["Plain Song"].lyrics == "old plain text"
+    db.close()
+
+    def cached(title):
+        return cache.get(*lyricist.cache_key(title, "Artist"), "gemini_research:gemini-2.5-flash")
+
+    assert cached("Plain Song").lyrics == PLAIN_LYRICS
+    assert cached("Missing Song").failure_reason == "not_found"
+
+    # A failed item leaves no research answer (its job researches live) but
+    # is not batched again while the failure record lasts.
+    assert cached("Broken Song") is None
+    assert cache.get(*lyricist.cache_key("Broken Song", "Artist"), "gemini_batch").failure_reason == "batch_failed"
+    assert migrator.unresearched_song_ids(songs) == set()
+
+
+def test_failed_batch_is_dropped_and_songs_stay_unresearched(tmp_path, monkeypatch):
+    migrator, cache, session_factory, songs = _setup(tmp_path, monkeypatch)
+    client = FakeClient(FakeBatches(_answer, final_state="JOB_STATE_EXPIRED"))
+
+    migrator.submit(client, "gemini-2.5-flash", songs)
+    assert migrator.poll(client) == (0, [])
+    assert migrator.in_flight_song_ids() == set()
+    assert migrator.unresearched_song_ids(songs) == {song["song_id"] for song in songs}
+
+
+def test_submit_respects_max_songs_and_survives_api_errors(tmp_path, monkeypatch):
+    migrator, cache, session_factory, songs = _setup(tmp_path, monkeypatch)
+    migrator.max_songs = 2
+    client = FakeClient(FakeBatches(_answer))
+
+    migrator.submit(client, "gemini-2.5-flash", songs)
+    assert len(client.batches.jobs["batches/1"]["requests"]) == 2
+
+    class BrokenBatches:
+        def create(self, **_kwargs):
+            raise RuntimeError("batch API unavailable")
+
+    assert migrator.submit(FakeClient(BrokenBatches()), "gemini-2.5-flash", songs) is None
@@ -0,0 +1,140 @@
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+import services.gemini_service as gemini_module
+import services.lyric_cache as lyric_cache_module
+import services.lyricist as lyricist_module
+from services.lyric_cache import LyricCache
+from services.lyricist import LyricistService
+from utils import circuit_breaker
+
+VALID_LRC = "\n".join(f"[00:0{i}.00] line {i}" for i in range(1, 7))
+
+
+def _cache(tmp_path) -> LyricCache:
+    engine = create_engine(f"sqlite:///{tmp_path / 'cache.db'}", connect_args={"check_same_thread": False})
+    return LyricCache(session_factory=sessionmaker(bind=engine), bind=engine)
+
+
+def _patch_gemini(monkeypatch, tmp_path, results: list[tuple[str | None, str | None]]):
+    cache = _cache(tmp_path)
+    calls = []
+
+    def fake_research(track_name, artist_name, status_callback=None, model_id=None, **_kwargs):
+        calls.append((track_name, artist_name, model_id))
+        return results[min(len(calls), len(results)) - 1]
+
+    gemini = lyricist_module.gemini_service
+    monkeypatch.setattr(circuit_breaker, "_breakers", {})
+    monkeypatch.setattr(lyricist_module, "lyric_cache", cache)
+    monkeypatch.setattr(gemini, "is_available", lambda: True)
+    monkeypatch.setattr(gemini, "research_lyrics", fake_research)
+    monkeypatch.setattr(gemini_module, "get_gemini_model", lambda: "model-a")
+    return cache, calls
+
+
+def test_repeat_lookup_is_served_from_cache_across_spellings(monkeypatch, tmp_path):
+    cache, calls = _patch_gemini(monkeypatch, tmp_path, [(VALID_LRC, None)])
+    service = LyricistService()
+
+    assert service._try_gemini_research("Song (feat. Guest)", "Artist") == (VALID_LRC, None)
+    assert service._try_gemini_research("  song ", "ARTIST") == (VALID_LRC, None)
+    assert len(calls) == 1
+
+    entry = cache.get("artist", "song", "gemini_research:model-a")
+    assert entry.is_synced is True
+    assert entry.failure_reason is None
+
+
+def test_refresh_bypasses_and_overwrites_cached_result(monkeypatch, tmp_path):
+    cache, calls = _patch_gemini(monkeypatch, tmp_path, [(None, "not_found"), (VALID_LRC, None)])
+    service = LyricistService()
+
+    assert service._try_gemini_research("Song", "Artist") == (None, "not_found")
+    assert service._try_gemini_research("Song", "Artist") == (None, "not_found")
+    assert len(calls) == 1
+
+    assert service._try_gemini_research("Song", "Artist", refresh=True) == (VALID_LRC, None)
+    assert len(calls) == 2
+    assert cache.get("artist", "song", "gemini_research:model-a").lyrics == VALID_LRC
+
+
+def test_negative_results_expire(monkeypatch, tmp_path):
+    cache, calls = _patch_gemini(monkeypatch, tmp_path, [(None, "rate_limited")])
+    cache.transient_ttl_seconds = 0.0
+    service = LyricistService()
+
+    service._try_gemini_research("Song", "Artist")
+    service._try_gemini_research("Song", "Artist")
+    assert len(calls) == 2
+
+    cache.negative_ttl_seconds = 0.05
+    cache.put("artist", "song", "gemini_research", None, failure_reason="not_found")
+    assert cache.get("artist", "song", "gemini_research").failure_reason == "not_found"
+    time.sleep(0.1)
+    assert cache.get("artist", "song", "gemini_research") is None
+
+
+def test_research_with_a_different_model_calls_gemini_again(monkeypatch, tmp_path):
+    cache, calls = _patch_gemini(monkeypatch, tmp_path, [(None, "not_found"), (VALID_LRC, None)])
+    service = LyricistService()
+
+    assert service._try_gemini_research("Song", "Artist") == (None, "not_found")
+    assert service._try_gemini_research("Song", "Artist", model_id="model-b") == (VALID_LRC, None)
+    assert [model_id for _, _, model_id in calls] == [None, "model-b"]
+
+    # Each model keeps its own answer.
+    assert service._try_gemini_research("Song", "Artist", model_id="model-a") == (None, "not_found")
+    assert service._try_gemini_research("Song", "Artist", model_id="model-b") == (VALID_LRC, None)
+    assert len(calls) == 2
+
+
+def test_transcription_cache_is_keyed_by_audio_file(monkeypatch, tmp_path):
+    _patch_gemini(monkeypatch, tmp_path, [])
+    transcribed = []
+
+    def fake_transcribe(file_path, track_name, artist_name, status_callback=None, model_id=None, **_kwargs):
+        transcribed.append(file_path)
+        return VALID_LRC, None
+
+    monkeypatch.setattr(lyricist_module.gemini_service, "transcribe_audio", fake_transcribe)
+    audio = tmp_path / "song.mp3"
+    audio.write_bytes(b"first take")
+    service = LyricistService()
+
+    service._try_gemini_transcription(str(audio), "Song", "Artist")
+    service._try_gemini_transcription(str(audio), "Song", "Artist")
+    assert len(transcribed) == 1
+
+    audio.write_bytes(b"a re-downloaded, longer take")
+    service._try_gemini_transcription(str(audio), "Song", "Artist")
+    assert len(transcribed) == 2
+
+
+def test_get_many_returns_live_entries_across_chunks(monkeypatch, tmp_path):
+    cache = _cache(tmp_path)
+    monkeypatch.setattr(lyric_cache_module, "_GET_MANY_CHUNK", 2)
+    cache.put_many([
+        {"artist_key": "artist", "title_key": f"song {i}", "provider": "gemini_research:model-a", "lyrics": VALID_LRC}
+        for i in range(5)
+    ])
+    cache.transient_ttl_seconds = 0.05
+    cache.put("artist", "gone", "gemini_research:model-a", None, failure_reason="rate_limited")
+    time.sleep(0.1)
+
+    keys = [("artist", f"song {i}", "gemini_research:model-a") for i in range(6)] + [
+        ("artist", "gone", "gemini_research:model-a"),
+        ("artist", "song 0", "gemini_research:model-b"),
+    ]
+    found = cache.get_many(keys)
+
+    assert sorted(found) == sorted(keys[:5])
+    assert all(entry.lyrics == VALID_LRC for entry in found.values())
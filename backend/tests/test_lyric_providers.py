@@ -0,0 +1,67 @@
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from services import lyric_providers
+from services.lyric_providers import GeniusProvider
+
+
+class _FakeResponse:
+    def __init__(self, ok: bool, payload: dict):
+        self.ok = ok
+        self.status_code = 200 if ok else 401
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+
+def test_genius_provider_sends_token_per_request(monkeypatch):
+    provider = GeniusProvider(access_token="secret-token")
+    captured = {}
+
+    def fake_get(url, params=None, headers=None, **_kwargs):
+        captured.update(url=url, params=params, headers=headers)
+        return _FakeResponse(True, {"response": {"hits": [
+            {"type": "song", "result": {"url": "https://genius.com/song-lyrics"}},
+        ]}})
+
+    monkeypatch.setattr(provider.session, "get", fake_get)
+    monkeypatch.setattr(provider, "_scrape_lyrics", lambda url: f"scraped:{url}")
+
+    assert provider.get_lrc("Song Artist") == "scraped:https://genius.com/song-lyrics"
+    assert captured["url"] == GeniusProvider.API_SEARCH_ENDPOINT
+    assert captured["headers"] == {"Authorization": "Bearer secret-token"}
+    assert "Authorization" not in provider.session.headers
+
+
+def test_build_providers_isolates_genius_token():
+    first = lyric_providers.build_providers("token-a", ["Genius"])[0]
+    second = lyric_providers.build_providers("token-b", ["genius"])[0]
+    assert first.access_token == "token-a"
+    assert second.access_token == "token-b"
+    assert first.session is not second.session
+
+    with pytest.raises(ValueError):
+        lyric_providers.build_providers(None, ["NotAProvider"])
+
+
+def test_build_providers_bounds_request_timeout(monkeypatch):
+    provider = lyric_providers.build_providers(None, ["Lrclib"], timeout=3.0)[0]
+    seen = []
+    monkeypatch.setattr(
+        requests.Session,
+        "request",
+        lambda self, method, url, **kwargs: seen.append(kwargs.get("timeout")),
+    )
+
+    provider.session.get("https://lrclib.net/api/search")
+    provider.session.get("https://lrclib.net/api/search", timeout=1)
+
+    assert seen == [(2.0, 3.0), 1]
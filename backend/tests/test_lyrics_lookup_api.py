@@ -0,0 +1,75 @@
+import struct
+import sys
+from array import array
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from main import get_lyrics_at, get_lyrics_timeline
+from utils.lrc_validator import TIMELINE_MAGIC
+
+LRC = "\n".join(f"[00:{i * 5:02d}.00] Line {i}" for i in range(1, 9))
+
+
+class FakeDB:
+    def __init__(self, *songs):
+        self._songs = {song.id: song for song in songs}
+
+    def get(self, _model, song_id):
+        return self._songs.get(song_id)
+
+
+def _db():
+    return FakeDB(
+        SimpleNamespace(id=1, lyrics=LRC, lyrics_synced=True),
+        SimpleNamespace(id=2, lyrics="just words", lyrics_synced=False),
+    )
+
+
+def test_lyrics_at_returns_active_line_and_window():
+    result = get_lyrics_at(1, t=16_000, window=1, db=_db())
+
+    assert result["index"] == 2
+    assert result["next_t"] == 20_000
+    assert [line["text"] for line in result["lines"]] == ["Line 2", "Line 3", "Line 4"]
+    assert result["lines"][1] == {"index": 2, "t": 15_000, "text": "Line 3"}
+
+
+def test_lyrics_at_edges():
+    before = get_lyrics_at(1, t=0, window=2, db=_db())
+    assert before["index"] == -1
+    assert before["next_t"] == 5_000
+    assert [line["index"] for line in before["lines"]] == [0, 1]
+
+    after = get_lyrics_at(1, t=10 ** 6, window=0, db=_db())
+    assert after["index"] == 7
+    assert after["next_t"] is None
+    assert [line["text"] for line in after["lines"]] == ["Line 8"]
+
+
+def test_unsynced_or_missing_songs_are_404():
+    for song_id in (2, 99):
+        with pytest.raises(HTTPException) as excinfo:
+            get_lyrics_at(song_id, t=0, window=2, db=_db())
+        assert excinfo.value.status_code == 404
+
+
+def test_timeline_exports_json_and_binary():
+    data = get_lyrics_timeline(1, format="json", db=_db())
+    assert data["times"] == [i * 5000 for i in range(1, 9)]
+    assert data["lines"][0] == "Line 1"
+
+    packed = get_lyrics_timeline(1, format="binary", db=_db()).body
+    magic, count = struct.unpack_from("<4sI", packed)
+    assert magic == TIMELINE_MAGIC and count == 8
+    times = array("I", packed[8:8 + 4 * count])
+    if sys.byteorder == "big":
+        times.byteswap()
+    assert list(times) == data["times"]
+    assert packed[8 + 4 * count:].decode("utf-8").split("\n") == data["lines"]
@@ -43,6 +43,7 @@ def test_legacy_migration_queues_jobs_and_deduplicates(monkeypatch, tmp_path):
     session_local = _build_test_session(tmp_path)
     monkeypatch.setattr(worker_module, "SessionLocal", session_local)
     monkeypatch.setattr(worker_module.settings_service, "get_strict_lrc_mode", lambda: True)
+    monkeypatch.setattr(worker_module.lyric_batch, "enabled", False)
 
     db = session_local()
     artist = models.Artist(name=f"migration-artist-{uuid.uuid4().hex}")
@@ -84,6 +85,7 @@ def test_legacy_migration_honors_batch_cap(monkeypatch, tmp_path):
     session_local = _build_test_session(tmp_path)
     monkeypatch.setattr(worker_module, "SessionLocal", session_local)
     monkeypatch.setattr(worker_module.settings_service, "get_strict_lrc_mode", lambda: True)
+    monkeypatch.setattr(worker_module.lyric_batch, "enabled", False)
 
     db = session_local()
     artist = models.Artist(name=f"batch-artist-{uuid.uuid4().hex}")
@@ -106,3 +108,81 @@ def test_legacy_migration_honors_batch_cap(monkeypatch, tmp_path):
         assert len(jobs) == 25
     finally:
         db.close()
+
+
+def test_legacy_migration_batches_unresearched_songs(monkeypatch, tmp_path):
+    session_local = _build_test_session(tmp_path)
+    monkeypatch.setattr(worker_module, "SessionLocal", session_local)
+    monkeypatch.setattr(worker_module.settings_service, "get_strict_lrc_mode", lambda: True)
+    monkeypatch.setattr(worker_module.gemini_service, "is_available", lambda: True)
+
+    db = session_local()
+    artist = models.Artist(name=f"batch-mode-artist-{uuid.uuid4().hex}")
+    db.add(artist)
+    db.flush()
+    song_ids = [_seed_song(db, artist.id, i, "legacy plain text\nline two", False) for i in range(4)]
+    db.commit()
+    db.close()
+
+    researched = {song_ids[0]}
+    submitted = []
+    batch = worker_module.lyric_batch
+    monkeypatch.setattr(batch, "enabled", True)
+    monkeypatch.setattr(batch, "in_flight_song_ids", lambda: {song_ids[1]})
+    lookups = []
+
+    def unresearched(songs):
+        lookups.append(len(songs))
+        return {song["song_id"] for song in songs if not song["title"].startswith("migration-song-0-")}
+
+    monkeypatch.setattr(batch, "unresearched_song_ids", unresearched)
+    monkeypatch.setattr(batch, "submit", lambda _client, _model, songs: submitted.append(songs))
+
+    worker = Worker(worker_id="migration_batch_mode_worker")
+    worker._queue_legacy_unsynced_lyrics()
+
+    db = session_local()
+    try:
+        jobs = db.query(models.Job).filter(
+            models.Job.idempotency_key.like("lyrics_legacy_migrate_%")
+        ).all()
+        # Already researched -> regular job; in flight -> untouched; the rest -> one batch.
+        assert [job.idempotency_key for job in jobs] == [f"lyrics_legacy_migrate_{song_id}" for song_id in researched]
+        assert len(submitted) == 1
+        assert [song["song_id"] for song in submitted[0]] == song_ids[2:]
+        # The cache is checked once for the whole page, not once per song.
+        assert lookups == [4]
+    finally:
+        db.close()
+
+
+def test_legacy_migration_scans_in_pages(monkeypatch, tmp_path):
+    session_local = _build_test_session(tmp_path)
+    monkeypatch.setattr(worker_module, "SessionLocal", session_local)
+    monkeypatch.setattr(worker_module.settings_service, "get_strict_lrc_mode", lambda: True)
+    monkeypatch.setattr(worker_module.lyric_batch, "enabled", False)
+
+    db = session_local()
+    artist = models.Artist(name=f"paged-artist-{uuid.uuid4().hex}")
+    db.add(artist)
+    db.flush()
+    valid_lrc = "[00:01.00] A\n[00:02.00] B\n[00:03.00] C\n[00:04.00] D\n[00:05.00] E"
+    song_ids = [
+        _seed_song(db, artist.id, i, valid_lrc if i % 3 == 0 else "legacy plain text\nline two", False)
+        for i in range(7)
+    ]
+    db.commit()
+    db.close()
+
+    worker = Worker(worker_id="migration_paged_worker")
+    worker.legacy_scan_page_size = 2
+    worker._queue_legacy_unsynced_lyrics()
+
+    db = session_local()
+    try:
+        healed = {song.id for song in db.query(models.Song).filter(models.Song.lyrics_synced == True)}  # noqa: E712
+        assert healed == {song_ids[0], song_ids[3], song_ids[6]}
+        keys = {job.idempotency_key for job in db.query(models.Job)}
+        assert keys == {f"lyrics_legacy_migrate_{song_ids[i]}" for i in (1, 2, 4, 5)}
+    finally:
+        db.close()
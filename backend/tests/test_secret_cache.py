@@ -0,0 +1,63 @@
+import base64
+import sys
+from pathlib import Path
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from services import settings_service
+
+VALID_KEY = "AIza" + "x" * 35
+
+
+class FakeDpapi:
+    """Reversible stand-in for utils.dpapi so DPAPI paths run on any OS."""
+
+    def __init__(self):
+        self.unprotect_calls = 0
+
+    def is_available(self) -> bool:
+        return True
+
+    def protect(self, plaintext: str) -> str:
+        return base64.b64encode(plaintext[::-1].encode("utf-8")).decode("ascii")
+
+    def unprotect(self, ciphertext_b64: str) -> str:
+        self.unprotect_calls += 1
+        return base64.b64decode(ciphertext_b64.encode("ascii")).decode("utf-8")[::-1]
+
+
+def _setup(monkeypatch, tmp_path) -> FakeDpapi:
+    fake = FakeDpapi()
+    monkeypatch.setattr(settings_service, "dpapi", fake)
+    monkeypatch.setattr(settings_service, "_get_settings_dir", lambda: tmp_path)
+    monkeypatch.delenv("GENIUS_ACCESS_TOKEN", raising=False)
+    settings_service._clear_secret_cache()
+    return fake
+
+
+def test_repeated_secret_lookups_decrypt_once(monkeypatch, tmp_path):
+    fake = _setup(monkeypatch, tmp_path)
+    settings_service.set_gemini_api_key(VALID_KEY)
+    settings_service.set_genius_credentials(access_token="genius-token-123")
+
+    for _ in range(20):
+        assert settings_service.get_gemini_api_key() == VALID_KEY
+        assert settings_service.get_genius_credentials()["access_token"] == "genius-token-123"
+
+    assert fake.unprotect_calls == 2
+
+
+def test_set_and_delete_clear_decrypted_secrets(monkeypatch, tmp_path):
+    fake = _setup(monkeypatch, tmp_path)
+    settings_service.set_genius_credentials(access_token="first-token")
+    assert settings_service.get_genius_credentials()["access_token"] == "first-token"
+
+    settings_service.set_genius_credentials(access_token="second-token")
+    assert settings_service.get_genius_credentials()["access_token"] == "second-token"
+    assert fake.unprotect_calls == 2
+
+    settings_service.delete_genius_credentials()
+    assert settings_service._secret_cache == {}
+    assert settings_service.get_genius_credentials()["access_token"] is None
@@ -0,0 +1,70 @@
+import json
+import os
+import sys
+from pathlib import Path
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from services import settings_service
+
+
+def _isolate_settings(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings_service, "_get_settings_dir", lambda: tmp_path)
+    reads = []
+    original_read = settings_service._read_settings_file
+
+    def counting_read(path):
+        reads.append(path)
+        return original_read(path)
+
+    monkeypatch.setattr(settings_service, "_read_settings_file", counting_read)
+    return reads
+
+
+def test_getters_reuse_cached_snapshot(monkeypatch, tmp_path):
+    reads = _isolate_settings(monkeypatch, tmp_path)
+    (tmp_path / "settings.json").write_text(json.dumps({"strict_lrc": False}), encoding="utf-8")
+
+    for _ in range(50):
+        assert settings_service.get_strict_lrc_mode() is False
+        assert settings_service.get_gemini_model() == settings_service.DEFAULT_MODEL
+    assert len(reads) == 1
+
+
+def test_external_edit_invalidates_cache(monkeypatch, tmp_path):
+    reads = _isolate_settings(monkeypatch, tmp_path)
+    monkeypatch.setattr(settings_service, "_STAT_INTERVAL_SECONDS", 0.0)
+    path = tmp_path / "settings.json"
+    path.write_text(json.dumps({"strict_lrc": True}), encoding="utf-8")
+    assert settings_service.get_strict_lrc_mode() is True
+
+    path.write_text(json.dumps({"strict_lrc": "off"}), encoding="utf-8")
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert settings_service.get_strict_lrc_mode() is False
+    assert len(reads) == 2
+
+
+def test_save_is_atomic_and_writes_through(monkeypatch, tmp_path):
+    reads = _isolate_settings(monkeypatch, tmp_path)
+    settings_service.set_strict_lrc_mode(False)
+    settings_service.set_gemini_model("gemini-2.5-flash")
+
+    assert settings_service.get_strict_lrc_mode() is False
+    assert settings_service.get_gemini_model() == "gemini-2.5-flash"
+    assert reads == [tmp_path / "settings.json"]
+
+    on_disk = json.loads((tmp_path / "settings.json").read_text(encoding="utf-8"))
+    assert on_disk == {"strict_lrc": False, "gemini_model": "gemini-2.5-flash"}
+    assert [p.name for p in tmp_path.iterdir()] == ["settings.json"]
+
+
+def test_mutating_loaded_settings_does_not_leak_into_cache(monkeypatch, tmp_path):
+    _isolate_settings(monkeypatch, tmp_path)
+    settings_service.set_ytdlp_state({"last_update_status": "ok"})
+
+    loaded = settings_service._load_settings()
+    loaded["ytdlp_state"]["last_update_status"] = "mutated"
+    assert settings_service.get_ytdlp_state()["last_update_status"] == "ok"
@@ -0,0 +1,79 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+from database.migrations import backup_database
+from main import app
+from utils.readiness import readiness
+
+
+@pytest.fixture(autouse=True)
+def fresh_readiness():
+    readiness.reset()
+    yield
+    readiness.reset()
+
+
+def test_online_backup_includes_uncheckpointed_wal_pages(tmp_path):
+    db_path = tmp_path / "live.db"
+    writer = sqlite3.connect(db_path)
+    writer.execute("PRAGMA journal_mode=WAL")
+    writer.execute("PRAGMA wal_autocheckpoint=0")
+    writer.execute("CREATE TABLE songs (id INTEGER PRIMARY KEY, title TEXT)")
+    writer.executemany("INSERT INTO songs (title) VALUES (?)", [(f"song {i}",) for i in range(500)])
+    writer.commit()
+
+    steps = []
+    backup_path = tmp_path / "live.db.bak"
+    try:
+        backup_database(str(db_path), str(backup_path), progress=lambda *args: steps.append(args))
+    finally:
+        writer.close()
+
+    copy = sqlite3.connect(backup_path)
+    try:
+        assert copy.execute("SELECT COUNT(*) FROM songs").fetchone()[0] == 500
+    finally:
+        copy.close()
+    assert steps and steps[-1][1] == 0
+
+
+def test_ready_once_required_phases_finish():
+    for phase in ("database", "services", "worker"):
+        assert not readiness.snapshot()["ready"]
+        readiness.begin(phase)
+        readiness.done(phase)
+    snapshot = readiness.snapshot()
+    assert snapshot["ready"]
+    assert [phase["name"] for phase in snapshot["phases"]] == ["database", "services", "worker", "maintenance"]
+    assert snapshot["phases"][3]["status"] == "pending"
+
+
+def test_health_ready_reports_phases_in_tests():
+    with TestClient(app) as client:
+        res = client.get("/health/ready")
+        assert res.status_code == 200
+        statuses = {phase["name"]: phase["status"] for phase in res.json()["phases"]}
+        assert statuses == {"database": "done", "services": "skipped", "worker": "skipped", "maintenance": "skipped"}
+
+
+def test_requests_wait_for_deferred_database_startup():
+    client = TestClient(app)
+    readiness.deferred = True
+    readiness.begin("database")
+
+    assert client.get("/").status_code == 200
+    assert client.get("/health/ready").status_code == 503
+    blocked = client.get("/jobs/active")
+    assert blocked.status_code == 503
+    assert blocked.json() == {"detail": "Starting up"}
+
+    readiness.fail("database", RuntimeError("disk full"))
+    assert client.get("/jobs/active").json() == {"detail": "Database unavailable"}
@@ -0,0 +1,113 @@
+import sys
+import threading
+import time
+from pathlib import Path
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+import services.lyricist as lyricist_module
+from services import settings_service
+from services.lyricist import LyricistService
+
+VALID_LRC = "\n".join(f"[00:0{i}.00] line {i}" for i in range(1, 7))
+
+
+def _patch_search(monkeypatch, responses: dict[str, tuple[float, str | None]]):
+    calls = []
+
+    def fake_search(term, *, genius_token=None, providers=None, timeout=None):
+        calls.append((term, tuple(providers or ()), genius_token))
+        delay, result = responses.get(term, (0.0, None))
+        time.sleep(delay)
+        return result
+
+    monkeypatch.setattr(lyricist_module.lyric_providers, "search", fake_search)
+    monkeypatch.setattr(
+        settings_service,
+        "get_genius_credentials",
+        lambda: {"client_id": None, "client_secret": None, "access_token": "genius-token"},
+    )
+    return calls
+
+
+def test_first_valid_result_wins_without_waiting_for_slow_terms(monkeypatch):
+    _patch_search(monkeypatch, {
+        "Song (feat. Guest) Artist": (1.0, VALID_LRC + "\n[00:09.00] slow"),
+        "Song Artist": (0.05, VALID_LRC),
+        "Song (feat. Guest)": (0.0, "plain text only"),
+    })
+    service = LyricistService()
+
+    start = time.perf_counter()
+    result = service._try_syncedlyrics("Song (feat. Guest)", "Artist")
+    elapsed = time.perf_counter() - start
+
+    assert result == (VALID_LRC, None)
+    assert elapsed < 0.8
+
+
+def test_unsynced_fallback_prefers_most_specific_term(monkeypatch):
+    _patch_search(monkeypatch, {
+        "Song (feat. Guest) Artist": (0.1, "specific plain text"),
+        "Song (feat. Guest)": (0.0, "generic plain text"),
+    })
+    service = LyricistService()
+
+    assert service._try_syncedlyrics("Song (feat. Guest)", "Artist") == ("specific plain text", None)
+
+
+def test_provider_racing_searches_each_provider(monkeypatch):
+    calls = _patch_search(monkeypatch, {})
+    service = LyricistService()
+    service.race_syncedlyrics_providers = True
+
+    assert service._try_syncedlyrics("Song", "Artist") == (None, "not_found")
+    providers = {provider for _, provider, _ in calls}
+    assert providers == {(name,) for name in lyricist_module.lyric_providers.PROVIDER_NAMES}
+
+
+def test_genius_token_is_passed_explicitly_not_via_environ(monkeypatch):
+    monkeypatch.delenv("GENIUS_ACCESS_TOKEN", raising=False)
+    seen_env = []
+    calls = _patch_search(monkeypatch, {})
+    original = lyricist_module.lyric_providers.search
+
+    def recording_search(term, **kwargs):
+        seen_env.append(lyricist_module.os.environ.get("GENIUS_ACCESS_TOKEN"))
+        return original(term, **kwargs)
+
+    monkeypatch.setattr(lyricist_module.lyric_providers, "search", recording_search)
+    LyricistService()._try_syncedlyrics("Song", "Artist")
+
+    assert calls and all(token == "genius-token" for _, _, token in calls)
+    assert set(seen_env) == {None}
+
+
+def test_losing_searches_do_not_accumulate_threads(monkeypatch):
+    release = threading.Event()
+    _patch_search(monkeypatch, {"Song Artist": (0.0, VALID_LRC)})
+    original = lyricist_module.lyric_providers.search
+
+    def stuck_losers(term, **kwargs):
+        if term != "Song Artist":
+            release.wait(5)
+        return original(term, **kwargs)
+
+    monkeypatch.setattr(lyricist_module.lyric_providers, "search", stuck_losers)
+    monkeypatch.setenv("LYRICVAULT_SYNCEDLYRICS_WORKERS", "4")
+    service = LyricistService()
+    service.race_syncedlyrics_providers = True
+
+    def search_threads():
+        return [t for t in threading.enumerate() if t.name.startswith("syncedlyrics")]
+
+    baseline = len(search_threads())
+    try:
+        for _ in range(10):
+            service._try_syncedlyrics("Song", "Artist")
+        assert len(search_threads()) - baseline <= 4
+    finally:
+        release.set()
+        service._syncedlyrics_executor.shutdown(wait=True)
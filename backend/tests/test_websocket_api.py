@@ -0,0 +1,118 @@
+import sys
+from collections import OrderedDict, deque
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+import main as main_module
+from main import app
+from utils import event_bus
+from utils.readiness import readiness
+
+
+class FakeDB:
+    def __init__(self, jobs):
+        self._jobs = jobs
+        self.closed = False
+
+    def get(self, _model, job_id):
+        return self._jobs.get(job_id)
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def ws_app(monkeypatch):
+    monkeypatch.setattr(main_module, "REQUIRE_AUTH", False)
+    monkeypatch.setattr(event_bus, "_subscribers", set())
+    monkeypatch.setattr(event_bus, "_history", deque(maxlen=50))
+    monkeypatch.setattr(event_bus, "_pending", OrderedDict())
+    monkeypatch.setattr(event_bus, "_coalesce_seconds", 0.0)
+    jobs = {3: SimpleNamespace(id=3, type="generate_lyrics", status="pending", progress=0)}
+    monkeypatch.setattr(main_module, "SessionLocal", lambda: FakeDB(jobs))
+    return TestClient(app)
+
+
+def test_rejects_missing_token_when_required(monkeypatch):
+    monkeypatch.setattr(main_module, "REQUIRE_AUTH", True)
+    monkeypatch.setattr(main_module, "API_TOKEN", "testtoken")
+
+    with pytest.raises(WebSocketDisconnect) as excinfo:
+        with TestClient(app).websocket_connect("/ws") as ws:
+            ws.receive_text()
+    assert excinfo.value.code == 1008
+
+
+def test_token_is_accepted_via_subprotocol_but_not_query_string(monkeypatch):
+    monkeypatch.setattr(main_module, "REQUIRE_AUTH", True)
+    monkeypatch.setattr(main_module, "API_TOKEN", "testtoken")
+    client = TestClient(app)
+
+    with pytest.raises(WebSocketDisconnect) as excinfo:
+        with client.websocket_connect("/ws?token=testtoken") as ws:
+            ws.receive_text()
+    assert excinfo.value.code == 1008
+
+    with client.websocket_connect("/ws", subprotocols=["lyricvault", "lyricvault.token.testtoken"]) as ws:
+        assert ws.accepted_subprotocol == "lyricvault"
+    with client.websocket_connect("/ws", headers={"X-LyricVault-Token": "testtoken"}) as ws:
+        assert ws.accepted_subprotocol is None
+
+
+def test_commands_and_events_share_one_connection(ws_app):
+    with ws_app.websocket_connect("/ws?topics=job") as ws:
+        ws.send_json({"id": "a", "cmd": "job", "args": {"job_id": 3}})
+        assert ws.receive_json() == {
+            "type": "result",
+            "id": "a",
+            "ok": True,
+            "data": {"id": 3, "type": "generate_lyrics", "status": "pending", "progress": 0},
+        }
+
+        event_bus.publish("song", {"action": "lyrics_updated", "song_ids": [1]})
+        event_bus.publish("job", {"id": 3, "status": "processing"})
+        frame = ws.receive_json()
+        assert frame["type"] == "events"
+        assert frame["id"] == event_bus.last_event_id()
+        assert frame["data"]["data"] == {"id": 3, "status": "processing"}
+
+
+def test_command_errors_are_reported_per_request(ws_app):
+    with ws_app.websocket_connect("/ws") as ws:
+        ws.send_json({"id": 1, "cmd": "job", "args": {"job_id": 99}})
+        assert ws.receive_json() == {"type": "result", "id": 1, "ok": False, "status": 404, "detail": "Job not found"}
+
+        ws.send_json({"id": 2, "cmd": "job", "args": {}})
+        assert ws.receive_json()["status"] == 422
+
+        ws.send_json({"id": 3, "cmd": "drop_tables"})
+        assert ws.receive_json()["status"] == 400
+
+
+def test_expired_resume_point_gets_resync_with_current_id(ws_app):
+    event_bus.publish("job", {"id": 3, "status": "processing"})
+    with ws_app.websocket_connect("/ws?last_event_id=1") as ws:
+        assert ws.receive_json() == {"type": "resync", "id": event_bus.last_event_id(), "reason": "events_expired"}
+
+
+def test_commands_wait_for_deferred_database_startup(ws_app, monkeypatch):
+    opened = []
+    monkeypatch.setattr(main_module, "SessionLocal", lambda: opened.append(1))
+    readiness.reset()
+    readiness.deferred = True
+    readiness.begin("database")
+    try:
+        with ws_app.websocket_connect("/ws") as ws:
+            ws.send_json({"id": 1, "cmd": "job", "args": {"job_id": 3}})
+            assert ws.receive_json() == {"type": "result", "id": 1, "ok": False, "status": 503, "detail": "Starting up"}
+    finally:
+        readiness.reset()
+    assert opened == []
@@ -8,6 +8,15 @@ Contract:
 - Output (stdout):
   - success: {"ok": true, "data": ...}
   - error:   {"ok": false, "error": "..."}
+
+Daemon mode (--serve) keeps one process resident so interpreter start-up and the
+yt-dlp/genai/syncedlyrics imports are paid once:
+- Input: one JSON request per line: {"id": ..., "action": "...", "payload": {...}}
+- Output: one JSON response per line as each request completes, tagged with its id:
+  {"id": ..., "ok": true, "data": ...} or {"id": ..., "ok": false, "error": "..."}
+- Requests run concurrently; responses may arrive out of order. EOF on stdin
+  drains in-flight requests and exits. Service output is sent to stderr so
+  stdout carries only responses.
 """
 
 from __future__ import annotations
@@ -16,8 +25,10 @@ import argparse
 import json
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 
 def _bootstrap_import_path() -> None:
@@ -29,10 +40,15 @@ def _bootstrap_import_path() -> None:
 
 _bootstrap_import_path()
 
-from services.ingestor import ingestor  # noqa: E402
-from services.lyricist import lyricist  # noqa: E402
+from utils.lazy_import import LazyObject  # noqa: E402
 from utils.lrc_validator import validate_lrc  # noqa: E402
 
+# Imported on first use, so a one-shot search never loads genai/syncedlyrics.
+ingestor = LazyObject("services.ingestor", "ingestor")
+lyricist = LazyObject("services.lyricist", "lyricist")
+
+SERVE_WORKERS = int(os.getenv("LYRICVAULT_BRIDGE_WORKERS", "4"))
+
 
 def _read_payload() -> dict[str, Any]:
     raw = sys.stdin.read().strip()
@@ -91,6 +107,7 @@ def _action_research_lyrics(payload: dict[str, Any]) -> dict[str, Any]:
     mode = str(payload.get("mode", "auto")).strip().lower() or "auto"
     model_id_value = payload.get("model_id")
     model_id = str(model_id_value).strip() if model_id_value else None
+    refresh = bool(payload.get("refresh", False))
 
     if not title:
         raise ValueError("Missing required field: title")
@@ -102,35 +119,38 @@ def _action_research_lyrics(payload: dict[str, Any]) -> dict[str, Any]:
                 source="gemini_transcription",
                 failure_reason="source_unavailable",
             )
-        lyrics = lyricist._try_gemini_transcription(
+        lyrics, failure_reason = lyricist._try_gemini_transcription(
             file_path,
             title,
             artist,
             model_id=model_id,
+            refresh=refresh,
         )
         return _normalize_lyrics_result(
             lyrics=lyrics,
             source="gemini_transcription",
-            failure_reason=lyricist._last_gemini_transcription_reason if not lyrics else None,
+            failure_reason=failure_reason,
         )
 
     if mode == "research":
-        lyrics = lyricist._try_gemini_research(
+        lyrics, failure_reason = lyricist._try_gemini_research(
             title,
             artist,
             model_id=model_id,
+            refresh=refresh,
         )
         return _normalize_lyrics_result(
             lyrics=lyrics,
             source="gemini_research",
-            failure_reason=lyricist._last_gemini_research_reason if not lyrics else None,
+            failure_reason=failure_reason,
         )
 
     if model_id:
-        lyrics = lyricist._try_gemini_research(
+        lyrics, failure_reason = lyricist._try_gemini_research(
             title,
             artist,
             model_id=model_id,
+            refresh=refresh,
         )
         if lyrics:
             return _normalize_lyrics_result(
@@ -139,24 +159,25 @@ def _action_research_lyrics(payload: dict[str, Any]) -> dict[str, Any]:
                 failure_reason=None,
             )
         if file_path and os.path.exists(file_path):
-            lyrics = lyricist._try_gemini_transcription(
+            lyrics, failure_reason = lyricist._try_gemini_transcription(
                 file_path,
                 title,
                 artist,
                 model_id=model_id,
+                refresh=refresh,
             )
             return _normalize_lyrics_result(
                 lyrics=lyrics,
                 source="gemini_transcription",
-                failure_reason=lyricist._last_gemini_transcription_reason if not lyrics else None,
+                failure_reason=failure_reason,
             )
         return _normalize_lyrics_result(
             lyrics=None,
             source="gemini_research",
-            failure_reason=lyricist._last_gemini_research_reason,
+            failure_reason=failure_reason,
         )
 
-    outcome = lyricist.transcribe(title, artist, file_path)
+    outcome = lyricist.transcribe(title, artist, file_path, refresh=refresh)
     if isinstance(outcome, dict):
         return _normalize_lyrics_result(
             lyrics=outcome.get("lyrics"),
@@ -183,15 +204,86 @@ ACTIONS = {
 }
 
 
+def _handle_request(request: Any) -> dict[str, Any]:
+    request_id = request.get("id") if isinstance(request, dict) else None
+    try:
+        if not isinstance(request, dict):
+            raise ValueError("Request must be a JSON object")
+        action = request.get("action")
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action: {action}")
+        payload = request.get("payload")
+        if payload is None:
+            payload = {}
+        if not isinstance(payload, dict):
+            raise ValueError("Payload must be a JSON object")
+        data = ACTIONS[action](payload)
+        return {"id": request_id, "ok": True, "data": data}
+    except Exception as exc:  # pragma: no cover - explicit bridge error contract
+        return {"id": request_id, "ok": False, "error": str(exc)}
+
+
+def serve(stdin: TextIO, stdout: TextIO, *, workers: int = SERVE_WORKERS) -> int:
+    """Answer newline-delimited JSON requests from stdin until EOF (see module docstring)."""
+    write_lock = threading.Lock()
+
+    def _respond(response: dict[str, Any]) -> None:
+        line = json.dumps(response, ensure_ascii=True)
+        with write_lock:
+            stdout.write(line + "\n")
+            stdout.flush()
+
+    def _run(request: Any) -> None:
+        _respond(_handle_request(request))
+
+    # Load the services in the background while the first requests are read.
+    threading.Thread(target=lambda: (ingestor.resolve(), lyricist.resolve()), daemon=True).start()
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="bridge") as pool:
+        for raw in stdin:
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                request = json.loads(raw)
+            except json.JSONDecodeError as exc:
+                _respond({"id": None, "ok": False, "error": f"Invalid JSON request: {exc}"})
+                continue
+            pool.submit(_run, request)
+    return 0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="LyricVault Python bridge CLI")
     parser.add_argument(
         "action",
+        nargs="?",
         choices=sorted(ACTIONS.keys()),
         help="Bridge action to execute",
     )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Stay resident and answer JSON-lines requests from stdin",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=SERVE_WORKERS,
+        help="Concurrent requests in --serve mode",
+    )
     args = parser.parse_args()
 
+    if args.serve:
+        if args.action:
+            parser.error("--serve does not take an action")
+        responses = sys.stdout
+        # Keep stray prints from services (yt-dlp progress etc.) off the response stream.
+        sys.stdout = sys.stderr
+        return serve(sys.stdin, responses, workers=args.workers)
+    if not args.action:
+        parser.error("an action is required unless --serve is given")
+
     try:
         payload = _read_payload()
         data = ACTIONS[args.action](payload)
@@ -0,0 +1,64 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# SDKs that must stay out of `import main`; they load on the warm-up thread instead.
+DEFERRED_MODULES = ("google.genai", "yt_dlp", "bs4", "syncedlyrics", "requests")
+
+
+def profile_import(module: str = "main") -> list[tuple[str, int, int]]:
+    """[(name, self_us, cumulative_us)] from `python -X importtime -c "import <module>"`."""
+    env = dict(os.environ)
+    env.setdefault("LYRICVAULT_TESTING", "1")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Header row.
+        entries.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return entries
+
+
+def deferred_modules_loaded(entries: list[tuple[str, int, int]]) -> list[str]:
+    names = {name for name, _self_us, _cumulative_us in entries}
+    return [module for module in DEFERRED_MODULES if module in names]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile backend import time with -X importtime.")
+    parser.add_argument("--module", default="main", help="Module to import (default: main).")
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules to list.")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail when the import takes longer.")
+    args = parser.parse_args()
+
+    entries = profile_import(args.module)
+    total_us = next((cumulative for name, _self, cumulative in entries if name == args.module), 0)
+    deferred = deferred_modules_loaded(entries)
+    slowest = sorted(entries, key=lambda entry: entry[1], reverse=True)[: args.top]
+    print(json.dumps({
+        "module": args.module,
+        "total_ms": round(total_us / 1000, 1),
+        "deferred_modules_loaded": deferred,
+        "slowest_self_ms": [{"module": name, "ms": round(self_us / 1000, 1)} for name, self_us, _ in slowest],
+    }, indent=2))
+
+    if deferred or (args.budget_ms is not None and total_us / 1000 > args.budget_ms):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from utils.lrc_validator import LrcTimeline
+
+# The single-leading-timestamp rule LyricVault used before the tokenizer, kept as a baseline.
+_LEGACY_PATTERN = re.compile(r"^\s*\[(\d+):(\d{2})\.(\d{2,3})\]")
+
+
+def _legacy_validate(text: str, min_lines: int = 5) -> bool:
+    times = []
+    for raw_line in text.strip().splitlines():
+        match = _LEGACY_PATTERN.match(raw_line)
+        if not match:
+            continue
+        if int(match.group(2)) >= 60:
+            return False
+        fraction = match.group(3)
+        fraction_ms = int(fraction) if len(fraction) == 3 else int(fraction) * 10
+        times.append((int(match.group(1)) * 60 + int(match.group(2))) * 1000 + fraction_ms)
+    return len(times) >= min_lines and all(a < b for a, b in zip(times, times[1:]))
+
+
+def _load_corpus_dir(path: str) -> list[str]:
+    texts = []
+    for root, _dirs, files in os.walk(path):
+        for name in sorted(files):
+            if name.lower().endswith(".lrc"):
+                with open(os.path.join(root, name), "r", encoding="utf-8-sig", errors="replace") as f:
+                    texts.append(f.read())
+    return texts
+
+
+def _load_library() -> list[str]:
+    from database.database import SessionLocal
+    from database import models
+
+    db = SessionLocal()
+    try:
+        rows = db.query(models.Song.lyrics).filter(models.Song.lyrics.isnot(None)).all()
+        return [lyrics for (lyrics,) in rows if lyrics and lyrics != "Lyrics not found."]
+    finally:
+        db.close()
+
+
+def _time_per_pass(fn, texts: list[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in texts:
+            fn(text)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the LRC tokenizer against the legacy validator.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--corpus", help="Directory of .lrc files (searched recursively).")
+    source.add_argument("--library", action="store_true", help="Use the lyrics stored in the LyricVault database.")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed passes; the best one is reported.")
+    args = parser.parse_args()
+
+    texts = _load_corpus_dir(args.corpus) if args.corpus else _load_library()
+    if not texts:
+        parser.error("corpus is empty")
+    total_bytes = sum(len(text.encode("utf-8")) for text in texts)
+    megabytes = total_bytes / (1024 * 1024)
+
+    legacy_valid = sum(1 for text in texts if _legacy_validate(text))
+    timelines = [LrcTimeline(text) for text in texts]
+    valid = sum(1 for timeline in timelines if timeline.is_valid())
+    legacy_seconds = _time_per_pass(_legacy_validate, texts, args.repeat)
+    tokenizer_seconds = _time_per_pass(lambda text: LrcTimeline(text).is_valid(), texts, args.repeat)
+
+    print(json.dumps({
+        "files": len(texts),
+        "bytes": total_bytes,
+        "timed_entries": sum(len(timeline) for timeline in timelines),
+        "multi_timestamp_files": sum(1 for timeline in timelines if len(timeline) > len(timeline.line_starts)),
+        "offset_tag_files": sum(1 for timeline in timelines if timeline.offset_ms),
+        "valid_legacy": legacy_valid,
+        "valid_tokenizer": valid,
+        "legacy_ms_per_mb": round(legacy_seconds * 1000 / megabytes, 2) if megabytes else None,
+        "tokenizer_ms_per_mb": round(tokenizer_seconds * 1000 / megabytes, 2) if megabytes else None,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+import hashlib
+import os
+import threading
+import time
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.types import Receive, Scope, Send
+
+
+# Audio streaming with byte-range support for the /stream route.
+# Seeks in the player become small 206 reads instead of full-file re-reads.
+
+CACHE_CONTROL = "private, max-age=3600"
+
+# Throttle last-access bookkeeping: a single playback issues many range requests.
+_ACCESS_RECORD_INTERVAL_SECONDS = 60.0
+_access_lock = threading.Lock()
+_last_recorded: dict[str, float] = {}
+
+
+def resolve_stream_path(downloads_dir: str, relative_path: str) -> str | None:
+    """Resolve a client-supplied path inside downloads_dir; None if it escapes or is missing."""
+    if not relative_path or "\x00" in relative_path:
+        return None
+    root = os.path.realpath(downloads_dir)
+    candidate = os.path.realpath(os.path.join(root, relative_path))
+    try:
+        if os.path.commonpath([root, candidate]) != root or candidate == root:
+            return None
+    except ValueError:
+        # Different drives on Windows.
+        return None
+    if not os.path.isfile(candidate):
+        return None
+    return candidate
+
+
+def strong_etag(stat_result: os.stat_result) -> str:
+    basis = f"{stat_result.st_ino}-{stat_result.st_size}-{stat_result.st_mtime_ns}"
+    return f'"{hashlib.md5(basis.encode(), usedforsecurity=False).hexdigest()}"'
+
+
+def record_access(path: str) -> None:
+    """
+    Stamp the file's atime so cache cleanup can expire by last use instead of
+    download time. mtime is preserved so the ETag stays stable.
+    """
+    now = time.time()
+    with _access_lock:
+        last = _last_recorded.get(path)
+        if last is not None and (now - last) < _ACCESS_RECORD_INTERVAL_SECONDS:
+            return
+        _last_recorded[path] = now
+    try:
+        st = os.stat(path)
+        os.utime(path, ns=(int(now * 1e9), st.st_mtime_ns))
+    except OSError:
+        pass
+
+
+def last_access_timestamp(stat_result: os.stat_result) -> float:
+    """Most recent of download time and recorded playback access."""
+    return max(stat_result.st_mtime, stat_result.st_atime)
+
+
+class AudioStreamResponse(FileResponse):
+    """
+    FileResponse (ranges, If-Range, 416) with the stream route's cache headers,
+    a strong ETag, and 304 answers to a matching If-None-Match.
+    """
+
+    def __init__(self, path: str, stat_result: os.stat_result):
+        super().__init__(
+            path,
+            stat_result=stat_result,
+            headers={"cache-control": CACHE_CONTROL, "etag": strong_etag(stat_result)},
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        etag = self.headers["etag"]
+        if if_none_match and (if_none_match.strip() == "*" or etag in [t.strip() for t in if_none_match.split(",")]):
+            not_modified = Response(
+                status_code=304,
+                headers={key: self.headers[key] for key in ("cache-control", "etag", "last-modified")},
+            )
+            await not_modified(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
@@ -0,0 +1,163 @@
+import math
+import os
+import threading
+import time
+from collections import deque
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Per-provider health tracker.
+
+    - closed: calls pass; N consecutive failures open the circuit.
+    - open: calls are skipped until reset_timeout has elapsed.
+    - half_open: a single probe call is let through; success closes the
+      circuit, failure re-opens it for another reset_timeout.
+
+    Also keeps a window of recent call latencies so callers can size their
+    timeouts from observed p95 instead of a fixed worst case.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failure_threshold: int = 3,
+        reset_timeout: float = 60.0,
+        default_timeout: float = 30.0,
+        min_timeout: float = 5.0,
+        max_timeout: float = 60.0,
+        latency_window: int = 50,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.default_timeout = default_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=latency_window)
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self.last_failure_reason: str | None = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state(time.monotonic())
+
+    def _current_state(self, now: float) -> str:
+        if self._state == OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def allow(self) -> bool:
+        """True if a call may go out now (claims the probe slot when half-open)."""
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def retry_after(self) -> float:
+        """Seconds until the next probe is allowed (0 when closed)."""
+        with self._lock:
+            if self._current_state(time.monotonic()) != OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def record_success(self, latency: float | None = None):
+        with self._lock:
+            if latency is not None:
+                self._latencies.append(latency)
+            self._state = CLOSED
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self, reason: str | None = None, latency: float | None = None):
+        with self._lock:
+            # Timeouts are capped by timeout() itself, so only keep real answers.
+            if latency is not None and latency < self._timeout_locked():
+                self._latencies.append(latency)
+            self.last_failure_reason = reason
+            self._consecutive_failures += 1
+            now = time.monotonic()
+            if self._current_state(now) == HALF_OPEN or self._consecutive_failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = now
+                self._probe_in_flight = False
+
+    @property
+    def sample_count(self) -> int:
+        with self._lock:
+            return len(self._latencies)
+
+    def latency_percentile(self, pct: float) -> float | None:
+        with self._lock:
+            return self._percentile_locked(pct)
+
+    def _percentile_locked(self, pct: float) -> float | None:
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        index = max(0, math.ceil(pct / 100.0 * len(ordered)) - 1)
+        return ordered[index]
+
+    def timeout(self) -> float:
+        """Twice the observed p95 latency, clamped to [min_timeout, max_timeout]."""
+        with self._lock:
+            return self._timeout_locked()
+
+    def _timeout_locked(self) -> float:
+        # Too few samples to trust a percentile; keep the configured default.
+        if len(self._latencies) < 5:
+            return self.default_timeout
+        p95 = self._percentile_locked(95)
+        return min(self.max_timeout, max(self.min_timeout, p95 * 2))
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            state = self._current_state(time.monotonic())
+            p50 = self._percentile_locked(50)
+            p95 = self._percentile_locked(95)
+            return {
+                "state": state,
+                "consecutive_failures": self._consecutive_failures,
+                "last_failure_reason": self.last_failure_reason,
+                "p50_seconds": round(p50, 3) if p50 is not None else None,
+                "p95_seconds": round(p95, 3) if p95 is not None else None,
+                "timeout_seconds": round(self._timeout_locked(), 3),
+            }
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_breaker(name: str, **kwargs) -> CircuitBreaker:
+    """Process-wide breaker for a provider; kwargs only apply on first use."""
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            kwargs.setdefault("failure_threshold", int(os.getenv("LYRICVAULT_BREAKER_FAILURE_THRESHOLD", "3")))
+            kwargs.setdefault("reset_timeout", float(os.getenv("LYRICVAULT_BREAKER_RESET_SECONDS", "60")))
+            breaker = CircuitBreaker(name, **kwargs)
+            _breakers[name] = breaker
+        return breaker
+
+
+def breaker_snapshot() -> dict[str, dict]:
+    with _breakers_lock:
+        breakers = list(_breakers.values())
+    return {breaker.name: breaker.snapshot() for breaker in breakers}
@@ -1,29 +1,132 @@
 import asyncio
+import itertools
 import json
 import os
 import threading
 import time
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+
+class Event(NamedTuple):
+    id: int
+    name: str
+    data: dict
+    # Serialized once and shared by every subscriber and replay.
+    payload: str
 
 
 @dataclass(frozen=True)
+class EventFilter:
+    """
+    Server-side subscription filter. Each given criterion must hold: `topics` matches the
+    event name, `job_ids`/`job_types` constrain job events, and `song_ids` requires the
+    event to reference one of the songs (song_id or song_ids in its data).
+    """
+    topics: frozenset[str] | None = None
+    job_ids: frozenset[int] | None = None
+    song_ids: frozenset[int] | None = None
+    job_types: frozenset[str] | None = None
+
+    def matches(self, name: str, data: dict) -> bool:
+        if self.topics is not None and name not in self.topics:
+            return False
+        if name == "job":
+            if self.job_ids is not None and data.get("id") not in self.job_ids:
+                return False
+            if self.job_types is not None and data.get("type") not in self.job_types:
+                return False
+        if self.song_ids is not None:
+            referenced = data.get("song_ids") or ()
+            if data.get("song_id") is not None:
+                referenced = (*referenced, data["song_id"])
+            if not any(song_id in self.song_ids for song_id in referenced):
+                return False
+        return True
+
+
+@dataclass(eq=False)
 class Subscriber:
-    queue: asyncio.Queue[str]
+    # Each item is one SSE frame: (id of its last event, data).
+    queue: asyncio.Queue[tuple[int, str]]
     loop: asyncio.AbstractEventLoop
+    # Only events matching this are enqueued; None receives everything.
+    filter: EventFilter | None = None
+    # Buffered events the client missed, delivered before anything from the queue.
+    backlog: list[Event] = field(default_factory=list)
+    # False when the requested resume point has already left the replay buffer.
+    replay_complete: bool = True
+    # Id to send with the resync notice, so a reconnect resumes from here instead of
+    # from the expired id (which would ask for a resync again).
+    resync_id: int | None = None
+    # Set when the queue filled up; the stream should end after draining so the
+    # client reconnects with Last-Event-ID instead of silently missing events.
+    overflowed: bool = False
 
 
 _lock = threading.Lock()
+_wake = threading.Condition(_lock)
+# Serializes flushes so batches reach every loop in id order.
+_flush_lock = threading.Lock()
 _subscribers: set[Subscriber] = set()
-_max_subscribers = int(os.getenv("LYRICVAULT_MAX_SSE_SUBSCRIBERS", "4"))
+_max_subscribers = int(os.getenv("LYRICVAULT_MAX_SSE_SUBSCRIBERS", "16"))
+_history: deque[Event] = deque(maxlen=max(1, int(os.getenv("LYRICVAULT_EVENT_BUFFER_SIZE", "500"))))
+# Ids start from the wall clock (ms) so they keep increasing across restarts and a
+# client resuming with an id from a previous process is told to resync.
+_last_id = int(time.time() * 1000)
+# Events published within this window are delivered as one batch, and repeated
+# updates for the same entity inside it collapse to the latest. 0 flushes inline.
+_coalesce_seconds = max(0.0, float(os.getenv("LYRICVAULT_EVENT_COALESCE_MS", "50")) / 1000.0)
+_pending: "OrderedDict[tuple, tuple[str, dict, str]]" = OrderedDict()
+_unkeyed = itertools.count(1)
+# Set by each event that can't be coalesced; job updates only collapse with updates
+# published after the same barrier, so nothing moves across an uncoalesced event.
+_barrier = 0
+_flusher_started = False
+
+
+def last_event_id() -> int:
+    with _lock:
+        return _last_id
 
 
-def subscribe(*, max_queue: int = 200) -> Subscriber:
+def frame(events: list[Event]) -> tuple[int, str]:
+    """One SSE frame for consecutive events: (last id, a single object or a JSON array)."""
+    if len(events) == 1:
+        return events[0].id, events[0].payload
+    return events[-1].id, "[" + ",".join(event.payload for event in events) + "]"
+
+
+def _replay_after(after_id: int, event_filter: EventFilter | None) -> tuple[list[Event], bool]:
+    # Caller holds _lock.
+    first_available = _history[0].id if _history else _last_id + 1
+    if after_id < first_available - 1 or after_id > _last_id:
+        return [], False
+    return [
+        event for event in _history
+        if event.id > after_id and (event_filter is None or event_filter.matches(event.name, event.data))
+    ], True
+
+
+def subscribe(
+    *,
+    max_queue: int = 200,
+    last_event_id: int | None = None,
+    event_filter: EventFilter | None = None,
+) -> Subscriber:
     loop = asyncio.get_running_loop()
-    queue: asyncio.Queue[str] = asyncio.Queue(maxsize=max_queue)
-    sub = Subscriber(queue=queue, loop=loop)
+    queue: asyncio.Queue[tuple[int, str]] = asyncio.Queue(maxsize=max_queue)
+    sub = Subscriber(queue=queue, loop=loop, filter=event_filter)
     with _lock:
         if _max_subscribers > 0 and len(_subscribers) >= _max_subscribers:
             raise RuntimeError("Too many SSE subscribers")
+        # Snapshot the replay and register under the same lock flush() uses, so
+        # every event lands in exactly one of backlog or queue.
+        if last_event_id is not None:
+            sub.backlog, sub.replay_complete = _replay_after(last_event_id, event_filter)
+            if not sub.replay_complete:
+                sub.resync_id = _last_id
         _subscribers.add(sub)
     return sub
 
@@ -33,27 +136,85 @@ def unsubscribe(sub: Subscriber) -> None:
         _subscribers.discard(sub)
 
 
-def _try_put(queue: asyncio.Queue[str], payload: str) -> None:
-    # Drop oldest to make room instead of blocking publisher threads.
-    try:
-        if queue.full():
-            queue.get_nowait()
-    except Exception:
-        pass
-    try:
-        queue.put_nowait(payload)
-    except Exception:
-        pass
+def _deliver(deliveries: list[tuple[Subscriber, tuple[int, str]]]) -> None:
+    # Runs on the subscribers' loop. Never block publisher threads: once a subscriber
+    # falls behind, stop feeding it and let the stream close; the missed events are
+    # replayed on reconnect.
+    for sub, batch in deliveries:
+        if sub.overflowed:
+            continue
+        try:
+            sub.queue.put_nowait(batch)
+        except asyncio.QueueFull:
+            sub.overflowed = True
 
 
-def publish(event: str, data: dict) -> None:
-    """Publish a single event to all active SSE subscribers."""
-    with _lock:
-        subscribers = list(_subscribers)
+def _coalesce_key(event: str, data: dict) -> tuple:
+    # Caller holds _lock. Job updates supersede each other: only the latest state of a
+    # job since the last uncoalesced event matters.
+    global _barrier
+    if event == "job" and data.get("id") is not None:
+        return ("job", data["id"], _barrier)
+    _barrier = next(_unkeyed)
+    return ("", _barrier)
 
-    if not subscribers:
-        return
 
+def flush() -> None:
+    """Number pending events, record them for replay and hand one batch to each loop."""
+    global _last_id
+    with _flush_lock:
+        with _lock:
+            if not _pending:
+                return
+            events = []
+            for name, data, payload in _pending.values():
+                _last_id += 1
+                events.append(Event(_last_id, name, data, payload))
+            _pending.clear()
+            _history.extend(events)
+            subscribers = list(_subscribers)
+
+        if not subscribers:
+            return
+        # Filters are evaluated here, before enqueueing, and each distinct filter's
+        # frame is built once; loops with nothing to deliver are not woken at all.
+        frames: dict[EventFilter | None, tuple[int, str] | None] = {None: frame(events)}
+        by_loop: dict[asyncio.AbstractEventLoop, list[tuple[Subscriber, tuple[int, str]]]] = {}
+        for sub in subscribers:
+            if sub.filter not in frames:
+                matching = [event for event in events if sub.filter.matches(event.name, event.data)]
+                frames[sub.filter] = frame(matching) if matching else None
+            batch = frames[sub.filter]
+            if batch is not None:
+                by_loop.setdefault(sub.loop, []).append((sub, batch))
+        for loop, deliveries in by_loop.items():
+            try:
+                loop.call_soon_threadsafe(_deliver, deliveries)
+            except Exception:
+                # Event loop closed or subscribers already gone.
+                for sub, _batch in deliveries:
+                    try:
+                        unsubscribe(sub)
+                    except Exception:
+                        pass
+
+
+def _flush_loop() -> None:
+    while True:
+        with _wake:
+            while not _pending:
+                _wake.wait()
+        # Let the window fill before delivering.
+        time.sleep(_coalesce_seconds)
+        try:
+            flush()
+        except Exception:
+            pass
+
+
+def publish(event: str, data: dict) -> None:
+    """Queue an event for the next batch delivered to all active SSE subscribers."""
+    global _flusher_started
     payload = json.dumps(
         {
             "event": event,
@@ -63,12 +224,15 @@ def publish(event: str, data: dict) -> None:
         separators=(",", ":"),
     )
 
-    for sub in subscribers:
-        try:
-            sub.loop.call_soon_threadsafe(_try_put, sub.queue, payload)
-        except Exception:
-            # Event loop closed or subscriber already gone.
-            try:
-                unsubscribe(sub)
-            except Exception:
-                pass
+    with _wake:
+        # A replaced update moves to the end, so the batch keeps publish order.
+        key = _coalesce_key(event, data)
+        _pending.pop(key, None)
+        _pending[key] = (event, data, payload)
+        if _coalesce_seconds > 0:
+            if not _flusher_started:
+                _flusher_started = True
+                threading.Thread(target=_flush_loop, daemon=True, name="EventBusFlusher").start()
+            _wake.notify()
+            return
+    flush()
@@ -0,0 +1,48 @@
+import importlib
+import threading
+
+
+class LazyObject:
+    """
+    Stand-in for `module.attr` that imports the module on first attribute access.
+
+    Lets main.py reference service singletons whose modules pull heavy SDKs
+    (google.genai, yt_dlp, bs4, syncedlyrics) without paying for those imports
+    before the server is listening. Attribute reads and writes go to the real
+    object, so monkeypatching through the stand-in patches the singleton.
+    """
+
+    __slots__ = ("_module", "_attr", "_target", "_lock")
+
+    def __init__(self, module: str, attr: str):
+        object.__setattr__(self, "_module", module)
+        object.__setattr__(self, "_attr", attr)
+        object.__setattr__(self, "_target", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    @property
+    def loaded(self) -> bool:
+        return self._target is not None
+
+    def resolve(self):
+        target = self._target
+        if target is None:
+            with self._lock:
+                target = self._target
+                if target is None:
+                    target = getattr(importlib.import_module(self._module), self._attr)
+                    object.__setattr__(self, "_target", target)
+        return target
+
+    def __getattr__(self, name):
+        return getattr(self.resolve(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.resolve(), name, value)
+
+    def __delattr__(self, name):
+        delattr(self.resolve(), name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<LazyObject {self._module}.{self._attr} ({state})>"
@@ -0,0 +1,57 @@
+import re
+
+from .lrc_validator import format_timestamp, parse_lrc
+
+
+def parse_timed_lines(text: str) -> list[tuple[int, str]]:
+    """(milliseconds, lyric) for every line that starts with a well-formed timestamp."""
+    timeline = parse_lrc(text or "")
+    bad = set(timeline.bad_lines)
+    lines = []
+    for index, (ms, lyric) in enumerate(timeline.lines()):
+        if lyric and index not in bad:
+            lines.append((ms, lyric))
+    return lines
+
+
+def _normalize(lyric: str) -> str:
+    return re.sub(r"[^\w]+", " ", lyric.casefold()).strip()
+
+
+def stitch_chunks(chunks: list[tuple[int, str]], overlap_ms: int) -> str:
+    """
+    Merge per-window LRC transcriptions into one LRC.
+
+    chunks is [(window_start_ms, lrc_relative_to_window)] in window order,
+    where consecutive windows overlap by overlap_ms. Each window owns the
+    lines up to the middle of its overlap with the next one; a line repeated
+    on both sides of a seam is kept once. Timestamps are made strictly
+    increasing so the result passes validate_lrc.
+    """
+    half = overlap_ms // 2
+    seams = [start + half for start, _ in chunks[1:]]
+
+    owned: list[tuple[int, str]] = []
+    for index, (start, text) in enumerate(chunks):
+        low = 0 if index == 0 else seams[index - 1]
+        high = seams[index] if index < len(seams) else None
+        for offset, lyric in parse_timed_lines(text):
+            absolute = start + offset
+            if absolute < low or (high is not None and absolute >= high):
+                continue
+            # Work at the centisecond resolution LRC is written in.
+            owned.append((absolute // 10 * 10, lyric))
+    owned.sort(key=lambda line: line[0])
+
+    stitched: list[tuple[int, str]] = []
+    for absolute, lyric in owned:
+        if stitched:
+            prev_ts, prev_lyric = stitched[-1]
+            near_seam = any(abs(absolute - seam) <= overlap_ms for seam in seams)
+            if near_seam and absolute - prev_ts <= overlap_ms and _normalize(lyric) == _normalize(prev_lyric):
+                continue
+            if absolute <= prev_ts:
+                absolute = prev_ts + 10
+        stitched.append((absolute, lyric))
+
+    return "\n".join(f"{format_timestamp(ts)} {lyric}" for ts, lyric in stitched)
@@ -0,0 +1,111 @@
+"""
+Single-pass LRC tokenizer.
+
+Understands the forms found in real-world LRC files:
+- ID tags: [ar:Artist], [ti:Title], [al:], [by:], [length:], [offset:+250] ...
+- one or more leading line timestamps: [00:12.00][01:30.00]Chorus
+- timestamps without or with 1-3 digit fractions: [00:12], [0:12.5], [00:12:345]
+- enhanced (A2) word timings: [00:12.00]<00:12.00>Hello <00:12.40>world
+
+tokenize_lrc() consumes any iterable of lines (a str split with
+keepends=True, or an open file) and yields one token per line, so large
+files never need to be held twice.
+"""
+
+import re
+from typing import Iterable, Iterator, NamedTuple
+
+LINE_STAMP = re.compile(r"\[(\d+):(\d{1,2})(?:[.:](\d{1,3}))?\]")
+WORD_STAMP = re.compile(r"<(\d+):(\d{1,2})(?:[.:](\d{1,3}))?>")
+ID_TAG = re.compile(r"\[([A-Za-z#][\w#]*)\s*:([^\]]*)\]")
+# A line stamp plus surrounding blanks, for walking the leading run in one match per stamp.
+_LEADING_STAMP = re.compile(r"[ \t]*\[(\d+):(\d{1,2})(?:[.:](\d{1,3}))?\][ \t]*")
+
+
+class LrcMeta(NamedTuple):
+    key: str
+    value: str
+
+
+class LrcLine(NamedTuple):
+    # Raw timestamps in ms, in the order written (before any [offset:]).
+    times: tuple[int, ...]
+    # Character offsets into the whole input: line start, lyric start (after
+    # the leading timestamps), and line end (excluding the newline).
+    start: int
+    body_start: int
+    end: int
+    # A timestamp had seconds >= 60.
+    malformed: bool
+
+
+class LrcText(NamedTuple):
+    text: str
+
+
+def stamp_ms(match: re.Match) -> tuple[int, bool]:
+    """(milliseconds, well_formed) for a LINE_STAMP / WORD_STAMP match."""
+    minutes, seconds, fraction = match.group(1), match.group(2), match.group(3)
+    if fraction is None:
+        fraction_ms = 0
+    else:
+        # 1 digit = tenths, 2 = hundredths, 3 = milliseconds.
+        fraction_ms = int(fraction) * (100, 10, 1)[len(fraction) - 1]
+    seconds_value = int(seconds)
+    return (int(minutes) * 60 + seconds_value) * 1000 + fraction_ms, seconds_value < 60
+
+
+def parse_offset(value: str) -> int:
+    """[offset:] value in ms; positive values make lyrics appear earlier."""
+    try:
+        return int(value.strip())
+    except ValueError:
+        return 0
+
+
+def strip_word_stamps(body: str) -> str:
+    return WORD_STAMP.sub("", body).strip()
+
+
+def word_timings(body: str) -> list[tuple[int, str]]:
+    """[(ms, word_or_phrase)] for enhanced-LRC word stamps in a lyric body."""
+    matches = list(WORD_STAMP.finditer(body))
+    words = []
+    for index, match in enumerate(matches):
+        end = matches[index + 1].start() if index + 1 < len(matches) else len(body)
+        word = body[match.end():end].strip()
+        ms, _ = stamp_ms(match)
+        if word:
+            words.append((ms, word))
+    return words
+
+
+def tokenize_lrc(lines: Iterable[str]) -> Iterator[LrcMeta | LrcLine | LrcText]:
+    position = 0
+    for raw_line in lines:
+        start = position
+        position += len(raw_line)
+        line = raw_line.rstrip("\r\n")
+        end = start + len(line)
+
+        cursor = 0
+        times: list[int] = []
+        malformed = False
+        while True:
+            match = _LEADING_STAMP.match(line, cursor)
+            if not match:
+                break
+            ms, ok = stamp_ms(match)
+            times.append(ms)
+            malformed = malformed or not ok
+            cursor = match.end()
+
+        if times:
+            yield LrcLine(tuple(times), start, start + cursor, end, malformed)
+            continue
+
+        tag = ID_TAG.fullmatch(line.strip())
+        if tag:
+            yield LrcMeta(tag.group(1).lower(), tag.group(2).strip())
+        else:
+            yield LrcText(line)
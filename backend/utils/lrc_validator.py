@@ -1,41 +1,194 @@
-import re
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
 
+from .lrc_tokenizer import (
+    LINE_STAMP,
+    WORD_STAMP,
+    LrcLine,
+    LrcMeta,
+    parse_offset,
+    stamp_ms,
+    strip_word_stamps,
+    tokenize_lrc,
+    word_timings,
+)
 
-TIMESTAMP_PATTERN = re.compile(r"^\s*\[(\d+):(\d{2})\.(\d{2,3})\]")
+# Parsed timelines kept per song (see song_timeline).
+SONG_TIMELINE_CACHE_SIZE = 2048
 
+_MAX_MS = 0xFFFFFFFF  # array("I") holds 32-bit unsigned offsets
 
-def validate_lrc(text: str, min_lines: int = 5) -> bool:
+# pack() layout: magic, uint32 line count, count x uint32 ms (all little-endian),
+# then the lyrics as UTF-8 joined by "\n".
+TIMELINE_MAGIC = b"LVT1"
+
+
+class LrcTimeline:
     """
-    Validate LRC text using strict timed-line rules:
-    1. At least min_lines lines start with [mm:ss.xx] or [mm:ss.xxx].
-    2. Every parsed timestamp is strictly increasing in line order.
+    One parse of an LRC text, shared by validation, lookups and shifting.
+
+    Lines with several timestamps ([00:12.00][01:30.00]Chorus) expand into
+    one entry per timestamp, sorted by time, with [offset:] already applied.
+    Entries are stored as parallel unsigned arrays rather than objects:
+    times_ms[i] is the entry's time and entry_lines[i] indexes the per-line
+    columns line_starts / body_starts / line_ends, which are character
+    offsets into text. Lyrics are sliced out (and word stamps removed) only
+    when asked for.
     """
-    if not text or not isinstance(text, str):
-        return False
 
-    timed_seconds: list[float] = []
-    for raw_line in text.strip().splitlines():
-        match = TIMESTAMP_PATTERN.match(raw_line)
-        if not match:
-            continue
+    __slots__ = (
+        "text", "meta", "offset_ms", "times_ms", "entry_lines",
+        "line_starts", "body_starts", "line_ends", "bad_lines", "increasing",
+    )
+
+    def __init__(self, text: str):
+        self.text = text
+        self.meta: dict[str, str] = {}
+        self.line_starts = array("I")
+        self.body_starts = array("I")
+        self.line_ends = array("I")
+        entries: list[tuple[int, int, bool]] = []
+        # Line order rule: each timed line's first timestamp must be later than the previous line's.
+        increasing = True
+        previous_first = -1
+
+        for token in tokenize_lrc(text.splitlines(keepends=True)):
+            if isinstance(token, LrcMeta):
+                self.meta.setdefault(token.key, token.value)
+                continue
+            if not isinstance(token, LrcLine):
+                continue
+            line_index = len(self.line_starts)
+            self.line_starts.append(token.start)
+            self.body_starts.append(token.body_start)
+            self.line_ends.append(token.end)
+            if token.times[0] <= previous_first:
+                increasing = False
+            previous_first = token.times[0]
+            for ms in token.times:
+                entries.append((ms, line_index, token.malformed or ms > _MAX_MS))
+
+        self.offset_ms = parse_offset(self.meta.get("offset", ""))
+        entries.sort(key=lambda entry: entry[0])
+        self.times_ms = array("I", (min(_MAX_MS, max(0, ms - self.offset_ms)) for ms, _, _ in entries))
+        self.entry_lines = array("I", (line for _, line, _ in entries))
+        self.bad_lines = tuple(index for index, entry in enumerate(entries) if entry[2])
+        times = self.times_ms
+        self.increasing = increasing and all(times[i] < times[i + 1] for i in range(len(times) - 1))
+
+    def __len__(self) -> int:
+        return len(self.times_ms)
+
+    def _body(self, index: int) -> str:
+        line = self.entry_lines[index]
+        return self.text[self.body_starts[line]:self.line_ends[line]]
+
+    def lyric(self, index: int) -> str:
+        return strip_word_stamps(self._body(index))
+
+    def words(self, index: int) -> list[tuple[int, str]]:
+        """Enhanced-LRC word timings of an entry, [offset:] applied; [] if the line has none."""
+        return [(max(0, ms - self.offset_ms), word) for ms, word in word_timings(self._body(index))]
+
+    def lines(self):
+        """(milliseconds, lyric) for every entry, in time order."""
+        for index, ms in enumerate(self.times_ms):
+            yield ms, self.lyric(index)
+
+    def is_valid(self, min_lines: int = 5) -> bool:
+        """
+        Strict timed-line rules:
+        1. At least min_lines timed entries ([mm:ss.xx], [mm:ss.xxx], ...).
+        2. Timed lines are in increasing order of their first timestamp, and
+           no two entries share a time.
+        """
+        return not self.bad_lines and len(self.times_ms) >= min_lines and self.increasing
+
+    def index_at(self, position_ms: int) -> int:
+        """Index of the entry active at position_ms (-1 before the first one)."""
+        return bisect_right(self.times_ms, max(0, int(position_ms))) - 1
 
-        minutes = int(match.group(1))
-        seconds = int(match.group(2))
-        fraction_raw = match.group(3)
+    def pack(self) -> bytes:
+        """Compact binary export (see TIMELINE_MAGIC for the layout)."""
+        times = array("I", self.times_ms)
+        if sys.byteorder == "big":
+            times.byteswap()
+        lyrics = "\n".join(self.lyric(i) for i in range(len(times)))
+        return struct.pack("<4sI", TIMELINE_MAGIC, len(times)) + times.tobytes() + lyrics.encode("utf-8")
 
-        if seconds >= 60:
-            return False
+    def shifted(self, offset_ms: int) -> str:
+        """The text with every line and word timestamp moved by offset_ms (clamped at 0)."""
+        if not offset_ms or not self.line_starts:
+            return self.text
 
-        # 2-digit fractions are centiseconds; normalize to milliseconds.
-        fraction_ms = int(fraction_raw) if len(fraction_raw) == 3 else int(fraction_raw) * 10
-        total_seconds = (minutes * 60) + seconds + (fraction_ms / 1000.0)
-        timed_seconds.append(total_seconds)
+        def shift_line_stamp(match):
+            return format_timestamp(stamp_ms(match)[0] + offset_ms)
 
-    if len(timed_seconds) < min_lines:
+        def shift_word_stamp(match):
+            return "<" + format_timestamp(stamp_ms(match)[0] + offset_ms)[1:-1] + ">"
+
+        parts = []
+        cursor = 0
+        for start, body_start, end in zip(self.line_starts, self.body_starts, self.line_ends):
+            parts.append(self.text[cursor:start])
+            parts.append(LINE_STAMP.sub(shift_line_stamp, self.text[start:body_start]))
+            parts.append(WORD_STAMP.sub(shift_word_stamp, self.text[body_start:end]))
+            cursor = end
+        parts.append(self.text[cursor:])
+        return "".join(parts)
+
+
+@lru_cache(maxsize=256)
+def parse_lrc(text: str) -> LrcTimeline:
+    """Parse LRC text; repeated calls with the same text share one parse."""
+    return LrcTimeline(text)
+
+
+_song_timelines: "OrderedDict[int, LrcTimeline]" = OrderedDict()
+_song_timelines_lock = threading.Lock()
+
+
+def song_timeline(song_id: int, text: str) -> LrcTimeline:
+    """
+    Timeline for a song's current lyrics. Entries are replaced as soon as
+    the song's lyric text differs from the cached parse.
+    """
+    with _song_timelines_lock:
+        cached = _song_timelines.get(song_id)
+        if cached is not None and (cached.text is text or cached.text == text):
+            _song_timelines.move_to_end(song_id)
+            return cached
+    timeline = parse_lrc(text or "")
+    with _song_timelines_lock:
+        _song_timelines[song_id] = timeline
+        _song_timelines.move_to_end(song_id)
+        while len(_song_timelines) > SONG_TIMELINE_CACHE_SIZE:
+            _song_timelines.popitem(last=False)
+    return timeline
+
+
+def validate_lrc(text: str, min_lines: int = 5) -> bool:
+    """Validate LRC text using strict timed-line rules (see LrcTimeline.is_valid)."""
+    if not text or not isinstance(text, str):
         return False
+    return parse_lrc(text).is_valid(min_lines)
+
+
+def format_timestamp(total_ms: int) -> str:
+    """Milliseconds -> [mm:ss.xx]."""
+    total_ms = max(0, int(total_ms))
+    minutes, rem = divmod(total_ms, 60_000)
+    seconds, ms = divmod(rem, 1000)
+    return f"[{minutes:02d}:{seconds:02d}.{ms // 10:02d}]"
 
-    for prev, current in zip(timed_seconds, timed_seconds[1:]):
-        if current <= prev:
-            return False
 
-    return True
+def shift_lrc(text: str, offset_ms: int) -> str:
+    """Shift every line and word timestamp by offset_ms (clamped at 0); other lines are untouched."""
+    if not text or not offset_ms:
+        return text
+    return parse_lrc(text).shifted(offset_ms)
@@ -1,19 +1,39 @@
+import json
+import logging
+import os
+import tempfile
 import threading
 import time
 
+logger = logging.getLogger(__name__)
+
+_DAY_SECONDS = 86400
+
 
 class TokenBucket:
     """
     Minimal in-memory token bucket rate limiter.
 
     Desktop/local backend note: this is best-effort abuse resistance, not a security boundary.
-    It resets when the process restarts and does not coordinate across processes.
+    It resets when the process restarts and does not coordinate across processes,
+    unless a state_path is given, in which case bucket levels and daily counters
+    are written there after every reservation and reloaded on construction.
+
+    allow() is the fail-fast check used for request throttling. reserve() is for
+    outbound quotas: it queues the caller behind earlier reservations and
+    reports how long to wait, optionally under a per-UTC-day request cap.
     """
 
-    def __init__(self):
+    def __init__(self, state_path: str | None = None):
         self._lock = threading.Lock()
         # key -> (tokens, last_refill_monotonic)
         self._state: dict[str, tuple[float, float]] = {}
+        # key -> {utc_day_index: count}; reservations can land in a later day
+        # than the one they were made in, so days from today on are kept.
+        self._daily: dict[str, dict[int, float]] = {}
+        self._state_path = state_path
+        if state_path:
+            self._load()
 
     def allow(self, key: str, *, capacity: int, refill_per_sec: float, cost: float = 1.0) -> bool:
         now = time.monotonic()
@@ -28,3 +48,128 @@ class TokenBucket:
             self._state[key] = (tokens, now)
             return True
 
+    @staticmethod
+    def _utc_day(wall: float) -> int:
+        return int(wall // _DAY_SECONDS)
+
+    def _wait_locked(self, key: str, now: float, wall: float, *, capacity: int, refill_per_sec: float, cost: float, daily_limit: float | None) -> tuple[float, float]:
+        """(seconds until cost tokens are available, refilled token level)."""
+        tokens, last = self._state.get(key, (float(capacity), now))
+        tokens = min(float(capacity), tokens + max(0.0, now - last) * refill_per_sec)
+        wait = 0.0 if tokens >= cost else (cost - tokens) / refill_per_sec
+
+        if daily_limit is not None:
+            counts = self._daily.get(key, {})
+            day = self._utc_day(wall + wait)
+            while counts.get(day, 0.0) + cost > daily_limit:
+                day += 1
+                wait = max(wait, day * _DAY_SECONDS - wall)
+        return wait, tokens
+
+    def _prune_daily_locked(self, wall: float):
+        today = self._utc_day(wall)
+        for key, counts in list(self._daily.items()):
+            counts = {day: count for day, count in counts.items() if day >= today}
+            if counts:
+                self._daily[key] = counts
+            else:
+                del self._daily[key]
+
+    def estimate_wait(self, key: str, *, capacity: int, refill_per_sec: float, cost: float = 1.0, daily_limit: float | None = None) -> float:
+        """Seconds a reserve() issued now would have to wait. Consumes nothing."""
+        with self._lock:
+            wait, _ = self._wait_locked(
+                key, time.monotonic(), time.time(),
+                capacity=capacity, refill_per_sec=refill_per_sec, cost=cost, daily_limit=daily_limit,
+            )
+            return wait
+
+    def reserve(
+        self,
+        key: str,
+        *,
+        capacity: int,
+        refill_per_sec: float,
+        cost: float = 1.0,
+        daily_limit: float | None = None,
+        max_wait: float | None = None,
+    ) -> tuple[bool, float]:
+        """
+        Claim cost tokens, letting the bucket go into debt so later callers
+        queue behind this one.
+
+        Returns (reserved, wait_seconds). When reserved, the caller should
+        sleep wait_seconds before using its slot. When the wait would exceed
+        max_wait nothing is consumed and wait_seconds is the expected wait.
+        """
+        now = time.monotonic()
+        wall = time.time()
+        with self._lock:
+            wait, tokens = self._wait_locked(
+                key, now, wall,
+                capacity=capacity, refill_per_sec=refill_per_sec, cost=cost, daily_limit=daily_limit,
+            )
+            if max_wait is not None and wait > max_wait:
+                return False, wait
+
+            self._state[key] = (tokens - cost, now)
+            if daily_limit is not None:
+                slot_day = self._utc_day(wall + wait)
+                counts = self._daily.setdefault(key, {})
+                counts[slot_day] = counts.get(slot_day, 0.0) + cost
+                self._prune_daily_locked(wall)
+            self._save_locked(now, wall)
+            return True, wait
+
+    def drain(self, key: str):
+        """Empty a bucket, e.g. after the remote side reported a rate limit anyway."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, _ = self._state.get(key, (0.0, now))
+            self._state[key] = (min(tokens, 0.0), now)
+            self._save_locked(now, time.time())
+
+    def daily_count(self, key: str) -> float:
+        with self._lock:
+            return self._daily.get(key, {}).get(self._utc_day(time.time()), 0.0)
+
+    def _load(self):
+        try:
+            with open(self._state_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning("Ignoring unreadable rate limiter state %s: %s", self._state_path, e)
+            return
+
+        now = time.monotonic()
+        wall = time.time()
+        # Persisted with wall-clock timestamps; monotonic clocks don't survive restarts.
+        for key, (tokens, saved_wall) in (data.get("buckets") or {}).items():
+            self._state[key] = (float(tokens), now - max(0.0, wall - float(saved_wall)))
+        for key, counts in (data.get("daily") or {}).items():
+            if isinstance(counts, list):  # Older files kept a single [day, count] pair.
+                counts = {counts[0]: counts[1]}
+            self._daily[key] = {int(day): float(count) for day, count in counts.items()}
+        self._prune_daily_locked(wall)
+
+    def _save_locked(self, now: float, wall: float):
+        if not self._state_path:
+            return
+        data = {
+            "buckets": {key: [tokens, wall - (now - last)] for key, (tokens, last) in self._state.items()},
+            "daily": {key: {str(day): count for day, count in counts.items()} for key, counts in self._daily.items()},
+        }
+        directory = os.path.dirname(self._state_path) or "."
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".ratelimit-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self._state_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning("Failed to persist rate limiter state: %s", e)
@@ -0,0 +1,73 @@
+import threading
+import time
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+# Phases in startup order. Only the first three gate readiness; maintenance (stale
+# job requeue, legacy lyric scan) keeps running in the worker after the app is ready.
+PHASES = ("database", "services", "worker", "maintenance")
+REQUIRED_PHASES = ("database", "services", "worker")
+
+
+class Readiness:
+    """Startup phase tracker behind /health/ready; safe to update from any thread."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._phases = {name: {"status": PENDING} for name in PHASES}
+        # True while startup runs in the background and requests may arrive first.
+        self.deferred = False
+
+    def begin(self, name: str, **detail) -> None:
+        with self._lock:
+            self._phases[name] = {"status": RUNNING, "started_at": time.monotonic(), **detail}
+
+    def update(self, name: str, **detail) -> None:
+        with self._lock:
+            self._phases[name].update(detail)
+
+    def done(self, name: str, **detail) -> None:
+        self._finish(name, DONE, detail)
+
+    def skip(self, name: str) -> None:
+        self._finish(name, SKIPPED, {})
+
+    def fail(self, name: str, error: Exception) -> None:
+        self._finish(name, FAILED, {"error": str(error)})
+
+    def _finish(self, name: str, status: str, detail: dict) -> None:
+        with self._lock:
+            phase = self._phases[name]
+            started_at = phase.get("started_at")
+            phase.update(detail, status=status)
+            if started_at is not None:
+                phase["seconds"] = round(time.monotonic() - started_at, 3)
+
+    def status(self, name: str) -> str:
+        with self._lock:
+            return self._phases[name]["status"]
+
+    def database_blocked(self) -> bool:
+        """True while a deferred startup has not finished migrating the database."""
+        return self.deferred and self.status("database") != DONE
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            phases = [
+                {"name": name, **{key: value for key, value in phase.items() if key != "started_at"}}
+                for name, phase in self._phases.items()
+            ]
+        ready = all(phase["status"] in (DONE, SKIPPED) for phase in phases if phase["name"] in REQUIRED_PHASES)
+        return {"ready": ready, "phases": phases}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._phases = {name: {"status": PENDING} for name in PHASES}
+            self.deferred = False
+
+
+readiness = Readiness()
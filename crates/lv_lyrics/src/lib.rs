@@ -63,6 +63,7 @@ pub fn research_lyrics(
         "file_path": song.file_path,
         "mode": request.mode,
         "model_id": request.model_id,
+        "refresh": true,
     });
     let bridge_result = invoke_bridge("research_lyrics", payload)?;
     let data = bridge_result
@@ -126,6 +126,19 @@ export default function App() {
     return song;
   };
 
+  // Fire-and-forget: lets the backend prefetch expired songs that are up next.
+  const reportNowPlaying = (song) => {
+    if (!song?.id) return;
+    fetch(`${API_BASE}/playback/now-playing`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({
+        song_id: song.id,
+        queue: queue.map(item => item.id).filter(Boolean).slice(0, 200),
+      }),
+    }).catch(error => console.error('Failed to report now playing:', error));
+  };
+
   const handlePlaySong = async (song, options = {}) => {
     const { addCurrentToHistory = true } = options;
     const previousSong = currentSong;
@@ -143,6 +156,8 @@ export default function App() {
       setPlaybackHistory(prev => [...prev, previousSong].slice(-100));
     }
 
+    reportNowPlaying(fullSong);
+
     if (fullSong.status === 'cached' && fullSong.stream_url) {
       clearRehydrating(fullSong.id);
       setCurrentSong(fullSong);
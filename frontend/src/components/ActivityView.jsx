@@ -44,7 +44,7 @@ const ActivityView = ({ onViewSong, onTabChange }) => {
         const onEvent = (e) => {
             const msg = e?.detail;
             if (!msg || typeof msg !== 'object') return;
-            if (msg.event === 'job' || msg.event === 'song') scheduleFetch();
+            if (msg.event === 'job' || msg.event === 'song' || msg.event === 'resync') scheduleFetch();
         };
 
         window.addEventListener('lyricvault:event', onEvent);
@@ -36,7 +36,7 @@ const LibraryGrid = ({ refreshTrigger, rehydratingSongIds = [], onPlay, onQueueN
         const onEvent = (e) => {
             const msg = e?.detail;
             if (!msg || typeof msg !== 'object') return;
-            if (msg.event === 'job' || msg.event === 'song') {
+            if (msg.event === 'job' || msg.event === 'song' || msg.event === 'resync') {
                 scheduleFetch();
             }
         };
@@ -36,7 +36,7 @@ const ProcessingView = () => {
         const onEvent = (e) => {
             const msg = e?.detail;
             if (!msg || typeof msg !== 'object') return;
-            if (msg.event === 'job') scheduleFetch();
+            if (msg.event === 'job' || msg.event === 'resync') scheduleFetch();
         };
         window.addEventListener('lyricvault:event', onEvent);
         return () => {
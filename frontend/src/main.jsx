@@ -27,8 +27,11 @@ if (apiToken) {
 
   es.onmessage = (e) => {
     try {
-      const msg = JSON.parse(e.data)
-      window.dispatchEvent(new CustomEvent('lyricvault:event', { detail: msg }))
+      const parsed = JSON.parse(e.data)
+      // Events published close together arrive batched as an array.
+      for (const msg of Array.isArray(parsed) ? parsed : [parsed]) {
+        window.dispatchEvent(new CustomEvent('lyricvault:event', { detail: msg }))
+      }
     } catch {
       // Ignore malformed payloads.
     }